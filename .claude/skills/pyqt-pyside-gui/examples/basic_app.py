@@ -6,25 +6,70 @@ A minimal but complete application structure demonstrating:
 - Signal/slot connections
 - Layout management
 - Menu and toolbar setup
+- Non-blocking file I/O with QtAsyncio coroutines
+
+Run with --gpu to render the output area through an OpenGL viewport.
 """
 
 import sys
+import asyncio
+import functools
+from pathlib import Path
 from PySide6.QtWidgets import (
     QApplication, QMainWindow, QWidget, QVBoxLayout, QHBoxLayout,
     QPushButton, QLabel, QLineEdit, QTextEdit, QMenuBar, QToolBar,
-    QStatusBar, QMessageBox
+    QStatusBar, QMessageBox, QFileDialog
 )
-from PySide6.QtCore import Qt, Signal, Slot
-from PySide6.QtGui import QAction, QIcon
+from PySide6.QtCore import Qt, Signal, Slot, QTimer
+from PySide6.QtGui import QAction, QIcon, QTextCursor, QFont
+from PySide6 import QtAsyncio
+
+# Import the component library (ui_components/ sits next to examples/)
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+from ui_components import use_gpu_viewport
+
+
+# Application-wide style sheet, parsed once in main()
+APP_STYLE_SHEET = """
+    QLabel#TitleLabel {
+        font-size: 18px;
+        font-weight: bold;
+        padding: 10px;
+    }
+"""
+
+
+MSG_PROCESSED = "Processed: "
+
+# Exit confirmation buttons, combined once
+YES_NO = QMessageBox.Yes | QMessageBox.No
+
+
+@functools.lru_cache(maxsize=256)
+def _fmt_processed(text):
+    """Format a processed-input message (cached for repeated input)"""
+    return MSG_PROCESSED + text
 
 
 class MainWindow(QMainWindow):
     """Main application window with proper structure"""
     
-    def __init__(self):
+    def __init__(self, use_gpu=False):
         super().__init__()
+        self.use_gpu = use_gpu
+        # Running file tasks; the event loop only keeps weak references
+        self._tasks = set()
         self.setup_ui()
+        self.create_message_boxes()
         self.create_actions()
+        
+        # Build menus/toolbar/status bar on the first event-loop tick so
+        # the window can paint immediately
+        QTimer.singleShot(0, self._build_chrome)
+        
+    @Slot()
+    def _build_chrome(self):
+        """Create deferred window chrome"""
         self.create_menus()
         self.create_toolbar()
         self.create_statusbar()
@@ -44,7 +89,7 @@ class MainWindow(QMainWindow):
         # Title
         title = QLabel("Welcome to PySide6")
         title.setAlignment(Qt.AlignCenter)
-        title.setStyleSheet("font-size: 18px; font-weight: bold; padding: 10px;")
+        title.setObjectName("TitleLabel")
         main_layout.addWidget(title)
         
         # Input section
@@ -70,9 +115,58 @@ class MainWindow(QMainWindow):
         # Output section
         self.output_area = QTextEdit()
         self.output_area.setReadOnly(True)
+        # Axis-aligned log text: skip antialiasing to cut glyph fill cost
+        log_font = QFont("Monospace")
+        log_font.setStyleHint(QFont.Monospace)
+        log_font.setStyleStrategy(QFont.NoAntialias | QFont.PreferBitmap)
+        self.output_area.setFont(log_font)
         main_layout.addWidget(QLabel("Output:"))
         main_layout.addWidget(self.output_area)
         
+        # Coalesce output lines into one document edit per frame
+        self._output_cursor = QTextCursor(self.output_area.document())
+        self._pending_output = []
+        self._flush_timer = QTimer(self)
+        self._flush_timer.setSingleShot(True)
+        self._flush_timer.setInterval(16)
+        self._flush_timer.timeout.connect(self._flush_output)
+        
+        if self.use_gpu and not use_gpu_viewport(self.output_area):
+            self.use_gpu = False
+            self.append_output("OpenGL is not available, using the raster viewport")
+        
+    def create_message_boxes(self):
+        """Create message boxes once and reuse them"""
+        self._warning_box = QMessageBox(
+            QMessageBox.Warning,
+            "Warning",
+            "Please enter some text",
+            QMessageBox.Ok,
+            self
+        )
+        
+        self._about_box = QMessageBox(
+            QMessageBox.NoIcon,
+            "About Application",
+            "PySide6 Basic Application Template\n\n"
+            "A minimal example demonstrating:\n"
+            "• Proper application structure\n"
+            "• Signal/slot connections\n"
+            "• Layout management\n"
+            "• Menus and toolbars",
+            QMessageBox.Ok,
+            self
+        )
+        
+        self._exit_box = QMessageBox(
+            QMessageBox.Question,
+            "Confirm Exit",
+            "Are you sure you want to exit?",
+            YES_NO,
+            self
+        )
+        self._exit_box.setDefaultButton(QMessageBox.No)
+        
     def create_actions(self):
         """Create actions for menus and toolbars"""
         self.new_action = QAction("&New", self)
@@ -99,6 +193,12 @@ class MainWindow(QMainWindow):
         self.about_action.setStatusTip("About this application")
         self.about_action.triggered.connect(self.show_about)
         
+        # Register on the window so shortcuts work before menus exist
+        self.addActions([
+            self.new_action, self.open_action, self.save_action,
+            self.exit_action, self.about_action
+        ])
+        
     def create_menus(self):
         """Create menu bar"""
         menubar = self.menuBar()
@@ -132,14 +232,39 @@ class MainWindow(QMainWindow):
         """Process user input"""
         text = self.input_field.text()
         if text:
-            self.output_area.append(f"Processed: {text}")
-            self.statusBar().showMessage(f"Processed: {text}", 3000)
+            message = _fmt_processed(text)
+            self.append_output(message)
+            self.statusBar().showMessage(message, 3000)
         else:
-            QMessageBox.warning(self, "Warning", "Please enter some text")
+            # The box is shared with file errors, so restore its message
+            self._warning_box.setWindowTitle("Warning")
+            self._warning_box.setText("Please enter some text")
+            self._warning_box.exec()
             
+    def append_output(self, text):
+        """Queue a line for the output area"""
+        self._pending_output.append(text)
+        if not self._flush_timer.isActive():
+            self._flush_timer.start()
+            
+    @Slot()
+    def _flush_output(self):
+        """Write all queued lines in a single insert"""
+        if not self._pending_output:
+            return
+        text = "\n".join(self._pending_output)
+        self._pending_output.clear()
+        if not self.output_area.document().isEmpty():
+            text = "\n" + text
+        self._output_cursor.movePosition(QTextCursor.End)
+        self._output_cursor.insertText(text)
+        scrollbar = self.output_area.verticalScrollBar()
+        scrollbar.setValue(scrollbar.maximum())
+        
     @Slot()
     def clear_output(self):
         """Clear output area"""
+        self._pending_output.clear()
         self.output_area.clear()
         self.input_field.clear()
         self.statusBar().showMessage("Cleared", 2000)
@@ -149,39 +274,87 @@ class MainWindow(QMainWindow):
         """Create new file"""
         self.statusBar().showMessage("New file created", 2000)
         
+    def _start_task(self, coro):
+        """Run a coroutine on the event loop, keeping it alive until done"""
+        task = asyncio.ensure_future(coro)
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+        
+    def _report_file_error(self, title, error):
+        """Show a failed file operation to the user"""
+        self.statusBar().showMessage(title, 5000)
+        self._warning_box.setWindowTitle(title)
+        self._warning_box.setText(str(error))
+        self._warning_box.exec()
+        
     @Slot()
     def open_file(self):
         """Open file"""
-        self.statusBar().showMessage("Open file", 2000)
+        self._start_task(self.open_file_async())
+        
+    async def open_file_async(self):
+        """Read the chosen files without blocking the event loop"""
+        filenames, _ = QFileDialog.getOpenFileNames(self, "Open Files")
+        if not filenames:
+            return
+        
+        # Submit all reads at once instead of one blocking open() per file;
+        # one unreadable file must not discard the others
+        results = await asyncio.gather(*(
+            asyncio.to_thread(Path(filename).read_text, encoding="utf-8")
+            for filename in filenames
+        ), return_exceptions=True)
+        
+        texts = []
+        failed = []
+        for filename, result in zip(filenames, results):
+            if isinstance(result, (OSError, UnicodeDecodeError)):
+                failed.append(f"{filename}: {result}")
+            elif isinstance(result, BaseException):
+                raise result
+            else:
+                texts.append(result)
+        
+        if texts:
+            # Queued lines would otherwise be appended after the loaded text
+            self._flush_timer.stop()
+            self._pending_output.clear()
+            self.output_area.setPlainText("\n".join(texts))
+        if failed:
+            self._report_file_error(
+                f"Could not open {len(failed)} of {len(filenames)} file(s)",
+                "\n".join(failed)
+            )
+        else:
+            self.statusBar().showMessage(f"Opened {len(filenames)} file(s)", 2000)
         
     @Slot()
     def save_file(self):
         """Save file"""
+        self._start_task(self.save_file_async())
+        
+    async def save_file_async(self):
+        """Write the output area without blocking the event loop"""
+        filename, _ = QFileDialog.getSaveFileName(self, "Save File")
+        if not filename:
+            return
+        
+        text = self.output_area.toPlainText()
+        try:
+            await asyncio.to_thread(Path(filename).write_text, text, encoding="utf-8")
+        except OSError as e:
+            self._report_file_error("Could not save file", e)
+            return
         self.statusBar().showMessage("File saved", 2000)
         
     @Slot()
     def show_about(self):
         """Show about dialog"""
-        QMessageBox.about(
-            self,
-            "About Application",
-            "PySide6 Basic Application Template\n\n"
-            "A minimal example demonstrating:\n"
-            "• Proper application structure\n"
-            "• Signal/slot connections\n"
-            "• Layout management\n"
-            "• Menus and toolbars"
-        )
+        self._about_box.exec()
         
     def closeEvent(self, event):
         """Handle application close event"""
-        reply = QMessageBox.question(
-            self,
-            "Confirm Exit",
-            "Are you sure you want to exit?",
-            QMessageBox.Yes | QMessageBox.No,
-            QMessageBox.No
-        )
+        reply = self._exit_box.exec()
         
         if reply == QMessageBox.Yes:
             # Perform cleanup here if needed
@@ -193,17 +366,18 @@ class MainWindow(QMainWindow):
 def main():
     """Application entry point"""
     app = QApplication(sys.argv)
+    app.setStyleSheet(APP_STYLE_SHEET)
     
     # Set application properties
     app.setApplicationName("PySide6 Basic App")
     app.setOrganizationName("Your Organization")
     
     # Create and show main window
-    window = MainWindow()
+    window = MainWindow(use_gpu="--gpu" in sys.argv)
     window.show()
     
-    # Start event loop
-    sys.exit(app.exec())
+    # Start asyncio-compatible event loop
+    QtAsyncio.run(handle_sigint=True)
 
 
 if __name__ == "__main__":
@@ -9,17 +9,31 @@ Run with hot reload:
 """
 
 import sys
+from pathlib import Path
 from PySide6.QtWidgets import QApplication, QMainWindow, QWidget, QVBoxLayout, QMessageBox
-from PySide6.QtCore import Qt
+from PySide6.QtCore import Qt, Signal, Slot, QRegularExpression, QMargins
+from PySide6.QtGui import QRegularExpressionValidator
 
-# Import the component library
-sys.path.insert(0, '/home/claude/pyqt-pyside-gui/scripts')
-from ui_components import *
+# Import the component library (ui_components/ sits next to examples/)
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+from ui_components import (
+    load_theme, Label, Card, FormField, ButtonGroup, ButtonVariant, Spacing
+)
+
+
+# Input rules enforced by Qt validators on the line edits
+EMAIL_REGEX = QRegularExpression(r"[^@\s]+@[^@\s]+\.[^@\s]+")
+PASSWORD_REGEX = QRegularExpression(r".{8,}")
+
+# Window margins, built once
+LARGE_MARGINS = QMargins(Spacing.LARGE, Spacing.LARGE, Spacing.LARGE, Spacing.LARGE)
 
 
 class MainWindow(QMainWindow):
     """Example application using component library"""
     
+    cleared = Signal()
+    
     def __init__(self):
         super().__init__()
         self.setWindowTitle("Component Library Example")
@@ -34,10 +48,7 @@ class MainWindow(QMainWindow):
         
         main_layout = QVBoxLayout(central)
         main_layout.setSpacing(Spacing.LARGE)
-        main_layout.setContentsMargins(
-            Spacing.LARGE, Spacing.LARGE, 
-            Spacing.LARGE, Spacing.LARGE
-        )
+        main_layout.setContentsMargins(LARGE_MARGINS)
         
         # Header
         title = Label("User Registration", variant="title", alignment=Qt.AlignCenter)
@@ -64,7 +75,8 @@ class MainWindow(QMainWindow):
             "Email Address",
             placeholder="john@example.com",
             required=True,
-            validator=self.validate_email,
+            input_validator=QRegularExpressionValidator(EMAIL_REGEX),
+            input_error="Please enter a valid email address",
             help_text="We'll never share your email with anyone"
         )
         user_card.add_component(self.email_field)
@@ -93,7 +105,8 @@ class MainWindow(QMainWindow):
             input_type="password",
             placeholder="Enter strong password",
             required=True,
-            validator=self.validate_password,
+            input_validator=QRegularExpressionValidator(PASSWORD_REGEX),
+            input_error="Password must be at least 8 characters",
             help_text="At least 8 characters"
         )
         account_card.add_component(self.password_field)
@@ -120,6 +133,16 @@ class MainWindow(QMainWindow):
         
         main_layout.addWidget(bio_card.get_widget())
         
+        self._all_fields = [
+            self.name_field,
+            self.email_field,
+            self.phone_field,
+            self.username_field,
+            self.password_field,
+            self.confirm_password_field,
+            self.bio_field
+        ]
+        
         main_layout.addStretch()
         
         # Button Group
@@ -140,18 +163,7 @@ class MainWindow(QMainWindow):
         
         main_layout.addWidget(buttons.get_widget())
     
-    def validate_email(self, email):
-        """Email validator"""
-        if "@" not in email or "." not in email:
-            return False, "Please enter a valid email address"
-        return True, ""
-    
-    def validate_password(self, password):
-        """Password validator"""
-        if len(password) < 8:
-            return False, "Password must be at least 8 characters"
-        return True, ""
-    
+    @Slot()
     def on_register(self):
         """Handle registration"""
         # Validate all fields
@@ -163,12 +175,14 @@ class MainWindow(QMainWindow):
             self.confirm_password_field
         ]
         
-        is_valid = True
-        for field in fields:
-            if not field.validate():
-                is_valid = False
+        # Validate every field (no short-circuit) with a single repaint
+        self.setUpdatesEnabled(False)
+        try:
+            results = [field.validate() for field in fields]
+        finally:
+            self.setUpdatesEnabled(True)
         
-        if not is_valid:
+        if not all(results):
             QMessageBox.warning(
                 self,
                 "Validation Error",
@@ -205,15 +219,13 @@ class MainWindow(QMainWindow):
         
         print("Registration data:", data)
     
+    @Slot()
     def on_clear(self):
         """Clear all fields"""
-        self.name_field.set_value("")
-        self.email_field.set_value("")
-        self.phone_field.set_value("")
-        self.username_field.set_value("")
-        self.password_field.set_value("")
-        self.confirm_password_field.set_value("")
-        self.bio_field.set_value("")
+        # Skip per-field validation; emit one signal for the whole form
+        for field in self._all_fields:
+            field.set_value("", validate=False)
+        self.cleared.emit()
 
 
 def main():
@@ -221,7 +233,7 @@ def main():
     app = QApplication(sys.argv)
     
     # Apply global theme
-    apply_theme_to_app(app)
+    load_theme(app, "default")
     
     # Create and show window
     window = MainWindow()
@@ -7,16 +7,80 @@ Demonstrates various dialog types:
 - File dialogs
 - Message boxes
 - Modal and non-modal dialogs
+
+Run with --gpu to render the results area through an OpenGL viewport.
 """
 
 import sys
+from pathlib import Path
 from PySide6.QtWidgets import (
     QApplication, QMainWindow, QWidget, QVBoxLayout, QHBoxLayout,
     QPushButton, QDialog, QDialogButtonBox, QLabel, QLineEdit,
     QTextEdit, QFormLayout, QFileDialog, QMessageBox, QInputDialog,
-    QComboBox, QSpinBox, QCheckBox
+    QComboBox, QSpinBox, QCheckBox, QStackedWidget, QTabBar
 )
-from PySide6.QtCore import Qt
+from PySide6.QtCore import Qt, Slot, QTimer
+from PySide6.QtGui import QTextCursor, QFont
+
+# Import the component library (ui_components/ sits next to examples/)
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+from ui_components import use_gpu_viewport
+
+
+# Application-wide style sheet, parsed once in main()
+APP_STYLE_SHEET = """
+    QLabel#TitleLabel {
+        font-size: 16px;
+        font-weight: bold;
+        padding: 10px;
+    }
+"""
+
+
+# Demo sections: (tab label, layout class, [(button text, command)])
+BUTTON_SECTIONS = [
+    ("Custom Dialogs", QVBoxLayout, [
+        ("Show Custom Dialog", "custom"),
+        ("Show Progress Dialog", "progress"),
+    ]),
+    ("Standard Dialogs", QVBoxLayout, [
+        ("File Open Dialog", "file"),
+        ("File Save Dialog", "save"),
+        ("Directory Dialog", "directory"),
+    ]),
+    ("Message Boxes", QHBoxLayout, [
+        ("Information", "info"),
+        ("Warning", "warning"),
+        ("Error", "error"),
+        ("Question", "question"),
+    ]),
+    ("Input Dialogs", QHBoxLayout, [
+        ("Text Input", "text"),
+        ("Integer Input", "int"),
+        ("Item Selection", "item"),
+    ]),
+]
+
+
+# Fixed log messages, built once
+MSG_CUSTOM_CANCELLED = "Custom dialog cancelled"
+MSG_PROGRESS_DONE = "Progress dialog finished"
+MSG_PROGRESS_CANCELLED = "Progress dialog cancelled"
+MSG_INFO_SHOWN = "Showed information message"
+MSG_WARNING_SHOWN = "Showed warning message"
+MSG_ERROR_SHOWN = "Showed error message"
+MSG_CLICKED_YES = "User clicked Yes"
+MSG_CLICKED_NO = "User clicked No"
+MSG_CLICKED_CANCEL = "User clicked Cancel"
+
+# Prefixes for messages with a variable part (joined by concatenation)
+MSG_CUSTOM_DATA = "Custom dialog data: "
+MSG_SELECTED_FILE = "Selected file: "
+MSG_SAVE_TO = "Save to: "
+MSG_SELECTED_DIRECTORY = "Selected directory: "
+MSG_ENTERED_TEXT = "Entered text: "
+MSG_ENTERED_NUMBER = "Entered number: "
+MSG_SELECTED_ITEM = "Selected item: "
 
 
 class CustomDialog(QDialog):
@@ -73,6 +137,15 @@ class CustomDialog(QDialog):
         button_box.rejected.connect(self.reject)
         layout.addWidget(button_box)
         
+    def reset(self):
+        """Restore default field values before reuse"""
+        self.name_edit.clear()
+        self.email_edit.clear()
+        self.age_spin.setValue(25)
+        self.department_combo.setCurrentIndex(0)
+        self.active_check.setChecked(True)
+        self.notes_edit.clear()
+        
     def get_data(self):
         """Get form data"""
         return {
@@ -108,6 +181,11 @@ class ProgressDialog(QDialog):
         self.progress = QProgressBar()
         layout.addWidget(self.progress)
         
+    def reset(self):
+        """Restore initial state before reuse"""
+        self.progress.setValue(0)
+        self.label.setText("Processing, please wait...")
+        
     def set_progress(self, value):
         """Update progress value"""
         self.progress.setValue(value)
@@ -120,9 +198,16 @@ class ProgressDialog(QDialog):
 class MainWindow(QMainWindow):
     """Main window demonstrating various dialog patterns"""
     
-    def __init__(self):
+    def __init__(self, use_gpu=False):
         super().__init__()
+        self.use_gpu = use_gpu
+        # Dialogs are built on first use and reused afterwards
+        self._custom_dialog = None
+        self._progress_dialog = None
         self.setup_ui()
+        self.create_message_boxes()
+        self.create_input_dialogs()
+        self.create_file_dialogs()
         
     def setup_ui(self):
         """Initialize UI"""
@@ -136,213 +221,310 @@ class MainWindow(QMainWindow):
         # Title
         title = QLabel("Dialog Pattern Examples")
         title.setAlignment(Qt.AlignCenter)
-        title.setStyleSheet("font-size: 16px; font-weight: bold; padding: 10px;")
+        title.setObjectName("TitleLabel")
         layout.addWidget(title)
         
         # Result display
         self.result_text = QTextEdit()
         self.result_text.setReadOnly(True)
+        # Axis-aligned log text: skip antialiasing to cut glyph fill cost
+        log_font = QFont("Monospace")
+        log_font.setStyleHint(QFont.Monospace)
+        log_font.setStyleStrategy(QFont.NoAntialias | QFont.PreferBitmap)
+        self.result_text.setFont(log_font)
         self.result_text.setMaximumHeight(150)
         layout.addWidget(QLabel("Results:"))
         layout.addWidget(self.result_text)
         
-        # Custom dialogs
-        layout.addWidget(QLabel("Custom Dialogs:"))
-        custom_btn = QPushButton("Show Custom Dialog")
-        custom_btn.clicked.connect(self.show_custom_dialog)
-        layout.addWidget(custom_btn)
-        
-        # Standard dialogs
-        layout.addWidget(QLabel("Standard Dialogs:"))
-        
-        btn_layout = QVBoxLayout()
-        
-        file_btn = QPushButton("File Open Dialog")
-        file_btn.clicked.connect(self.show_file_dialog)
-        btn_layout.addWidget(file_btn)
-        
-        save_btn = QPushButton("File Save Dialog")
-        save_btn.clicked.connect(self.show_save_dialog)
-        btn_layout.addWidget(save_btn)
-        
-        dir_btn = QPushButton("Directory Dialog")
-        dir_btn.clicked.connect(self.show_directory_dialog)
-        btn_layout.addWidget(dir_btn)
-        
-        layout.addLayout(btn_layout)
-        
-        # Message boxes
-        layout.addWidget(QLabel("Message Boxes:"))
-        
-        msg_layout = QHBoxLayout()
-        
-        info_btn = QPushButton("Information")
-        info_btn.clicked.connect(self.show_info_message)
-        msg_layout.addWidget(info_btn)
-        
-        warn_btn = QPushButton("Warning")
-        warn_btn.clicked.connect(self.show_warning_message)
-        msg_layout.addWidget(warn_btn)
-        
-        error_btn = QPushButton("Error")
-        error_btn.clicked.connect(self.show_error_message)
-        msg_layout.addWidget(error_btn)
-        
-        question_btn = QPushButton("Question")
-        question_btn.clicked.connect(self.show_question_message)
-        msg_layout.addWidget(question_btn)
-        
-        layout.addLayout(msg_layout)
-        
-        # Input dialogs
-        layout.addWidget(QLabel("Input Dialogs:"))
+        # Coalesce log lines into one document edit per frame
+        self._result_cursor = QTextCursor(self.result_text.document())
+        self._pending_results = []
+        self._flush_timer = QTimer(self)
+        self._flush_timer.setSingleShot(True)
+        self._flush_timer.setInterval(16)
+        self._flush_timer.timeout.connect(self._flush_results)
+        
+        if self.use_gpu and not use_gpu_viewport(self.result_text):
+            self.use_gpu = False
+            self.log_result("OpenGL is not available, using the raster viewport")
+        
+        # Demo buttons, built from BUTTON_SECTIONS and all routed to one slot
+        self._dispatch = {
+            "custom": self.show_custom_dialog,
+            "progress": self.show_progress_dialog,
+            "file": self.show_file_dialog,
+            "save": self.show_save_dialog,
+            "directory": self.show_directory_dialog,
+            "info": self.show_info_message,
+            "warning": self.show_warning_message,
+            "error": self.show_error_message,
+            "question": self.show_question_message,
+            "text": self.show_text_input,
+            "int": self.show_int_input,
+            "item": self.show_item_input,
+        }
         
-        input_layout = QHBoxLayout()
+        # One stacked page per section, populated the first time it is shown
+        self._section_tabs = QTabBar()
+        self._section_stack = QStackedWidget()
+        self._built_sections = set()
+        for section_title, _, _ in BUTTON_SECTIONS:
+            self._section_tabs.addTab(section_title)
+            self._section_stack.addWidget(QWidget())
+        self._section_tabs.currentChanged.connect(self.show_section)
+        layout.addWidget(self._section_tabs)
+        layout.addWidget(self._section_stack)
+        self.show_section(self._section_tabs.currentIndex())
         
-        text_input_btn = QPushButton("Text Input")
-        text_input_btn.clicked.connect(self.show_text_input)
-        input_layout.addWidget(text_input_btn)
+        layout.addStretch()
         
-        int_input_btn = QPushButton("Integer Input")
-        int_input_btn.clicked.connect(self.show_int_input)
-        input_layout.addWidget(int_input_btn)
+    @Slot(int)
+    def show_section(self, index):
+        """Show a section page, building its buttons on first use"""
+        if index not in self._built_sections:
+            _, layout_class, buttons = BUTTON_SECTIONS[index]
+            section_layout = layout_class(self._section_stack.widget(index))
+            for text, command in buttons:
+                button = QPushButton(text)
+                button.setProperty("cmd", command)
+                button.clicked.connect(self._on_button)
+                section_layout.addWidget(button)
+            self._built_sections.add(index)
+        self._section_stack.setCurrentIndex(index)
+        
+    @Slot()
+    def _on_button(self):
+        """Dispatch a demo button click to its handler"""
+        self._dispatch[self.sender().property("cmd")]()
+        
+    def create_message_boxes(self):
+        """Create message boxes once and reuse them on every click"""
+        self._info_box = QMessageBox(
+            QMessageBox.Information,
+            "Information",
+            "This is an information message.",
+            QMessageBox.Ok,
+            self
+        )
+        self._warning_box = QMessageBox(
+            QMessageBox.Warning,
+            "Warning",
+            "This is a warning message!",
+            QMessageBox.Ok,
+            self
+        )
+        self._error_box = QMessageBox(
+            QMessageBox.Critical,
+            "Error",
+            "This is an error message!",
+            QMessageBox.Ok,
+            self
+        )
+        self._question_box = QMessageBox(
+            QMessageBox.Question,
+            "Question",
+            "Do you want to proceed?",
+            QMessageBox.Yes | QMessageBox.No | QMessageBox.Cancel,
+            self
+        )
         
-        item_input_btn = QPushButton("Item Selection")
-        item_input_btn.clicked.connect(self.show_item_input)
-        input_layout.addWidget(item_input_btn)
+    def create_file_dialogs(self):
+        """Create reusable file dialogs"""
+        # Non-native dialogs keep their widget tree (and scanned directory
+        # state) between calls, so caching them actually pays off
+        self._open_dialog = QFileDialog(
+            self,
+            "Open File",
+            "",
+            "All Files (*);;Text Files (*.txt);;Python Files (*.py)"
+        )
+        self._open_dialog.setOption(QFileDialog.DontUseNativeDialog, True)
+        self._open_dialog.setFileMode(QFileDialog.ExistingFile)
         
-        layout.addLayout(input_layout)
-        layout.addStretch()
+        self._save_dialog = QFileDialog(
+            self,
+            "Save File",
+            "",
+            "Text Files (*.txt);;All Files (*)"
+        )
+        self._save_dialog.setOption(QFileDialog.DontUseNativeDialog, True)
+        self._save_dialog.setAcceptMode(QFileDialog.AcceptSave)
+        self._save_dialog.setFileMode(QFileDialog.AnyFile)
+        
+        self._directory_dialog = QFileDialog(self, "Select Directory")
+        self._directory_dialog.setOption(QFileDialog.DontUseNativeDialog, True)
+        self._directory_dialog.setFileMode(QFileDialog.Directory)
+        self._directory_dialog.setOption(QFileDialog.ShowDirsOnly, True)
+        
+    def create_input_dialogs(self):
+        """Create one input dialog per mode and reuse them"""
+        self._text_dialog = QInputDialog(self)
+        self._text_dialog.setWindowTitle("Text Input")
+        self._text_dialog.setLabelText("Enter your name:")
+        self._text_dialog.setInputMode(QInputDialog.TextInput)
+        
+        self._int_dialog = QInputDialog(self)
+        self._int_dialog.setWindowTitle("Integer Input")
+        self._int_dialog.setLabelText("Enter a number:")
+        self._int_dialog.setInputMode(QInputDialog.IntInput)
+        self._int_dialog.setIntRange(0, 100)
+        
+        self._item_options = ["Option 1", "Option 2", "Option 3", "Option 4"]
+        self._item_dialog = QInputDialog(self)
+        self._item_dialog.setWindowTitle("Item Selection")
+        self._item_dialog.setLabelText("Choose an option:")
+        self._item_dialog.setComboBoxItems(self._item_options)
+        self._item_dialog.setComboBoxEditable(False)
+        
+    def get_progress_dialog(self):
+        """Get the shared progress dialog (created on first use)"""
+        if self._progress_dialog is None:
+            self._progress_dialog = ProgressDialog(self)
+        self._progress_dialog.reset()
+        return self._progress_dialog
         
     def log_result(self, message):
         """Log result to text area"""
-        self.result_text.append(message)
-        
+        self._pending_results.append(message)
+        if not self._flush_timer.isActive():
+            self._flush_timer.start()
+        
+    @Slot()
+    def _flush_results(self):
+        """Write all queued log lines in a single insert"""
+        if not self._pending_results:
+            return
+        text = "\n".join(self._pending_results)
+        self._pending_results.clear()
+        if not self.result_text.document().isEmpty():
+            text = "\n" + text
+        self._result_cursor.movePosition(QTextCursor.End)
+        self._result_cursor.insertText(text)
+        scrollbar = self.result_text.verticalScrollBar()
+        scrollbar.setValue(scrollbar.maximum())
+        
+    @Slot()
     def show_custom_dialog(self):
         """Show custom dialog"""
-        dialog = CustomDialog(self)
+        if self._custom_dialog is None:
+            self._custom_dialog = CustomDialog(self)
+        dialog = self._custom_dialog
+        dialog.reset()
         if dialog.exec() == QDialog.Accepted:
             data = dialog.get_data()
-            self.log_result(f"Custom dialog data: {data}")
+            self.log_result(MSG_CUSTOM_DATA + str(data))
         else:
-            self.log_result("Custom dialog cancelled")
+            self.log_result(MSG_CUSTOM_CANCELLED)
             
+    @Slot()
+    def show_progress_dialog(self):
+        """Show the progress dialog while a simulated task advances it"""
+        dialog = self.get_progress_dialog()
+        
+        # 5% every 50 ms; the timer runs inside the dialog's exec() loop
+        timer = QTimer(dialog)
+        timer.setInterval(50)
+        
+        def advance():
+            value = dialog.progress.value() + 5
+            dialog.set_progress(value)
+            if value >= 100:
+                dialog.accept()
+                
+        timer.timeout.connect(advance)
+        timer.start()
+        accepted = dialog.exec() == QDialog.Accepted
+        timer.stop()
+        timer.deleteLater()
+        self.log_result(MSG_PROGRESS_DONE if accepted else MSG_PROGRESS_CANCELLED)
+            
+    @Slot()
     def show_file_dialog(self):
         """Show file open dialog"""
-        filename, _ = QFileDialog.getOpenFileName(
-            self,
-            "Open File",
-            "",
-            "All Files (*);;Text Files (*.txt);;Python Files (*.py)"
-        )
-        if filename:
-            self.log_result(f"Selected file: {filename}")
+        if self._open_dialog.exec():
+            filename = self._open_dialog.selectedFiles()[0]
+            self.log_result(MSG_SELECTED_FILE + filename)
             
+    @Slot()
     def show_save_dialog(self):
         """Show file save dialog"""
-        filename, _ = QFileDialog.getSaveFileName(
-            self,
-            "Save File",
-            "",
-            "Text Files (*.txt);;All Files (*)"
-        )
-        if filename:
-            self.log_result(f"Save to: {filename}")
+        if self._save_dialog.exec():
+            filename = self._save_dialog.selectedFiles()[0]
+            self.log_result(MSG_SAVE_TO + filename)
             
+    @Slot()
     def show_directory_dialog(self):
         """Show directory selection dialog"""
-        directory = QFileDialog.getExistingDirectory(
-            self,
-            "Select Directory"
-        )
-        if directory:
-            self.log_result(f"Selected directory: {directory}")
+        if self._directory_dialog.exec():
+            directory = self._directory_dialog.selectedFiles()[0]
+            self.log_result(MSG_SELECTED_DIRECTORY + directory)
             
+    @Slot()
     def show_info_message(self):
         """Show information message box"""
-        QMessageBox.information(
-            self,
-            "Information",
-            "This is an information message."
-        )
-        self.log_result("Showed information message")
+        self._info_box.exec()
+        self.log_result(MSG_INFO_SHOWN)
         
+    @Slot()
     def show_warning_message(self):
         """Show warning message box"""
-        QMessageBox.warning(
-            self,
-            "Warning",
-            "This is a warning message!"
-        )
-        self.log_result("Showed warning message")
+        self._warning_box.exec()
+        self.log_result(MSG_WARNING_SHOWN)
         
+    @Slot()
     def show_error_message(self):
         """Show error message box"""
-        QMessageBox.critical(
-            self,
-            "Error",
-            "This is an error message!"
-        )
-        self.log_result("Showed error message")
+        self._error_box.exec()
+        self.log_result(MSG_ERROR_SHOWN)
         
+    @Slot()
     def show_question_message(self):
         """Show question message box"""
-        reply = QMessageBox.question(
-            self,
-            "Question",
-            "Do you want to proceed?",
-            QMessageBox.Yes | QMessageBox.No | QMessageBox.Cancel
-        )
+        reply = self._question_box.exec()
         
         if reply == QMessageBox.Yes:
-            self.log_result("User clicked Yes")
+            self.log_result(MSG_CLICKED_YES)
         elif reply == QMessageBox.No:
-            self.log_result("User clicked No")
+            self.log_result(MSG_CLICKED_NO)
         else:
-            self.log_result("User clicked Cancel")
+            self.log_result(MSG_CLICKED_CANCEL)
             
+    @Slot()
     def show_text_input(self):
         """Show text input dialog"""
-        text, ok = QInputDialog.getText(
-            self,
-            "Text Input",
-            "Enter your name:"
-        )
+        dialog = self._text_dialog
+        dialog.setTextValue("")
+        ok = dialog.exec() == QDialog.Accepted
+        text = dialog.textValue()
         if ok and text:
-            self.log_result(f"Entered text: {text}")
+            self.log_result(MSG_ENTERED_TEXT + text)
             
+    @Slot()
     def show_int_input(self):
         """Show integer input dialog"""
-        value, ok = QInputDialog.getInt(
-            self,
-            "Integer Input",
-            "Enter a number:",
-            25,  # default value
-            0,   # minimum
-            100  # maximum
-        )
+        dialog = self._int_dialog
+        dialog.setIntValue(25)  # default value
+        ok = dialog.exec() == QDialog.Accepted
+        value = dialog.intValue()
         if ok:
-            self.log_result(f"Entered number: {value}")
+            self.log_result(MSG_ENTERED_NUMBER + str(value))
             
+    @Slot()
     def show_item_input(self):
         """Show item selection dialog"""
-        items = ["Option 1", "Option 2", "Option 3", "Option 4"]
-        item, ok = QInputDialog.getItem(
-            self,
-            "Item Selection",
-            "Choose an option:",
-            items,
-            0,     # default index
-            False  # not editable
-        )
+        dialog = self._item_dialog
+        dialog.setTextValue(self._item_options[0])  # default item
+        ok = dialog.exec() == QDialog.Accepted
+        item = dialog.textValue()
         if ok and item:
-            self.log_result(f"Selected item: {item}")
+            self.log_result(MSG_SELECTED_ITEM + item)
 
 
 def main():
     """Application entry point"""
     app = QApplication(sys.argv)
-    window = MainWindow()
+    app.setStyleSheet(APP_STYLE_SHEET)
+    window = MainWindow(use_gpu="--gpu" in sys.argv)
     window.show()
     sys.exit(app.exec())
 
@@ -12,15 +12,18 @@ Hot reload:
 """
 
 import sys
+from pathlib import Path
 from PySide6.QtWidgets import (
     QApplication, QMainWindow, QWidget, QVBoxLayout, QHBoxLayout,
     QMessageBox, QComboBox
 )
 from PySide6.QtCore import Qt
 
-# Import the component library
-sys.path.insert(0, '/home/claude/pyqt-pyside-gui/scripts')
-from ui_components import *
+# Import the component library (ui_components/ sits next to examples/)
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+from ui_components import (
+    load_theme, list_themes, ThemeLoader, Label, Button, Card, FormField, ButtonGroup
+)
 
 
 class ThemeDemo(QMainWindow):
@@ -54,9 +57,11 @@ class ThemeDemo(QMainWindow):
         theme_label = Label("Theme:", variant="normal")
         header_layout.addWidget(theme_label.get_widget())
         
+        # Only theme headers are read here; full files load on selection
         self.theme_selector = QComboBox()
-        available_themes = list_themes()
-        self.theme_selector.addItems(available_themes)
+        for index, (name, description) in enumerate(ThemeLoader.list_theme_metadata()):
+            self.theme_selector.addItem(name)
+            self.theme_selector.setItemData(index, description, Qt.ToolTipRole)
         self.theme_selector.currentTextChanged.connect(self.change_theme)
         header_layout.addWidget(self.theme_selector)
         
@@ -72,43 +77,29 @@ class ThemeDemo(QMainWindow):
         # Button variants card
         button_card = Card(title="Button Variants")
         
-        buttons_layout = QVBoxLayout()
-        
         # Primary, Secondary, Success, Danger
-        row1 = QHBoxLayout()
-        row1.addWidget(Button("Primary", variant="primary").get_widget())
-        row1.addWidget(Button("Secondary", variant="secondary").get_widget())
-        row1.addWidget(Button("Success", variant="success").get_widget())
-        row1.addWidget(Button("Danger", variant="danger").get_widget())
-        buttons_layout.addLayout(row1)
+        button_card.add_row([
+            Button("Primary", variant="primary").get_widget(),
+            Button("Secondary", variant="secondary").get_widget(),
+            Button("Success", variant="success").get_widget(),
+            Button("Danger", variant="danger").get_widget(),
+        ])
         
         # Outline, Text
-        row2 = QHBoxLayout()
-        row2.addWidget(Button("Outline", variant="outline").get_widget())
-        row2.addWidget(Button("Text Only", variant="text").get_widget())
-        row2.addStretch()
-        buttons_layout.addLayout(row2)
+        button_card.add_row([
+            Button("Outline", variant="outline").get_widget(),
+            Button("Text Only", variant="text").get_widget(),
+        ], stretch=True)
         
         # Sizes
         size_label = Label("Button Sizes:", variant="small")
-        buttons_layout.addWidget(size_label.get_widget())
-        
-        row3 = QHBoxLayout()
-        row3.addWidget(Button("Small", variant="primary", size="small").get_widget())
-        row3.addWidget(Button("Normal", variant="primary", size="normal").get_widget())
-        row3.addWidget(Button("Large", variant="primary", size="large").get_widget())
-        row3.addStretch()
-        buttons_layout.addLayout(row3)
-        
-        # Add to card
-        for i in range(buttons_layout.count()):
-            item = buttons_layout.itemAt(i)
-            if item.widget():
-                button_card.add_widget(item.widget())
-            elif item.layout():
-                container = QWidget()
-                container.setLayout(item.layout())
-                button_card.add_widget(container)
+        button_card.add_widget(size_label.get_widget())
+        
+        button_card.add_row([
+            Button("Small", variant="primary", size="small").get_widget(),
+            Button("Normal", variant="primary", size="normal").get_widget(),
+            Button("Large", variant="primary", size="large").get_widget(),
+        ], stretch=True)
         
         main_layout.addWidget(button_card.get_widget())
         
@@ -137,16 +128,11 @@ class ThemeDemo(QMainWindow):
         # Labels card
         label_card = Card(title="Typography")
         
-        label_variants = QVBoxLayout()
-        label_variants.addWidget(Label("Title Text", variant="title").get_widget())
-        label_variants.addWidget(Label("Heading Text", variant="heading").get_widget())
-        label_variants.addWidget(Label("Normal Text", variant="normal").get_widget())
-        label_variants.addWidget(Label("Small Text", variant="small").get_widget())
-        label_variants.addWidget(Label("Caption Text", variant="caption").get_widget())
-        
-        label_container = QWidget()
-        label_container.setLayout(label_variants)
-        label_card.add_widget(label_container)
+        label_card.add_widget(Label("Title Text", variant="title").get_widget())
+        label_card.add_widget(Label("Heading Text", variant="heading").get_widget())
+        label_card.add_widget(Label("Normal Text", variant="normal").get_widget())
+        label_card.add_widget(Label("Small Text", variant="small").get_widget())
+        label_card.add_widget(Label("Caption Text", variant="caption").get_widget())
         
         main_layout.addWidget(label_card.get_widget())
         
@@ -180,12 +166,10 @@ class ThemeDemo(QMainWindow):
     def change_theme(self, theme_name):
         """Change theme dynamically"""
         try:
-            # Reload app with new theme
+            # Reload app with new theme; the app stylesheet styles every
+            # component, so existing widgets are restyled in place
             load_theme(QApplication.instance(), theme_name)
             
-            # Recreate UI to apply new theme
-            self.setup_ui()
-            
             QMessageBox.information(
                 self,
                 "Theme Changed",
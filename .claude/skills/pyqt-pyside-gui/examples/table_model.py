@@ -13,19 +13,35 @@ from PySide6.QtWidgets import (
     QApplication, QMainWindow, QWidget, QVBoxLayout, QHBoxLayout,
     QPushButton, QTableView, QHeaderView, QMessageBox
 )
-from PySide6.QtCore import Qt, QAbstractTableModel, QModelIndex, Signal
+from PySide6.QtCore import Qt, QAbstractTableModel, QModelIndex, QTimer
 from PySide6.QtGui import QColor
 
+# Row background colors, shared by every data() call
+ROW_COLOR = QColor(255, 255, 255)
+ALT_ROW_COLOR = QColor(240, 240, 240)
+
+# Cell alignments and the roles that return cell values
+ALIGN_NUMERIC = Qt.AlignCenter
+ALIGN_TEXT = Qt.AlignLeft | Qt.AlignVCenter
+TEXT_ROLES = frozenset((Qt.DisplayRole, Qt.EditRole))
+
 
 class CustomTableModel(QAbstractTableModel):
     """Custom table model for displaying and editing data"""
     
-    dataChanged = Signal()
-    
     def __init__(self, data=None, headers=None):
         super().__init__()
         self._data = data or []
         self._headers = headers or []
+        self._update_columns(self._data[0] if self._data else [])
+        
+        # Chunked loads insert one chunk per event loop pass (set_data_chunked)
+        self._pending_rows = []
+        self._pending_start = 0
+        self._chunk_size = 1000
+        self._load_timer = QTimer(self)
+        self._load_timer.setInterval(0)
+        self._load_timer.timeout.connect(self._insert_next_chunk)
         
     def rowCount(self, parent=QModelIndex()):
         """Return number of rows"""
@@ -33,30 +49,33 @@ class CustomTableModel(QAbstractTableModel):
         
     def columnCount(self, parent=QModelIndex()):
         """Return number of columns"""
-        if self._data:
-            return len(self._data[0])
-        return len(self._headers)
+        return self._ncols
         
     def data(self, index, role=Qt.DisplayRole):
         """Return data for given index and role"""
         if not index.isValid():
             return None
             
-        if role == Qt.DisplayRole or role == Qt.EditRole:
-            return self._data[index.row()][index.column()]
+        # Read the index once; each row()/column() is a call into Qt
+        row = index.row()
+        column = index.column()
+        
+        if role in TEXT_ROLES:
+            # Raw values: the view's delegate formats them on the C++ side,
+            # so no display string is built in Python per paint
+            return self._data[row][column]
             
         elif role == Qt.BackgroundRole:
             # Alternate row colors
-            if index.row() % 2 == 0:
-                return QColor(240, 240, 240)
-            return QColor(255, 255, 255)
+            if row % 2 == 0:
+                return ALT_ROW_COLOR
+            return ROW_COLOR
             
         elif role == Qt.TextAlignmentRole:
-            # Center align numeric columns
-            value = self._data[index.row()][index.column()]
-            if isinstance(value, (int, float)):
-                return Qt.AlignCenter
-            return Qt.AlignLeft | Qt.AlignVCenter
+            # Center align numeric columns (resolved per column, not per cell)
+            if column < len(self._col_align):
+                return self._col_align[column]
+            return ALIGN_TEXT
             
         return None
         
@@ -65,22 +84,19 @@ class CustomTableModel(QAbstractTableModel):
         if not index.isValid() or role != Qt.EditRole:
             return False
             
+        row = index.row()
+        column = index.column()
+        
+        # Maintain the column's data type; text that doesn't convert (e.g.
+        # typed into a blank inserted row) is kept as text
         try:
-            # Try to maintain data type
-            original_value = self._data[index.row()][index.column()]
-            if isinstance(original_value, int):
-                value = int(value)
-            elif isinstance(original_value, float):
-                value = float(value)
-            else:
-                value = str(value)
-                
-            self._data[index.row()][index.column()] = value
-            self.dataChanged.emit(index, index, [Qt.DisplayRole, Qt.EditRole])
-            return True
+            value = self._col_converters[column](value)
+        except (IndexError, ValueError, TypeError):
+            value = str(value)
             
-        except (ValueError, TypeError):
-            return False
+        self._data[row][column] = value
+        self.dataChanged.emit(index, index, [Qt.DisplayRole, Qt.EditRole])
+        return True
             
     def headerData(self, section, orientation, role=Qt.DisplayRole):
         """Return header data"""
@@ -104,10 +120,9 @@ class CustomTableModel(QAbstractTableModel):
         """Insert rows"""
         self.beginInsertRows(parent, row, row + count - 1)
         
-        for _ in range(count):
-            # Create empty row with same column count
-            new_row = [""] * self.columnCount()
-            self._data.insert(row, new_row)
+        # Create empty rows with same column count in one slice assignment
+        columns = self.columnCount()
+        self._data[row:row] = [[""] * columns for _ in range(count)]
             
         self.endInsertRows()
         return True
@@ -123,15 +138,101 @@ class CustomTableModel(QAbstractTableModel):
         self.endRemoveRows()
         return True
         
+    def append_row(self, values):
+        """Append a filled row with a single insert notification"""
+        row = len(self._data)
+        self.beginInsertRows(QModelIndex(), row, row)
+        self._data.append(list(values))
+        if not self._col_align:
+            self._update_columns(values)
+        self.endInsertRows()
+        
+    def set_row_data(self, row, values):
+        """Replace a whole row and notify views once"""
+        self.set_rows_data(row, [values])
+        
+    def set_rows_data(self, first_row, rows):
+        """Replace consecutive whole rows with one ranged dataChanged"""
+        if not rows:
+            return
+        for row, values in enumerate(rows, first_row):
+            self._data[row][:] = values
+        if not self._col_align:
+            self._update_columns(rows[0])
+        
+        # Views repaint the whole block once instead of once per cell
+        self.dataChanged.emit(
+            self.index(first_row, 0),
+            self.index(first_row + len(rows) - 1, self.columnCount() - 1),
+            [Qt.DisplayRole, Qt.EditRole]
+        )
+        
     def get_data(self):
         """Get all data"""
         return self._data
         
     def set_data(self, data):
         """Set all data"""
+        self._cancel_load()
         self.beginResetModel()
         self._data = data
+        self._update_columns(data[0] if data else [])
+        self.endResetModel()
+        
+    def set_data_chunked(self, data, chunk_size=1000):
+        """Set all data, inserting the rows in chunks from the event loop
+        
+        The model is reset to empty (with the new column layout) right away,
+        then a zero-interval timer appends one chunk per event loop pass, so
+        views lay out only the new rows and large loads stay responsive.
+        A later set_data or set_data_chunked call replaces a load still
+        in progress.
+        """
+        self._cancel_load()
+        self.beginResetModel()
+        self._data = []
+        self._update_columns(data[0] if data else [])
         self.endResetModel()
+        
+        if data:
+            self._pending_rows = data
+            self._chunk_size = chunk_size
+            self._load_timer.start()
+            
+    def is_loading(self):
+        """Whether a chunked load is still inserting rows"""
+        return self._load_timer.isActive()
+        
+    def _cancel_load(self):
+        """Drop the rows a chunked load has not inserted yet"""
+        self._load_timer.stop()
+        self._pending_rows = []
+        self._pending_start = 0
+        
+    def _insert_next_chunk(self):
+        """Append the next chunk of a chunked load"""
+        start = self._pending_start
+        rows = self._pending_rows[start:start + self._chunk_size]
+        if rows:
+            first = len(self._data)
+            self.beginInsertRows(QModelIndex(), first, first + len(rows) - 1)
+            self._data.extend(rows)
+            self.endInsertRows()
+            self._pending_start = start + len(rows)
+        if self._pending_start >= len(self._pending_rows):
+            self._cancel_load()
+        
+    def _update_columns(self, sample_row):
+        """Cache column count, alignment and converters from one row's value types"""
+        self._ncols = len(sample_row) if sample_row else len(self._headers)
+        self._col_align = [
+            ALIGN_NUMERIC if isinstance(value, (int, float)) else ALIGN_TEXT
+            for value in sample_row
+        ]
+        self._col_converters = [
+            int if isinstance(value, int) else float if isinstance(value, float) else str
+            for value in sample_row
+        ]
 
 
 class MainWindow(QMainWindow):
@@ -155,6 +256,7 @@ class MainWindow(QMainWindow):
         # Create table view
         self.table_view = QTableView()
         self.table_view.setAlternatingRowColors(True)
+        self.table_view.setSelectionBehavior(QTableView.SelectRows)
         self.table_view.horizontalHeader().setStretchLastSection(True)
         self.table_view.horizontalHeader().setSectionResizeMode(QHeaderView.Stretch)
         layout.addWidget(self.table_view)
@@ -198,20 +300,13 @@ class MainWindow(QMainWindow):
             [7, "Grace Wilson", 33, "Engineering", 90000],
             [8, "Henry Moore", 45, "Management", 115000],
         ]
-        self.model.set_data(sample_data)
+        self.model.set_data_chunked(sample_data)
         
     def add_row(self):
         """Add new row at the end"""
-        row_count = self.model.rowCount()
-        self.model.insertRows(row_count, 1)
-        
-        # Set default values
-        new_id = row_count + 1
-        self.model.setData(self.model.index(row_count, 0), new_id)
-        self.model.setData(self.model.index(row_count, 1), "New Employee")
-        self.model.setData(self.model.index(row_count, 2), 25)
-        self.model.setData(self.model.index(row_count, 3), "Department")
-        self.model.setData(self.model.index(row_count, 4), 50000)
+        # Insert with default values already in place
+        new_id = self.model.rowCount() + 1
+        self.model.append_row([new_id, "New Employee", 25, "Department", 50000])
         
     def remove_selected(self):
         """Remove selected rows"""
@@ -220,12 +315,20 @@ class MainWindow(QMainWindow):
             QMessageBox.information(self, "Info", "No rows selected")
             return
             
-        # Get selected rows (unique)
-        rows = set(index.row() for index in selection.selectedIndexes())
+        # Selected rows, one index per row (from bottom to top to maintain indices)
+        rows = sorted((index.row() for index in selection.selectedRows()), reverse=True)
         
-        # Remove rows (from bottom to top to maintain indices)
-        for row in sorted(rows, reverse=True):
-            self.model.removeRows(row, 1)
+        # Remove each run of consecutive rows with a single removeRows
+        start = count = 0
+        for row in rows:
+            if count and row == start - 1:
+                start, count = row, count + 1
+                continue
+            if count:
+                self.model.removeRows(start, count)
+            start, count = row, 1
+        if count:
+            self.model.removeRows(start, count)
             
     def clear_all(self):
         """Clear all data"""
@@ -2,7 +2,7 @@
 Threaded PySide6 Application
 
 Demonstrates proper threading for long-running operations:
-- QThread for background processing
+- QThreadPool + QRunnable for background processing
 - Signal/slot communication between threads
 - Progress updates
 - Proper thread cleanup
@@ -10,15 +10,19 @@ Demonstrates proper threading for long-running operations:
 
 import sys
 import time
+import threading
 from PySide6.QtWidgets import (
     QApplication, QMainWindow, QWidget, QVBoxLayout,
     QPushButton, QLabel, QProgressBar, QTextEdit
 )
-from PySide6.QtCore import Qt, Signal, Slot, QThread
+from PySide6.QtCore import Qt, Signal, Slot, QObject, QRunnable, QThreadPool
 
+# Minimum seconds between progress updates sent to the GUI thread
+PROGRESS_INTERVAL = 0.1
 
-class Worker(QThread):
-    """Worker thread for long-running operations"""
+
+class WorkerSignals(QObject):
+    """Signals for a Worker (QRunnable itself cannot emit)"""
     
     # Define signals
     progress = Signal(int)  # Progress percentage
@@ -26,11 +30,20 @@ class Worker(QThread):
     result = Signal(object) # Result data
     finished = Signal()     # Completion signal
     error = Signal(str)     # Error signal
+
+
+class Worker(QRunnable):
+    """Pooled task for long-running operations"""
     
     def __init__(self, task_type="default"):
         super().__init__()
         self.task_type = task_type
-        self._is_running = True
+        self.signals = WorkerSignals()
+        self._stop_event = threading.Event()
+        self._last_report = 0.0
+        
+        # The window keeps the worker, so the pool must not delete it
+        self.setAutoDelete(False)
         
     def run(self):
         """Execute the background task"""
@@ -42,42 +55,40 @@ class Worker(QThread):
             else:
                 self.run_default_task()
                 
-            self.finished.emit()
+            self.signals.finished.emit()
             
         except Exception as e:
-            self.error.emit(str(e))
+            self.signals.error.emit(str(e))
             
     def run_counter_task(self):
         """Simple counting task"""
         for i in range(101):
-            if not self._is_running:
+            # Sleep doubles as the stop check and wakes as soon as stop() is called
+            if self._stop_event.wait(0.05):
                 break
                 
-            time.sleep(0.05)
-            self.progress.emit(i)
-            self.status.emit(f"Processing: {i}%")
+            self.report_progress(i, f"Processing: {i}%")
             
-        self.result.emit("Counter task completed!")
+        self.signals.result.emit("Counter task completed!")
         
     def run_processing_task(self):
         """Simulated data processing task"""
         steps = ["Loading data", "Processing", "Analyzing", "Finalizing"]
         
         for idx, step in enumerate(steps):
-            if not self._is_running:
+            if self._stop_event.is_set():
                 break
                 
-            self.status.emit(step)
+            self.signals.status.emit(step)
             
             # Simulate work
             for i in range(25):
-                if not self._is_running:
+                if self._stop_event.wait(0.02):
                     break
-                time.sleep(0.02)
-                progress = (idx * 25) + i
-                self.progress.emit(progress)
+                progress = (idx * 25) + i + 1
+                self.report_progress(progress)
                 
-        self.result.emit({
+        self.signals.result.emit({
             "status": "success",
             "processed_items": 1000,
             "duration": "2.5 seconds"
@@ -86,17 +97,27 @@ class Worker(QThread):
     def run_default_task(self):
         """Default task"""
         for i in range(101):
-            if not self._is_running:
+            if self._stop_event.wait(0.03):
                 break
                 
-            time.sleep(0.03)
-            self.progress.emit(i)
+            self.report_progress(i)
             
-        self.result.emit("Default task completed!")
+        self.signals.result.emit("Default task completed!")
+        
+    def report_progress(self, value, message=None):
+        """Emit progress at most every PROGRESS_INTERVAL, always at 100%"""
+        now = time.monotonic()
+        if value < 100 and now - self._last_report < PROGRESS_INTERVAL:
+            return
+        self._last_report = now
+        
+        self.signals.progress.emit(value)
+        if message:
+            self.signals.status.emit(message)
         
     def stop(self):
-        """Stop the worker thread"""
-        self._is_running = False
+        """Ask the task to stop at its next check"""
+        self._stop_event.set()
 
 
 class MainWindow(QMainWindow):
@@ -105,6 +126,8 @@ class MainWindow(QMainWindow):
     def __init__(self):
         super().__init__()
         self.worker = None
+        # Own pool, so waiting for it only waits for this window's tasks
+        self.thread_pool = QThreadPool(self)
         self.setup_ui()
         
     def setup_ui(self):
@@ -175,19 +198,20 @@ class MainWindow(QMainWindow):
     def start_task(self, task_type):
         """Start a background task"""
         # Stop existing worker if running
-        if self.worker and self.worker.isRunning():
+        if self.thread_pool.activeThreadCount():
             self.log("Task already running!")
             return
             
-        # Create worker thread
+        # Create worker task
         self.worker = Worker(task_type)
         
         # Connect signals
-        self.worker.progress.connect(self.update_progress)
-        self.worker.status.connect(self.update_status)
-        self.worker.result.connect(self.handle_result)
-        self.worker.finished.connect(self.task_finished)
-        self.worker.error.connect(self.handle_error)
+        signals = self.worker.signals
+        signals.progress.connect(self.update_progress)
+        signals.status.connect(self.update_status)
+        signals.result.connect(self.handle_result)
+        signals.finished.connect(self.task_finished)
+        signals.error.connect(self.handle_error)
         
         # Update UI
         self.start_counter_btn.setEnabled(False)
@@ -195,16 +219,16 @@ class MainWindow(QMainWindow):
         self.stop_btn.setEnabled(True)
         self.progress_bar.setValue(0)
         
-        # Start worker
-        self.worker.start()
+        # Start worker on a pooled thread
+        self.thread_pool.start(self.worker)
         self.log(f"Started {task_type} task")
         
     @Slot()
     def stop_task(self):
         """Stop the current task"""
-        if self.worker and self.worker.isRunning():
+        if self.thread_pool.activeThreadCount():
             self.worker.stop()
-            self.worker.wait()
+            self.thread_pool.waitForDone()
             self.log("Task stopped by user")
             self.task_finished()
             
@@ -244,9 +268,9 @@ class MainWindow(QMainWindow):
         
     def closeEvent(self, event):
         """Cleanup on close"""
-        if self.worker and self.worker.isRunning():
+        if self.thread_pool.activeThreadCount():
             self.worker.stop()
-            self.worker.wait()
+            self.thread_pool.waitForDone()
         event.accept()
 
 
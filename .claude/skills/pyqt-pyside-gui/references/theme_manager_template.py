@@ -2,6 +2,7 @@
 ThemeManager Template for PySide6 Applications
 
 Centralized theme manager - load JSON themes, generate QSS, and apply to the app.
+The QSS skeleton lives in theme_template.qss; copy it next to this module.
 
 Usage:
     from utils.theme_manager import load_theme, get_theme
@@ -13,23 +14,143 @@ Usage:
     color = theme.get("colors.brand.primary")
 """
 
+import asyncio
+import hashlib
 import json
+import mmap
+import os
+import re
+import sys
+from functools import lru_cache
 from pathlib import Path
-from typing import Any, Optional
-from PySide6.QtWidgets import QApplication
+from types import MappingProxyType
+from typing import Any, Dict, Mapping, Optional, Tuple
+from PySide6.QtWidgets import QApplication, QWidget
 
+# Use orjson for theme parsing when available
+try:
+    import orjson
+    _json_loads = orjson.loads
+except ImportError:
+    def _json_loads(data):
+        # json only takes bytes/str, so a mapped buffer is copied here
+        return json.loads(bytes(data))
 
-class ThemeManager:
-    """Centralized theme manager (singleton)."""
 
-    _instance: Optional["ThemeManager"] = None
-    _theme_data: dict = {}
-    _qss_cache: str = ""
 
-    def __new__(cls) -> "ThemeManager":
-        if cls._instance is None:
-            cls._instance = super().__new__(cls)
-        return cls._instance
+def _split_template(text: str) -> Tuple[list, dict]:
+    """Split a QSS skeleton into literal pieces and placeholder slots.
+
+    Args:
+        text: QSS with ${name} placeholders
+
+    Returns:
+        Pieces (literals at even indices, placeholder names at odd ones)
+        and a mapping of placeholder name to its piece indices
+    """
+    pieces = re.split(r"\$\{(\w+)\}", text)
+    slots: dict = {}
+    for index in range(1, len(pieces), 2):
+        slots.setdefault(pieces[index], []).append(index)
+    return pieces, slots
+
+
+# Bump whenever _generate_qss or _collect_qss_values change their output
+_QSS_GENERATOR_VERSION = 1
+
+# QSS skeleton, split once so rendering only fills slots and joins
+_QSS_TEMPLATE = Path(__file__).with_name("theme_template.qss").read_text(encoding="utf-8")
+_QSS_PIECES, _QSS_SLOTS = _split_template(_QSS_TEMPLATE)
+
+# Generated sheets are cached per user, not in the (possibly read-only)
+# directory the themes ship in; oldest entries go past the size cap
+_QSS_CACHE_DIR = Path.home() / ".cache" / "theme_manager"
+_QSS_CACHE_MAX_BYTES = 8 * 1024 * 1024
+
+# Hashed into every QSS cache key, so editing the skeleton or the generator
+# invalidates sheets cached for an unchanged theme file
+_QSS_KEY_PREFIX = hashlib.blake2b(
+    f"{_QSS_GENERATOR_VERSION}\n{_QSS_TEMPLATE}".encode("utf-8"), digest_size=8
+).digest()
+
+
+def _intern(value: Any) -> Any:
+    """Intern string theme values so repeated palette entries share one object.
+
+    Anything else (nested sections, numbers) is passed through unchanged.
+    """
+    return sys.intern(value) if isinstance(value, str) else value
+
+
+def _flatten(data: dict, prefix: str, out: dict) -> None:
+    """Store every value of nested theme data under its dotted key path.
+
+    Args:
+        data: Nested theme data
+        prefix: Dotted path of data, including the trailing dot
+        out: Flat mapping to fill
+    """
+    for key, value in data.items():
+        path = prefix + key
+        out[path] = value
+        if isinstance(value, dict):
+            _flatten(value, path + ".", out)
+
+
+@lru_cache(maxsize=64)
+def _shade_color(hex_color: str, percent: int) -> str:
+    """Darken (positive percent) or lighten (negative percent) a color.
+
+    Channels are unpacked from one 24-bit int and scaled with integer math.
+
+    Args:
+        hex_color: Hex color code (#RRGGBB)
+        percent: Percentage to darken, or to lighten when negative (-100–100)
+
+    Returns:
+        Shaded color code
+    """
+    rgb = int(hex_color.lstrip("#"), 16)
+    r, g, b = (rgb >> 16) & 0xFF, (rgb >> 8) & 0xFF, rgb & 0xFF
+    if percent >= 0:
+        keep = 100 - percent
+        r, g, b = r * keep // 100, g * keep // 100, b * keep // 100
+    else:
+        mix = -percent
+        r += (255 - r) * mix // 100
+        g += (255 - g) * mix // 100
+        b += (255 - b) * mix // 100
+    return f"#{(r << 16) | (g << 8) | b:06x}"
+
+
+def _shade_batch(shades: Tuple[Tuple[str, int], ...]) -> list:
+    """Shade several colors in one call.
+
+    Args:
+        shades: (hex_color, percent) pairs, as taken by _shade_color
+
+    Returns:
+        Shaded color codes, in the same order
+    """
+    return [_shade_color(hex_color, percent) for hex_color, percent in shades]
+
+
+class ThemeManager:
+    """Centralized theme manager (shared through get_theme())."""
+
+    # Generated QSS by cache key (theme, skeleton and generator), shared by
+    # every manager in the process
+    _qss_memo: Dict[str, str] = {}
+
+    def __init__(self) -> None:
+        self._theme_data: dict = {}
+        self._qss_cache: Optional[str] = ""
+        self._qss_key: Optional[str] = None
+        self._flat: dict = {}
+        self._data_view: Mapping = MappingProxyType(self._theme_data)
+        self._qss_values: dict = {}
+        self._qss_pieces: list = []
+        self._last_source: Optional[tuple] = None
 
     def load_theme(self, theme_path: str) -> None:
         """Load a JSON theme file.
@@ -41,10 +162,101 @@ class ThemeManager:
         if not path.exists():
             raise FileNotFoundError(f"Theme not found: {theme_path}")
 
-        with open(path, "r", encoding="utf-8") as f:
-            self._theme_data = json.load(f)
+        # Same file, unchanged since the last load: nothing to rebuild
+        st = path.stat()
+        source = (str(path.resolve()), st.st_mtime_ns, st.st_size)
+        if source == self._last_source:
+            return
+
+        # Hash and parse straight from the page cache, with no read() copy
+        with open(path, "rb") as f, \
+                mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm, \
+                memoryview(mm) as data:
+            hasher = hashlib.blake2b(_QSS_KEY_PREFIX, digest_size=8)
+            hasher.update(data)
+            digest = hasher.hexdigest()
+            self._theme_data = _json_loads(data)
+        self._flat = {}
+        _flatten(self._theme_data, "", self._flat)
+        self._data_view = MappingProxyType(self._theme_data)
+        self._last_source = source
+
+        # The QSS is only built once something asks for it (see _ensure_qss),
+        # so palette-only users never pay for it
+        self._qss_cache = None
+        self._qss_pieces = []
+        self._qss_key = digest
+
+    def _ensure_qss(self) -> str:
+        """Return the QSS for the loaded theme, building it on first use.
+
+        Returns:
+            Generated QSS
+        """
+        if self._qss_cache is not None:
+            return self._qss_cache
+
+        if self._qss_key is None:
+            # Edited in memory: the file caches no longer apply
+            self._generate_qss()
+            return self._qss_cache
+
+        # Generated QSS is cached in-process and under ~/.cache, keyed by a
+        # hash of the theme bytes, the skeleton and the generator version.
+        # Cached sheets have no slots for update_color.
+        digest = self._qss_key
+        memo = ThemeManager._qss_memo
+        if digest in memo:
+            self._qss_cache = memo[digest]
+            return self._qss_cache
+
+        cache_file = _QSS_CACHE_DIR / f"{digest}.qss"
+        try:
+            self._qss_cache = cache_file.read_text(encoding="utf-8")
+        except OSError:
+            self._generate_qss()
+            self._write_qss_cache(cache_file)
+        memo[digest] = self._qss_cache
+        return self._qss_cache
+
+    async def load_theme_async(self, theme_path: str) -> None:
+        """Load a JSON theme file without blocking the event loop.
+
+        Reading, parsing and QSS generation run in a worker thread; call
+        apply_to_app from the GUI thread once this completes.
+
+        Args:
+            theme_path: Path to the theme JSON file
+
+        Example:
+            await theme.load_theme_async("themes/dark.json")
+            theme.apply_to_app(app)
+        """
+        await asyncio.to_thread(self.load_theme, theme_path)
+        await asyncio.to_thread(self._ensure_qss)
 
-        self._generate_qss()
+    def _write_qss_cache(self, cache_file: Path) -> None:
+        """Write the generated QSS cache and evict the oldest entries over the size cap.
+
+        Args:
+            cache_file: Cache file for the current cache key
+        """
+        try:
+            _QSS_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+            tmp_file = cache_file.with_name(f"{cache_file.name}.{os.getpid()}.tmp")
+            tmp_file.write_text(self._qss_cache, encoding="utf-8")
+            os.replace(tmp_file, cache_file)
+
+            entries = [(e.stat().st_mtime, e.stat().st_size, e) for e in _QSS_CACHE_DIR.glob("*.qss")]
+            total = sum(size for _, size, _ in entries)
+            for _, size, entry in sorted(entries, key=lambda e: e[0]):
+                if total <= _QSS_CACHE_MAX_BYTES:
+                    break
+                entry.unlink()
+                total -= size
+        except OSError:
+            # Read-only home or full disk: just regenerate next time
+            pass
 
     def get(self, key_path: str, default: Any = None) -> Any:
         """Get a theme value using dotted path notation.
@@ -60,51 +272,131 @@ class ThemeManager:
             theme.get("colors.brand.primary")  # "#3ECF8E"
             theme.get("spacing.md", 12)        # 12
         """
-        keys = key_path.split(".")
-        value = self._theme_data
+        # Every path, leaf or section, was resolved once at load time
+        return self._flat.get(key_path, default)
 
-        for key in keys:
-            if isinstance(value, dict) and key in value:
-                value = value[key]
-            else:
-                return default
+    def get_tuple(self, keys: Tuple[str, ...], default: Any = None) -> Any:
+        """Get a theme value from already split path segments.
+
+        Args:
+            keys: Path segments (e.g. ("colors", "brand", "primary"))
+            default: Default value if the key is missing
 
+        Returns:
+            Theme value or the default
+        """
+        value = self._theme_data
+        try:
+            for key in keys:
+                value = value[key]
+        except (KeyError, TypeError):
+            return default
         return value
 
     def _generate_qss(self) -> None:
         """Generate QSS from theme data."""
+        self._qss_values = self._collect_qss_values()
+        pieces = list(_QSS_PIECES)
+        for name, slots in _QSS_SLOTS.items():
+            value = str(self._qss_values[name])
+            for index in slots:
+                pieces[index] = value
+        self._qss_pieces = pieces
+        self._qss_cache = "".join(pieces)
+
+    def update_color(self, key_path: str, value: str) -> None:
+        """Change one color and refill only the QSS slots it affects.
+
+        Args:
+            key_path: Path below "colors" (e.g. "brand.primary")
+            value: New hex color code
+
+        Example:
+            theme.update_color("brand.primary", "#7C3AED")
+            theme.apply_to_app(app)
+        """
+        *parents, key = key_path.split(".")
+        section = self._theme_data.setdefault("colors", {})
+        for name in parents:
+            section = section.setdefault(name, {})
+        section[key] = value
+        self._flat = {}
+        _flatten(self._theme_data, "", self._flat)
+        # The theme in memory no longer matches its file
+        self._last_source = None
+        self._qss_key = None
+
+        if self._qss_cache is None:
+            # Not built yet; _ensure_qss will pick the edit up
+            return
+        if not self._qss_pieces:
+            self._generate_qss()
+            return
+
+        values = self._collect_qss_values()
+        pieces = self._qss_pieces
+        for name, new in values.items():
+            if new != self._qss_values.get(name):
+                new = str(new)
+                for index in _QSS_SLOTS.get(name, ()):
+                    pieces[index] = new
+        self._qss_values = values
+        self._qss_cache = "".join(pieces)
+
+    def _collect_qss_values(self) -> dict:
+        """Collect the values for every QSS placeholder from theme data.
+
+        Returns:
+            Mapping of placeholder name to value
+        """
         colors = self._theme_data.get("colors", {})
         typography = self._theme_data.get("typography", {})
         spacing = self._theme_data.get("spacing", {})
         radius = self._theme_data.get("radius", {})
 
+        def color(section: str, key: str, fallback: str) -> str:
+            try:
+                value = colors[section][key]
+            except (KeyError, TypeError):
+                value = fallback
+            return _intern(value)
+
         # Extract colors
-        primary = colors.get("brand", {}).get("primary", "#3ECF8E")
-        secondary = colors.get("brand", {}).get("secondary", "#1DB7B0")
-        accent = colors.get("brand", {}).get("accent", "#7C3AED")
+        primary = color("brand", "primary", "#3ECF8E")
+        secondary = color("brand", "secondary", "#1DB7B0")
+        accent = color("brand", "accent", "#7C3AED")
 
-        bg_primary = colors.get("background", {}).get("primary", "#FFFFFF")
-        bg_secondary = colors.get("background", {}).get("secondary", "#F5F5F5")
-        bg_tertiary = colors.get("background", {}).get("tertiary", "#EBEBEB")
+        bg_primary = color("background", "primary", "#FFFFFF")
+        bg_secondary = color("background", "secondary", "#F5F5F5")
+        bg_tertiary = color("background", "tertiary", "#EBEBEB")
 
-        text_primary = colors.get("text", {}).get("primary", "#171717")
-        text_secondary = colors.get("text", {}).get("secondary", "#737373")
-        text_disabled = colors.get("text", {}).get("disabled", "#A3A3A3")
+        text_primary = color("text", "primary", "#171717")
+        text_secondary = color("text", "secondary", "#737373")
+        text_disabled = color("text", "disabled", "#A3A3A3")
 
-        border_default = colors.get("border", {}).get("default", "#E5E5E5")
-        border_focus = colors.get("border", {}).get("focus", primary)
+        border_default = color("border", "default", "#E5E5E5")
+        border_focus = color("border", "focus", primary)
 
-        success = colors.get("semantic", {}).get("success", "#10B981")
-        warning = colors.get("semantic", {}).get("warning", "#F59E0B")
-        error = colors.get("semantic", {}).get("error", "#EF4444")
-        info = colors.get("semantic", {}).get("info", "#3B82F6")
+        success = color("semantic", "success", "#10B981")
+        warning = color("semantic", "warning", "#F59E0B")
+        error = color("semantic", "error", "#EF4444")
+        info = color("semantic", "info", "#3B82F6")
 
-        neutral = colors.get("neutral", {})
-        neutral_300 = neutral.get("300", "#D4D4D4")
-        neutral_800 = neutral.get("800", "#262626")
+        neutral_300 = color("neutral", "300", "#D4D4D4")
+        neutral_800 = color("neutral", "800", "#262626")
+
+        # Derived shades, computed together once rather than inside the template
+        primary_d10, primary_d20, primary_l90, error_d10 = _shade_batch((
+            (primary, 10),
+            (primary, 20),
+            (primary, -90),
+            (error, 10),
+        ))
 
         # Extract typography
-        font_family = typography.get("fontFamily", "Segoe UI, -apple-system, sans-serif")
+        font_family = _intern(
+            typography.get("fontFamily", "Segoe UI, -apple-system, sans-serif")
+        )
         sizes = typography.get("sizes", {})
         font_xs = sizes.get("xs", 10)
         font_sm = sizes.get("sm", 12)
@@ -123,554 +415,38 @@ class ThemeManager:
         radius_md = radius.get("md", 8)
         radius_lg = radius.get("lg", 12)
 
-        self._qss_cache = f"""
-        /* ===== Global Styles ===== */
-        QWidget {{
-            font-family: {font_family};
-            font-size: {font_base}px;
-            color: {text_primary};
-        }}
-
-        QMainWindow, QDialog {{
-            background-color: {bg_primary};
-        }}
-
-        /* ===== Labels ===== */
-        QLabel {{
-            color: {text_primary};
-            background: transparent;
-        }}
-
-        QLabel[variant="title"] {{
-            font-size: {font_xl}px;
-            font-weight: 600;
-        }}
-
-        QLabel[variant="subtitle"] {{
-            font-size: {font_lg}px;
-            font-weight: 500;
-        }}
-
-        QLabel[variant="caption"] {{
-            font-size: {font_sm}px;
-            color: {text_secondary};
-        }}
-
-        QLabel[status="success"] {{
-            color: {success};
-        }}
-
-        QLabel[status="warning"] {{
-            color: {warning};
-        }}
-
-        QLabel[status="error"] {{
-            color: {error};
-        }}
-
-        /* ===== Buttons ===== */
-        QPushButton {{
-            background-color: {bg_secondary};
-            color: {text_primary};
-            border: 1px solid {border_default};
-            border-radius: {radius_md}px;
-            padding: {spacing_md}px {spacing_md * 2}px;
-            font-weight: 500;
-            min-height: 36px;
-        }}
-
-        QPushButton:hover {{
-            background-color: {border_default};
-        }}
-
-        QPushButton:pressed {{
-            background-color: {neutral_300};
-        }}
-
-        QPushButton:disabled {{
-            background-color: {bg_secondary};
-            color: {text_disabled};
-            border-color: {bg_secondary};
-        }}
-
-        /* Primary Button */
-        QPushButton[variant="primary"] {{
-            background-color: {primary};
-            color: white;
-            border: none;
-        }}
-
-        QPushButton[variant="primary"]:hover {{
-            background-color: {self._darken(primary, 10)};
-        }}
-
-        QPushButton[variant="primary"]:pressed {{
-            background-color: {self._darken(primary, 20)};
-        }}
-
-        /* Secondary Button */
-        QPushButton[variant="secondary"] {{
-            background-color: transparent;
-            color: {primary};
-            border: 1px solid {primary};
-        }}
-
-        QPushButton[variant="secondary"]:hover {{
-            background-color: {self._lighten(primary, 90)};
-        }}
-
-        /* Danger Button */
-        QPushButton[variant="danger"] {{
-            background-color: {error};
-            color: white;
-            border: none;
-        }}
-
-        QPushButton[variant="danger"]:hover {{
-            background-color: {self._darken(error, 10)};
-        }}
-
-        /* Ghost Button */
-        QPushButton[variant="ghost"] {{
-            background-color: transparent;
-            color: {text_primary};
-            border: none;
-        }}
-
-        QPushButton[variant="ghost"]:hover {{
-            background-color: {bg_secondary};
-        }}
-
-        /* ===== Input Fields ===== */
-        QLineEdit, QTextEdit, QPlainTextEdit {{
-            background-color: {bg_primary};
-            border: 1px solid {border_default};
-            border-radius: {radius_md}px;
-            padding: {spacing_md}px;
-            selection-background-color: {primary};
-            selection-color: white;
-        }}
-
-        QLineEdit:focus, QTextEdit:focus, QPlainTextEdit:focus {{
-            border-color: {border_focus};
-        }}
-
-        QLineEdit:disabled, QTextEdit:disabled {{
-            background-color: {bg_secondary};
-            color: {text_disabled};
-        }}
-
-        QLineEdit[state="error"], QTextEdit[state="error"] {{
-            border-color: {error};
-        }}
-
-        /* ===== SpinBox ===== */
-        QSpinBox, QDoubleSpinBox {{
-            background-color: {bg_primary};
-            border: 1px solid {border_default};
-            border-radius: {radius_md}px;
-            padding: {spacing_sm}px;
-            min-height: 36px;
-        }}
-
-        QSpinBox:focus, QDoubleSpinBox:focus {{
-            border-color: {border_focus};
-        }}
-
-        QSpinBox::up-button, QDoubleSpinBox::up-button {{
-            subcontrol-origin: border;
-            subcontrol-position: top right;
-            width: 20px;
-            border: none;
-        }}
-
-        QSpinBox::down-button, QDoubleSpinBox::down-button {{
-            subcontrol-origin: border;
-            subcontrol-position: bottom right;
-            width: 20px;
-            border: none;
-        }}
-
-        /* ===== ComboBox ===== */
-        QComboBox {{
-            background-color: {bg_primary};
-            border: 1px solid {border_default};
-            border-radius: {radius_md}px;
-            padding: {spacing_md}px;
-            min-height: 36px;
-        }}
-
-        QComboBox:hover {{
-            border-color: {primary};
-        }}
-
-        QComboBox:focus {{
-            border-color: {border_focus};
-        }}
-
-        QComboBox::drop-down {{
-            border: none;
-            width: 30px;
-        }}
-
-        QComboBox::down-arrow {{
-            image: none;
-            border-left: 5px solid transparent;
-            border-right: 5px solid transparent;
-            border-top: 5px solid {text_secondary};
-            margin-right: 10px;
-        }}
-
-        QComboBox QAbstractItemView {{
-            background-color: {bg_primary};
-            border: 1px solid {border_default};
-            border-radius: {radius_md}px;
-            selection-background-color: {primary};
-            selection-color: white;
-            outline: none;
-        }}
-
-        /* ===== GroupBox (Cards) ===== */
-        QGroupBox {{
-            background-color: {bg_primary};
-            border: 1px solid {border_default};
-            border-radius: {radius_lg}px;
-            margin-top: 16px;
-            padding-top: 16px;
-            font-weight: 500;
-        }}
-
-        QGroupBox::title {{
-            subcontrol-origin: margin;
-            subcontrol-position: top left;
-            padding: 0 8px;
-            color: {text_primary};
-        }}
-
-        /* ===== Tables ===== */
-        QTableWidget, QTableView {{
-            background-color: {bg_primary};
-            border: 1px solid {border_default};
-            border-radius: {radius_md}px;
-            gridline-color: {border_default};
-            outline: none;
-        }}
-
-        QTableWidget::item, QTableView::item {{
-            padding: {spacing_md}px;
-        }}
-
-        QTableWidget::item:selected, QTableView::item:selected {{
-            background-color: {primary};
-            color: white;
-        }}
-
-        QTableWidget::item:hover, QTableView::item:hover {{
-            background-color: {bg_secondary};
-        }}
-
-        QHeaderView::section {{
-            background-color: {bg_secondary};
-            color: {text_primary};
-            padding: {spacing_md}px;
-            border: none;
-            border-bottom: 1px solid {border_default};
-            font-weight: 600;
-        }}
-
-        /* ===== Lists ===== */
-        QListWidget, QListView {{
-            background-color: {bg_primary};
-            border: 1px solid {border_default};
-            border-radius: {radius_md}px;
-            outline: none;
-        }}
-
-        QListWidget::item, QListView::item {{
-            padding: {spacing_md}px;
-        }}
-
-        QListWidget::item:selected, QListView::item:selected {{
-            background-color: {primary};
-            color: white;
-        }}
-
-        QListWidget::item:hover, QListView::item:hover {{
-            background-color: {bg_secondary};
-        }}
-
-        /* ===== Tree ===== */
-        QTreeWidget, QTreeView {{
-            background-color: {bg_primary};
-            border: 1px solid {border_default};
-            border-radius: {radius_md}px;
-            outline: none;
-        }}
-
-        QTreeWidget::item, QTreeView::item {{
-            padding: {spacing_sm}px;
-        }}
-
-        QTreeWidget::item:selected, QTreeView::item:selected {{
-            background-color: {primary};
-            color: white;
-        }}
-
-        /* ===== ScrollBar ===== */
-        QScrollBar:vertical {{
-            background-color: {bg_secondary};
-            width: 12px;
-            border-radius: 6px;
-            margin: 0;
-        }}
-
-        QScrollBar::handle:vertical {{
-            background-color: {neutral_300};
-            border-radius: 6px;
-            min-height: 30px;
-        }}
-
-        QScrollBar::handle:vertical:hover {{
-            background-color: {text_secondary};
-        }}
-
-        QScrollBar::add-line:vertical, QScrollBar::sub-line:vertical {{
-            height: 0;
-        }}
-
-        QScrollBar:horizontal {{
-            background-color: {bg_secondary};
-            height: 12px;
-            border-radius: 6px;
-            margin: 0;
-        }}
-
-        QScrollBar::handle:horizontal {{
-            background-color: {neutral_300};
-            border-radius: 6px;
-            min-width: 30px;
-        }}
-
-        QScrollBar::handle:horizontal:hover {{
-            background-color: {text_secondary};
-        }}
-
-        QScrollBar::add-line:horizontal, QScrollBar::sub-line:horizontal {{
-            width: 0;
-        }}
-
-        /* ===== Progress Bar ===== */
-        QProgressBar {{
-            background-color: {bg_secondary};
-            border: none;
-            border-radius: {radius_md}px;
-            text-align: center;
-            height: 20px;
-        }}
-
-        QProgressBar::chunk {{
-            background-color: {primary};
-            border-radius: {radius_md}px;
-        }}
-
-        /* ===== Checkbox & Radio ===== */
-        QCheckBox, QRadioButton {{
-            spacing: 8px;
-        }}
-
-        QCheckBox::indicator, QRadioButton::indicator {{
-            width: 18px;
-            height: 18px;
-            border: 2px solid {border_default};
-            background-color: {bg_primary};
-        }}
-
-        QCheckBox::indicator {{
-            border-radius: {radius_sm}px;
-        }}
-
-        QRadioButton::indicator {{
-            border-radius: 9px;
-        }}
-
-        QCheckBox::indicator:hover, QRadioButton::indicator:hover {{
-            border-color: {primary};
-        }}
-
-        QCheckBox::indicator:checked, QRadioButton::indicator:checked {{
-            background-color: {primary};
-            border-color: {primary};
-        }}
-
-        QCheckBox::indicator:disabled, QRadioButton::indicator:disabled {{
-            border-color: {bg_tertiary};
-            background-color: {bg_secondary};
-        }}
-
-        /* ===== Slider ===== */
-        QSlider::groove:horizontal {{
-            border: none;
-            height: 6px;
-            background-color: {bg_secondary};
-            border-radius: 3px;
-        }}
-
-        QSlider::handle:horizontal {{
-            background-color: {primary};
-            border: none;
-            width: 16px;
-            height: 16px;
-            margin: -5px 0;
-            border-radius: 8px;
-        }}
-
-        QSlider::handle:horizontal:hover {{
-            background-color: {self._darken(primary, 10)};
-        }}
-
-        /* ===== Tab Widget ===== */
-        QTabWidget::pane {{
-            border: 1px solid {border_default};
-            border-radius: {radius_md}px;
-            background-color: {bg_primary};
-            top: -1px;
-        }}
-
-        QTabBar::tab {{
-            background-color: {bg_secondary};
-            padding: {spacing_md}px {spacing_md * 2}px;
-            border: 1px solid {border_default};
-            border-bottom: none;
-            border-top-left-radius: {radius_md}px;
-            border-top-right-radius: {radius_md}px;
-        }}
-
-        QTabBar::tab:selected {{
-            background-color: {bg_primary};
-            border-bottom: 2px solid {primary};
-        }}
-
-        QTabBar::tab:hover:!selected {{
-            background-color: {bg_tertiary};
-        }}
-
-        /* ===== Menu ===== */
-        QMenuBar {{
-            background-color: {bg_primary};
-            border-bottom: 1px solid {border_default};
-            padding: 4px;
-        }}
-
-        QMenuBar::item {{
-            padding: {spacing_sm}px {spacing_md}px;
-            border-radius: {radius_sm}px;
-        }}
-
-        QMenuBar::item:selected {{
-            background-color: {bg_secondary};
-        }}
-
-        QMenu {{
-            background-color: {bg_primary};
-            border: 1px solid {border_default};
-            border-radius: {radius_md}px;
-            padding: {spacing_sm}px;
-        }}
-
-        QMenu::item {{
-            padding: {spacing_md}px {spacing_lg}px;
-            border-radius: {radius_sm}px;
-        }}
-
-        QMenu::item:selected {{
-            background-color: {primary};
-            color: white;
-        }}
-
-        QMenu::separator {{
-            height: 1px;
-            background-color: {border_default};
-            margin: {spacing_sm}px 0;
-        }}
-
-        /* ===== ToolTip ===== */
-        QToolTip {{
-            background-color: {neutral_800};
-            color: white;
-            border: none;
-            border-radius: {radius_sm}px;
-            padding: {spacing_sm}px;
-            font-size: {font_sm}px;
-        }}
-
-        /* ===== StatusBar ===== */
-        QStatusBar {{
-            background-color: {bg_secondary};
-            border-top: 1px solid {border_default};
-        }}
-
-        QStatusBar::item {{
-            border: none;
-        }}
-
-        /* ===== ToolBar ===== */
-        QToolBar {{
-            background-color: {bg_primary};
-            border-bottom: 1px solid {border_default};
-            padding: {spacing_sm}px;
-            spacing: {spacing_sm}px;
-        }}
-
-        QToolBar::separator {{
-            width: 1px;
-            background-color: {border_default};
-            margin: {spacing_sm}px;
-        }}
-
-        QToolButton {{
-            background-color: transparent;
-            border: none;
-            border-radius: {radius_sm}px;
-            padding: {spacing_sm}px;
-        }}
-
-        QToolButton:hover {{
-            background-color: {bg_secondary};
-        }}
-
-        QToolButton:pressed {{
-            background-color: {neutral_300};
-        }}
-
-        /* ===== Dock Widget ===== */
-        QDockWidget {{
-            titlebar-close-icon: none;
-            titlebar-normal-icon: none;
-        }}
-
-        QDockWidget::title {{
-            background-color: {bg_secondary};
-            padding: {spacing_md}px;
-            border-bottom: 1px solid {border_default};
-        }}
-
-        /* ===== Splitter ===== */
-        QSplitter::handle {{
-            background-color: {border_default};
-        }}
-
-        QSplitter::handle:horizontal {{
-            width: 2px;
-        }}
-
-        QSplitter::handle:vertical {{
-            height: 2px;
-        }}
-
-        QSplitter::handle:hover {{
-            background-color: {primary};
-        }}
-        """
+        return dict(
+            font_family=font_family,
+            font_base=font_base,
+            text_primary=text_primary,
+            bg_primary=bg_primary,
+            font_xl=font_xl,
+            font_lg=font_lg,
+            font_sm=font_sm,
+            text_secondary=text_secondary,
+            success=success,
+            warning=warning,
+            error=error,
+            bg_secondary=bg_secondary,
+            border_default=border_default,
+            radius_md=radius_md,
+            spacing_md=spacing_md,
+            spacing_md_2x=spacing_md * 2,
+            neutral_300=neutral_300,
+            text_disabled=text_disabled,
+            primary=primary,
+            primary_d10=primary_d10,
+            primary_d20=primary_d20,
+            primary_l90=primary_l90,
+            error_d10=error_d10,
+            border_focus=border_focus,
+            spacing_sm=spacing_sm,
+            radius_lg=radius_lg,
+            radius_sm=radius_sm,
+            bg_tertiary=bg_tertiary,
+            spacing_lg=spacing_lg,
+            neutral_800=neutral_800,
+        )
 
     def _darken(self, hex_color: str, percent: int) -> str:
         """Darken a color.
@@ -682,11 +458,7 @@ class ThemeManager:
         Returns:
             Darkened color code
         """
-        hex_color = hex_color.lstrip("#")
-        r = max(0, int(int(hex_color[0:2], 16) * (100 - percent) / 100))
-        g = max(0, int(int(hex_color[2:4], 16) * (100 - percent) / 100))
-        b = max(0, int(int(hex_color[4:6], 16) * (100 - percent) / 100))
-        return f"#{r:02x}{g:02x}{b:02x}"
+        return _shade_color(hex_color, percent)
 
     def _lighten(self, hex_color: str, percent: int) -> str:
         """Lighten a color.
@@ -698,11 +470,7 @@ class ThemeManager:
         Returns:
             Lightened color code
         """
-        hex_color = hex_color.lstrip("#")
-        r = min(255, int(int(hex_color[0:2], 16) + (255 - int(hex_color[0:2], 16)) * percent / 100))
-        g = min(255, int(int(hex_color[2:4], 16) + (255 - int(hex_color[2:4], 16)) * percent / 100))
-        b = min(255, int(int(hex_color[4:6], 16) + (255 - int(hex_color[4:6], 16)) * percent / 100))
-        return f"#{r:02x}{g:02x}{b:02x}"
+        return _shade_color(hex_color, -percent)
 
     def apply_to_app(self, app: QApplication) -> None:
         """Apply the theme to the application.
@@ -710,17 +478,40 @@ class ThemeManager:
         Args:
             app: QApplication instance
         """
-        app.setStyleSheet(self._qss_cache)
+        # Fusion draws the base chrome the same on every platform, so the
+        # sheet only has to carry the themed rules. Once a sheet is set,
+        # app.style() is Qt's style-sheet proxy, so only check before that.
+        if not app.styleSheet() and app.style().name().lower() != "fusion":
+            app.setStyle("Fusion")
+
+        # Re-setting an identical sheet would still re-polish every widget
+        qss = self._ensure_qss()
+        if app.styleSheet() != qss:
+            app.setStyleSheet(qss)
+
+    def apply_to_window(self, window: QWidget) -> None:
+        """Apply the theme to one top-level window and its children only.
+
+        Args:
+            window: Top-level widget to style
+        """
+        qss = self._ensure_qss()
+        if window.styleSheet() != qss:
+            window.setStyleSheet(qss)
 
     @property
     def qss(self) -> str:
-        """Return the generated QSS."""
-        return self._qss_cache
+        """Return the generated QSS, building it on first access."""
+        return self._ensure_qss()
 
     @property
-    def data(self) -> dict:
-        """Return the raw theme data."""
-        return self._theme_data
+    def data(self) -> Mapping:
+        """Return a view of the raw theme data, read-only at the top level.
+
+        Nested sections (colors, typography, ...) are the live dicts; change
+        them only through update_color(), which also invalidates the QSS.
+        """
+        return self._data_view
 
 
 # Singleton instance
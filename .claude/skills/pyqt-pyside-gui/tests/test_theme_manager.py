@@ -0,0 +1,45 @@
+"""
+ThemeManager template tests
+
+Every bundled theme must load and render to QSS through the reference
+ThemeManager.
+
+Usage:
+    python -m pytest tests/test_theme_manager.py
+"""
+
+import os
+import sys
+from pathlib import Path
+
+import pytest
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+pytest.importorskip("PySide6")
+
+SKILL_DIR = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(SKILL_DIR / "references"))
+
+from theme_manager_template import ThemeManager  # noqa: E402
+
+THEME_FILES = sorted((SKILL_DIR / "ui_components" / "themes").glob("*.json"))
+
+
+@pytest.fixture(autouse=True)
+def isolated_cache(tmp_path, monkeypatch):
+    """Keep generated QSS caches out of the real home directory."""
+    monkeypatch.setattr("theme_manager_template._QSS_CACHE_DIR", tmp_path)
+
+
+def test_bundled_themes_found():
+    assert THEME_FILES
+
+
+@pytest.mark.parametrize("theme_file", THEME_FILES, ids=lambda p: p.name)
+def test_bundled_theme_renders_qss(theme_file):
+    manager = ThemeManager()
+    manager.load_theme(str(theme_file))
+
+    qss = manager.qss
+    assert "QPushButton" in qss
+    assert "{" in qss and "}" in qss
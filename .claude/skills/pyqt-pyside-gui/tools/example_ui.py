@@ -32,15 +32,10 @@ class ExampleWindow(QMainWindow):
         layout.setContentsMargins(20, 20, 20, 20)
 
         # Title label
+        # Styled by the QLabel[variant="title"] rule of the app-wide
+        # ThemeManager sheet applied in __main__
         self.title_label = QLabel("Example UI Window")
-        self.title_label.setStyleSheet("""
-            QLabel {
-                font-size: 24px;
-                font-weight: bold;
-                color: #3ECF8E;
-                padding: 10px;
-            }
-        """)
+        self.title_label.setProperty("variant", "title")
         layout.addWidget(self.title_label)
 
         # Form section
@@ -107,12 +102,13 @@ class ExampleWindow(QMainWindow):
         widget = QWidget()
         layout = QHBoxLayout(widget)
 
-        # Submit button with hardcoded color (bad practice!)
+        # Variant properties select the theme's button rules, so no
+        # per-widget stylesheet has to be parsed
         self.submit_button = QPushButton("Submit")
-        self.submit_button.setStyleSheet("background-color: #3498db; color: white;")
+        self.submit_button.setProperty("variant", "primary")
         layout.addWidget(self.submit_button)
 
-        # Cancel button
+        # Cancel button with hardcoded color (bad practice!)
         self.cancel_button = QPushButton("Cancel")
         self.cancel_button.setStyleSheet("background-color: #e74c3c; color: white;")
         layout.addWidget(self.cancel_button)
@@ -140,9 +136,21 @@ class ExampleWindow(QMainWindow):
 
 if __name__ == "__main__":
     import sys
+    from pathlib import Path
     from PySide6.QtWidgets import QApplication
 
+    # The skill's ThemeManager template and sample theme live in references/
+    references = Path(__file__).resolve().parent.parent / "references"
+    sys.path.insert(0, str(references))
+    from theme_manager_template import ThemeManager
+
     app = QApplication(sys.argv)
+
+    # One app-wide sheet, applied once, styles every variant-tagged widget
+    theme = ThemeManager()
+    theme.load_theme(str(references / "theme_template.json"))
+    theme.apply_to_app(app)
+
     window = ExampleWindow()
     window.show()
     sys.exit(app.exec())
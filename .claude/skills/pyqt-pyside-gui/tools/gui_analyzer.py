@@ -23,18 +23,124 @@ Features:
 """
 
 import ast
+import hashlib
+import os
+import pickle
 import re
 import sys
 import json
 from pathlib import Path
 from typing import Dict, List, Optional, Tuple
-from dataclasses import dataclass, field
+from dataclasses import dataclass, field, fields
+from bisect import bisect_right
+from functools import cached_property
 from datetime import datetime
-from collections import defaultdict
-from itertools import combinations
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+from itertools import combinations, groupby, islice
+from operator import itemgetter
+
+# NumPy vectorizes the geometry passes when installed; plain Python otherwise
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+# Numba compiles the overlap scan for UIs too large for a NumPy mask
+try:
+    import numba
+except ImportError:
+    numba = None
+
+# xxhash keys the result cache faster than hashlib when installed
+try:
+    import xxhash
+except ImportError:
+    xxhash = None
+
+# orjson serializes the --json output faster when installed
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# pyahocorasick finds all best-practice tokens in one pass when installed
+try:
+    import ahocorasick
+except ImportError:
+    ahocorasick = None
+
+
+# On-disk cache of results pickled as plain dicts, keyed by file content.
+# Bump CACHE_VERSION whenever the analysis logic changes its results.
+CACHE_VERSION = 6
+_CACHE_DIR = Path.home() / '.cache' / 'gui_analyzer'
+_CACHE_MAX_BYTES = 64 * 1024 * 1024
+_INDEX_FILE = _CACHE_DIR / 'index.json'
+
+# Above this many widgets the N x N overlap mask costs more memory than the
+# sweep line costs time
+_NP_PAIRWISE_MAX = 2000
+
+# From this many widgets the pure-Python overlap search buckets widgets into
+# a uniform grid; below it the x sweep is cheaper to set up
+_GRID_MIN_WIDGETS = 256
+
+
+def _content_key(data: bytes) -> str:
+    """Return the result-cache key for file content."""
+    if xxhash is not None:
+        digest = xxhash.xxh3_64_hexdigest(data)
+    else:
+        digest = hashlib.blake2b(data, digest_size=8).hexdigest()
+    return f"{CACHE_VERSION}-{digest}"
+
+
+if numba is not None:
+    @numba.njit(cache=True)
+    def _overlap_pairs_jit(x, y, w, h):
+        """Compiled all-pairs overlap scan returning sorted (i, j) pairs and
+        their intersection areas."""
+        pairs = []
+        areas = []
+        n = x.shape[0]
+        for i in range(n):
+            xi, yi, wi, hi = x[i], y[i], w[i], h[i]
+            for j in range(i + 1, n):
+                if not (xi + wi < x[j] or x[j] + w[j] < xi or
+                        yi + hi < y[j] or y[j] + h[j] < yi):
+                    pairs.append((i, j))
+                    overlap_w = min(xi + wi, x[j] + w[j]) - max(xi, x[j])
+                    overlap_h = min(yi + hi, y[j] + h[j]) - max(yi, y[j])
+                    areas.append(max(overlap_w, 0) * max(overlap_h, 0))
+        return pairs, areas
+else:
+    _overlap_pairs_jit = None
+
+
+# Slotted dataclasses (3.10+) drop the per-instance __dict__; 3.9 keeps plain ones
+_DATACLASS_OPTIONS = {'slots': True} if sys.version_info >= (3, 10) else {}
+
+
+def _json_dumps(obj) -> str:
+    """Serialize --json output with two-space indentation."""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2).decode('utf-8')
+    return json.dumps(obj, indent=2, ensure_ascii=False)
+
+
+def _build_automaton(tokens):
+    """Build an Aho-Corasick automaton matching tokens, or None without pyahocorasick."""
+    if ahocorasick is None:
+        return None
+    automaton = ahocorasick.Automaton()
+    for token in tokens:
+        automaton.add_word(token, token)
+    automaton.make_automaton()
+    return automaton
 
 
-@dataclass
+@dataclass(**_DATACLASS_OPTIONS)
 class WidgetInfo:
     """Information about a widget."""
     name: str
@@ -52,58 +158,158 @@ class WidgetInfo:
     line_number: int = 0
 
 
-@dataclass
+@dataclass(**_DATACLASS_OPTIONS)
 class AnalysisResult:
-    """Complete analysis result."""
+    """Complete analysis result.
+
+    The advanced layout sections (alignment_analysis, layout_suggestions,
+    z_order_analysis) are computed by the analyzer on first access.
+    """
     file_path: str
     widgets: Dict[str, WidgetInfo]
     widget_tree: Dict[str, List[str]]
     issues: List[Dict[str, any]]
     statistics: Dict[str, any]
     best_practices: Dict[str, bool]
-    alignment_analysis: Dict[str, any] = field(default_factory=dict)
-    layout_suggestions: List[Dict[str, any]] = field(default_factory=list)
-    z_order_analysis: List[Dict[str, any]] = field(default_factory=list)
     timestamp: str = field(default_factory=lambda: datetime.now().isoformat())
+    _analyzer: Optional["GUICodeAnalyzer"] = field(default=None, repr=False, compare=False)
+    _alignment_analysis: Optional[Dict[str, any]] = field(default=None, repr=False)
+    _layout_suggestions: Optional[List[Dict[str, any]]] = field(default=None, repr=False)
+    _z_order_analysis: Optional[List[Dict[str, any]]] = field(default=None, repr=False)
+
+    @property
+    def alignment_analysis(self) -> Dict[str, any]:
+        """X/Y alignment groups, spacing analysis and suggestions."""
+        if self._alignment_analysis is None:
+            self._alignment_analysis = self._analyzer._analyze_alignment() if self._analyzer else {}
+        return self._alignment_analysis
+
+    @property
+    def layout_suggestions(self) -> List[Dict[str, any]]:
+        """Layout manager suggestions for manually positioned widgets."""
+        if self._layout_suggestions is None:
+            self._layout_suggestions = self._analyzer._generate_layout_suggestions() if self._analyzer else []
+        return self._layout_suggestions
+
+    @property
+    def z_order_analysis(self) -> List[Dict[str, any]]:
+        """Overlapping widget pairs and which one is drawn on top."""
+        if self._z_order_analysis is None:
+            self._z_order_analysis = self._analyzer._analyze_z_order() if self._analyzer else []
+        return self._z_order_analysis
+
+    def resolve(self) -> "AnalysisResult":
+        """Compute every lazy section and release the analyzer."""
+        self.alignment_analysis, self.layout_suggestions, self.z_order_analysis
+        self._analyzer = None
+        return self
+
+
+def _result_to_dict(result: AnalysisResult) -> Dict[str, any]:
+    """Flatten a resolved result into builtins for the result cache.
+
+    Only builtins are pickled, so an entry loads no matter which module
+    name (gui_analyzer, tools.gui_analyzer, __main__) wrote it.
+    """
+    return {
+        'widgets': {name: {f.name: getattr(w, f.name) for f in fields(WidgetInfo)}
+                    for name, w in result.widgets.items()},
+        'widget_tree': result.widget_tree,
+        'issues': result.issues,
+        'statistics': result.statistics,
+        'best_practices': result.best_practices,
+        'alignment_analysis': result.alignment_analysis,
+        'layout_suggestions': result.layout_suggestions,
+        'z_order_analysis': result.z_order_analysis,
+    }
+
+
+def _result_from_dict(data: Dict[str, any]) -> AnalysisResult:
+    """Rebuild a result stored by _result_to_dict."""
+    return AnalysisResult(
+        file_path='',
+        widgets={name: WidgetInfo(**w) for name, w in data['widgets'].items()},
+        widget_tree=data['widget_tree'],
+        issues=data['issues'],
+        statistics=data['statistics'],
+        best_practices=data['best_practices'],
+        _alignment_analysis=data['alignment_analysis'],
+        _layout_suggestions=data['layout_suggestions'],
+        _z_order_analysis=data['z_order_analysis'],
+    )
 
 
 class GUICodeAnalyzer:
     """Analyzes PySide6/PyQt6 UI code files."""
 
-    def __init__(self, file_path: str):
+    # Hex colors flagged by the hardcoded-color check (matched on the raw
+    # bytes, so match offsets index the line table directly)
+    _COLOR_RE = re.compile(rb'#[0-9A-Fa-f]{6}')
+
+    # Substrings tested by _validate_best_practices (the lower set is
+    # matched against the lowercased file)
+    _BP_TOKENS = frozenset({
+        'get_theme()', 'ThemedCard', 'ThemedLabel', 'ThemedButton',
+        'setObjectName', '"""', "'''", 'Signal(', '@Slot', '.connect(',
+        'QThread', 'Worker(', 'ViewModel',
+        'QVBoxLayout', 'QHBoxLayout', 'QGridLayout', 'QFormLayout', 'QStackedLayout',
+        'addStretch', 'QSpacerItem', 'closeEvent',
+        'parent=', ', self)', 'from PySide6', 'import PySide6',
+        'from PyQt6', 'import PyQt6', 'lambda:', 'lambda ',
+        'from functools import partial', 'partial(',
+        'time.sleep', 'requests.get', 'urllib.request', ':/', 'QIcon',
+    })
+    _BP_LOWER_TOKENS = frozenset({'viewmodel', 'controller'})
+    _BP_AUTOMATON = _build_automaton(_BP_TOKENS)
+    _BP_LOWER_AUTOMATON = _build_automaton(_BP_LOWER_TOKENS)
+
+    # Qt widget types to detect
+    QT_WIDGETS = frozenset({
+        'QMainWindow', 'QWidget', 'QDialog', 'QLabel', 'QPushButton',
+        'QLineEdit', 'QTextEdit', 'QComboBox', 'QCheckBox', 'QRadioButton',
+        'QSpinBox', 'QDoubleSpinBox', 'QSlider', 'QProgressBar',
+        'QListWidget', 'QTreeWidget', 'QTableWidget', 'QTabWidget',
+        'QGroupBox', 'QFrame', 'QScrollArea', 'QSplitter',
+        'QMenuBar', 'QToolBar', 'QStatusBar', 'QDockWidget',
+        'QVBoxLayout', 'QHBoxLayout', 'QGridLayout', 'QFormLayout',
+        'ThemedCard', 'ThemedLabel', 'ThemedButton', 'InfoCard',
+        'StatusIndicator', 'StatBadge', 'LotDisplayCard', 'StatsCard'
+    })
+
+    # Layout types
+    LAYOUT_TYPES = frozenset({
+        'QVBoxLayout', 'QHBoxLayout', 'QGridLayout', 'QFormLayout',
+        'QStackedLayout'
+    })
+
+    def __init__(self, file_path: str, grid_cell_size: Optional[int] = None):
         self.file_path = Path(file_path)
-        self.content = ""
+        # Cell size of the overlap grid; None sizes it from the widgets
+        self.grid_cell_size = grid_cell_size
+        self._bytes = b""
+        self.cache_key: Optional[str] = None
         self.tree = None
         self.widgets: Dict[str, WidgetInfo] = {}
         self.current_class = None
         self.issues: List[Dict[str, any]] = []
 
-        # Qt widget types to detect
-        self.qt_widgets = {
-            'QMainWindow', 'QWidget', 'QDialog', 'QLabel', 'QPushButton',
-            'QLineEdit', 'QTextEdit', 'QComboBox', 'QCheckBox', 'QRadioButton',
-            'QSpinBox', 'QDoubleSpinBox', 'QSlider', 'QProgressBar',
-            'QListWidget', 'QTreeWidget', 'QTableWidget', 'QTabWidget',
-            'QGroupBox', 'QFrame', 'QScrollArea', 'QSplitter',
-            'QMenuBar', 'QToolBar', 'QStatusBar', 'QDockWidget',
-            'QVBoxLayout', 'QHBoxLayout', 'QGridLayout', 'QFormLayout',
-            'ThemedCard', 'ThemedLabel', 'ThemedButton', 'InfoCard',
-            'StatusIndicator', 'StatBadge', 'LotDisplayCard', 'StatsCard'
-        }
-
-        # Layout types
-        self.layout_types = {
-            'QVBoxLayout', 'QHBoxLayout', 'QGridLayout', 'QFormLayout',
-            'QStackedLayout'
-        }
-
     def analyze(self) -> AnalysisResult:
         """Perform complete analysis."""
-        print(f"🔍 Analyzing: {self.file_path}")
+        print(f"🔍 Analyzing: {self.file_path}", file=sys.stderr)
 
         # Load file
         self._load_file()
 
+        # Unchanged content: reuse the stored result
+        use_cache = not os.environ.get('GUI_ANALYZER_NOCACHE')
+        if use_cache:
+            self.cache_key = _content_key(self._bytes)
+            cache_file = _CACHE_DIR / f"{self.cache_key}.pkl"
+            result = self._load_cached_result(cache_file)
+            if result is not None:
+                print(f"✅ Analysis complete: {len(self.widgets)} widgets, {len(self.issues)} issues (cached)", file=sys.stderr)
+                return result
+
         # Parse AST
         self._parse_ast()
 
@@ -122,11 +328,7 @@ class GUICodeAnalyzer:
         # Generate statistics
         stats = self._generate_statistics()
 
-        # NEW: Advanced layout analysis
-        alignment_analysis = self._analyze_alignment()
-        layout_suggestions = self._generate_layout_suggestions()
-        z_order_analysis = self._analyze_z_order()
-
+        # Advanced layout analysis runs when the result first asks for it
         result = AnalysisResult(
             file_path=str(self.file_path),
             widgets=self.widgets,
@@ -134,62 +336,103 @@ class GUICodeAnalyzer:
             issues=self.issues,
             statistics=stats,
             best_practices=best_practices,
-            alignment_analysis=alignment_analysis,
-            layout_suggestions=layout_suggestions,
-            z_order_analysis=z_order_analysis
+            _analyzer=self
         )
 
-        print(f"✅ Analysis complete: {len(self.widgets)} widgets, {len(self.issues)} issues")
+        if use_cache:
+            # Cached results must be complete, since no analyzer comes back with them
+            result.resolve()
+            self._store_cached_result(cache_file, result)
+
+        print(f"✅ Analysis complete: {len(self.widgets)} widgets, {len(self.issues)} issues", file=sys.stderr)
+        return result
+
+    def _load_cached_result(self, cache_file: Path) -> Optional[AnalysisResult]:
+        """Load a cached result for this file, or None on a miss."""
+        try:
+            with open(cache_file, 'rb') as f:
+                data = pickle.load(f)
+            result = _result_from_dict(data)
+            # Mark as recently used for the LRU eviction
+            os.utime(cache_file)
+        except FileNotFoundError:
+            return None
+        except Exception:
+            # Unreadable or foreign entry: a miss, and drop it so it isn't retried
+            try:
+                cache_file.unlink()
+            except OSError:
+                pass
+            return None
+
+        # Same content may live at another path, and the run time is now
+        result.file_path = str(self.file_path)
+        result.timestamp = datetime.now().isoformat()
+        self.widgets = result.widgets
+        self.issues = result.issues
         return result
 
+    def _store_cached_result(self, cache_file: Path, result: AnalysisResult):
+        """Store a result and evict least recently used entries over the size cap."""
+        try:
+            _CACHE_DIR.mkdir(parents=True, exist_ok=True)
+            tmp_file = cache_file.with_suffix(f'.{os.getpid()}.tmp')
+            with open(tmp_file, 'wb') as f:
+                pickle.dump(_result_to_dict(result), f, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(tmp_file, cache_file)
+
+            entries = [(e.stat().st_mtime, e.stat().st_size, e) for e in _CACHE_DIR.glob('*.pkl')]
+            total = sum(size for _, size, _ in entries)
+            for _, size, entry in sorted(entries, key=lambda e: e[0]):
+                if total <= _CACHE_MAX_BYTES:
+                    break
+                entry.unlink()
+                total -= size
+        except OSError:
+            # Read-only home or full disk: the cache is only an optimization
+            pass
+
     def _load_file(self):
         """Load Python file."""
         if not self.file_path.exists():
             raise FileNotFoundError(f"File not found: {self.file_path}")
 
-        with open(self.file_path, 'r', encoding='utf-8') as f:
-            self.content = f.read()
+        # Raw bytes in few large reads; decoding waits until text is needed
+        with open(self.file_path, 'rb', buffering=128 * 1024) as f:
+            self._bytes = f.read()
+
+    @cached_property
+    def _line_starts(self):
+        """Byte offset of the start of every line, built once on first use."""
+        if np is not None:
+            newlines = np.flatnonzero(np.frombuffer(self._bytes, dtype=np.uint8) == 10)
+            return np.concatenate(([0], newlines + 1))
+        return [0] + [m.end() for m in re.finditer(b'\n', self._bytes)]
+
+    def _offset_to_line_col(self, offset: int) -> Tuple[int, int]:
+        """Map a byte offset in the file to a 1-based line and 0-based column."""
+        if np is not None:
+            index = int(np.searchsorted(self._line_starts, offset, side='right')) - 1
+        else:
+            index = bisect_right(self._line_starts, offset) - 1
+        return index + 1, offset - int(self._line_starts[index])
+
+    @cached_property
+    def content(self) -> str:
+        """Decoded file source, decoded once on first use."""
+        return self._bytes.decode('utf-8')
 
     def _parse_ast(self):
         """Parse file into AST."""
         try:
-            self.tree = ast.parse(self.content)
+            # ast.parse takes bytes and honours any coding declaration
+            self.tree = ast.parse(self._bytes, filename=str(self.file_path))
         except SyntaxError as e:
             raise SyntaxError(f"Failed to parse {self.file_path}: {e}")
 
     def _extract_widgets(self):
-        """Extract widget information from AST."""
-        for node in ast.walk(self.tree):
-            if isinstance(node, ast.ClassDef):
-                self.current_class = node.name
-                self._analyze_class(node)
-
-    def _analyze_class(self, class_node: ast.ClassDef):
-        """Analyze a class definition."""
-        # Check if it's a Qt widget class
-        is_qt_class = any(
-            base.id in self.qt_widgets if isinstance(base, ast.Name) else False
-            for base in class_node.bases
-        )
-
-        if not is_qt_class:
-            return
-
-        # Analyze methods
-        for node in class_node.body:
-            if isinstance(node, ast.FunctionDef):
-                self._analyze_method(node)
-
-    def _analyze_method(self, method_node: ast.FunctionDef):
-        """Analyze a method for widget creation."""
-        for node in ast.walk(method_node):
-            # Detect widget assignment: self.widget = QWidget()
-            if isinstance(node, ast.Assign):
-                self._analyze_assignment(node)
-
-            # Detect method calls: widget.setGeometry(...)
-            elif isinstance(node, ast.Call):
-                self._analyze_method_call(node)
+        """Extract widget information from AST in a single pass."""
+        _WidgetVisitor(self).visit(self.tree)
 
     def _analyze_assignment(self, assign_node: ast.Assign):
         """Analyze assignment for widget creation."""
@@ -205,7 +448,7 @@ class GUICodeAnalyzer:
         else:
             return
 
-        if widget_type not in self.qt_widgets:
+        if widget_type not in self.QT_WIDGETS:
             return
 
         # Get variable name
@@ -230,97 +473,111 @@ class GUICodeAnalyzer:
 
     def _analyze_method_call(self, call_node: ast.Call):
         """Analyze method calls for property setting."""
-        if not isinstance(call_node.func, ast.Attribute):
+        func = call_node.func
+        if not isinstance(func, ast.Attribute):
             return
 
-        method_name = call_node.func.attr
+        # Most calls are not setters; reject them before the widget lookup
+        handler = self._SETTER_HANDLERS.get(func.attr)
+        if handler is None:
+            return
 
         # Get widget name
-        if isinstance(call_node.func.value, ast.Attribute):
-            widget_name = call_node.func.value.attr
-        else:
+        if not isinstance(func.value, ast.Attribute):
             return
-
-        if widget_name not in self.widgets:
+        widget = self.widgets.get(func.value.attr)
+        if widget is None:
             return
 
-        widget = self.widgets[widget_name]
-
         # Extract property based on method name
-        if method_name == 'setGeometry' and len(call_node.args) >= 4:
-            try:
-                x = self._get_constant_value(call_node.args[0])
-                y = self._get_constant_value(call_node.args[1])
-                w = self._get_constant_value(call_node.args[2])
-                h = self._get_constant_value(call_node.args[3])
-                widget.geometry = (x, y, w, h)
-            except:
-                pass
+        handler(self, widget, call_node.args)
 
-        elif method_name == 'setMinimumSize' and len(call_node.args) >= 2:
-            try:
-                w = self._get_constant_value(call_node.args[0])
-                h = self._get_constant_value(call_node.args[1])
-                widget.properties['min_size'] = (w, h)
-            except:
-                pass
+    def _set_geometry(self, widget: WidgetInfo, args: List[ast.expr]):
+        """Record setGeometry(x, y, w, h)."""
+        if len(args) < 4:
+            return
+        value = self._constant_value
+        x, y, w, h = value(args[0]), value(args[1]), value(args[2]), value(args[3])
+        if x is None or y is None or w is None or h is None:
+            return
+        widget.geometry = (x, y, w, h)
 
-        elif method_name == 'setMaximumSize' and len(call_node.args) >= 2:
-            try:
-                w = self._get_constant_value(call_node.args[0])
-                h = self._get_constant_value(call_node.args[1])
-                widget.properties['max_size'] = (w, h)
-            except:
-                pass
+    def _set_minimum_size(self, widget: WidgetInfo, args: List[ast.expr]):
+        """Record setMinimumSize(w, h)."""
+        if len(args) < 2:
+            return
+        w, h = self._constant_value(args[0]), self._constant_value(args[1])
+        if w is None or h is None:
+            return
+        widget.properties['min_size'] = (w, h)
 
-        elif method_name == 'setStyleSheet' and len(call_node.args) >= 1:
-            try:
-                stylesheet = self._get_constant_value(call_node.args[0])
+    def _set_maximum_size(self, widget: WidgetInfo, args: List[ast.expr]):
+        """Record setMaximumSize(w, h)."""
+        if len(args) < 2:
+            return
+        w, h = self._constant_value(args[0]), self._constant_value(args[1])
+        if w is None or h is None:
+            return
+        widget.properties['max_size'] = (w, h)
+
+    def _set_stylesheet(self, widget: WidgetInfo, args: List[ast.expr]):
+        """Record setStyleSheet(text)."""
+        if args:
+            stylesheet = self._constant_value(args[0])
+            if stylesheet is not None:
                 widget.stylesheet = stylesheet
-            except:
-                pass
 
-        elif method_name == 'setVisible' and len(call_node.args) >= 1:
-            try:
-                visible = self._get_constant_value(call_node.args[0])
+    def _set_visible(self, widget: WidgetInfo, args: List[ast.expr]):
+        """Record setVisible(flag)."""
+        if args:
+            visible = self._constant_value(args[0])
+            if visible is not None:
                 widget.visible = visible
-            except:
-                pass
 
-        elif method_name == 'setEnabled' and len(call_node.args) >= 1:
-            try:
-                enabled = self._get_constant_value(call_node.args[0])
+    def _set_enabled(self, widget: WidgetInfo, args: List[ast.expr]):
+        """Record setEnabled(flag)."""
+        if args:
+            enabled = self._constant_value(args[0])
+            if enabled is not None:
                 widget.enabled = enabled
-            except:
-                pass
 
-        elif method_name == 'setLayout' and len(call_node.args) >= 1:
-            # Detect layout assignment
-            if isinstance(call_node.args[0], ast.Name):
-                layout_var = call_node.args[0].id
-                # Try to find layout type from previous assignments
-                widget.layout_type = "Layout (detected)"
-
-        elif method_name == 'addWidget' and len(call_node.args) >= 1:
-            # Detect parent-child relationship through layout.addWidget
-            if isinstance(call_node.args[0], ast.Attribute):
-                child_name = call_node.args[0].attr
-                if child_name in self.widgets:
-                    self.widgets[child_name].parent = widget_name
-                    widget.children.append(child_name)
-
-    def _get_constant_value(self, node):
-        """Extract constant value from AST node."""
+    def _set_layout(self, widget: WidgetInfo, args: List[ast.expr]):
+        """Record setLayout(layout)."""
+        # Detect layout assignment
+        if args and isinstance(args[0], ast.Name):
+            widget.layout_type = "Layout (detected)"
+
+    def _add_widget(self, widget: WidgetInfo, args: List[ast.expr]):
+        """Record addWidget(child) as a parent-child link."""
+        # Detect parent-child relationship through layout.addWidget
+        if args and isinstance(args[0], ast.Attribute):
+            child_name = args[0].attr
+            if child_name in self.widgets:
+                self.widgets[child_name].parent = widget.name
+                widget.children.append(child_name)
+
+    # Setter method name -> handler(self, widget, args), one lookup per call
+    _SETTER_HANDLERS = {
+        'setGeometry': _set_geometry,
+        'setMinimumSize': _set_minimum_size,
+        'setMaximumSize': _set_maximum_size,
+        'setStyleSheet': _set_stylesheet,
+        'setVisible': _set_visible,
+        'setEnabled': _set_enabled,
+        'setLayout': _set_layout,
+        'addWidget': _add_widget,
+    }
+
+    def _constant_value(self, node):
+        """Extract constant value from AST node, or None if it is not a constant."""
         if isinstance(node, ast.Constant):
             return node.value
-        elif isinstance(node, ast.Num):
-            return node.n
-        elif isinstance(node, ast.Str):
-            return node.s
-        elif isinstance(node, ast.NameConstant):
-            return node.value
-        else:
-            raise ValueError("Not a constant")
+        # Negative literals such as setGeometry(-5, ...) parse as USub(Constant)
+        if (isinstance(node, ast.UnaryOp) and isinstance(node.op, ast.USub)
+                and isinstance(node.operand, ast.Constant)
+                and isinstance(node.operand.value, (int, float))):
+            return -node.operand.value
+        return None
 
     def _build_widget_tree(self) -> Dict[str, List[str]]:
         """Build widget tree structure."""
@@ -385,41 +642,206 @@ class GUICodeAnalyzer:
                 })
                 widget.issues.append("Hidden by setVisible(False)")
 
+    @cached_property
+    def _has_geometry(self) -> bool:
+        """Whether any widget can have a geometry; only setGeometry sets one."""
+        return b'setGeometry' in self._bytes
+
+    @cached_property
+    def _geo_widgets(self) -> List[WidgetInfo]:
+        """Widgets with a geometry, in extraction order."""
+        if not self._has_geometry:
+            # Layout-only file: every geometry pass sees no widgets
+            return []
+        return [w for w in self.widgets.values() if w.geometry is not None]
+
+    @cached_property
+    def _geo_arrays(self):
+        """Geometry as structure-of-arrays: (x, y, w, h) arrays aligned with
+        _geo_widgets, or None without NumPy or geometry."""
+        if np is None or not self._geo_widgets:
+            return None
+        return np.array([w.geometry for w in self._geo_widgets]).T
+
+    @cached_property
+    def _geo_lines(self) -> List[int]:
+        """Source line of each _geo_widgets entry, for ordering overlapping
+        pairs without touching the widget records."""
+        return [w.line_number for w in self._geo_widgets]
+
+    @cached_property
+    def _geo_bounds(self) -> List[Tuple[int, int, int, int]]:
+        """(left, top, right, bottom) of each _geo_widgets entry, computed once
+        so the pair tests need no additions."""
+        return [(x, y, x + w, y + h) for x, y, w, h in (wg.geometry for wg in self._geo_widgets)]
+
+    @cached_property
+    def _overlaps(self) -> Tuple[List[Tuple[int, int]], Optional[List[int]]]:
+        """Overlapping _geo_widgets, found once for both the overlap issues
+        and the z-order analysis.
+
+        Returns:
+            (sorted (i, j) index pairs, their intersection areas when the
+            compiled scan produced them, else None)
+        """
+        widgets_with_geometry = self._geo_widgets
+        if len(widgets_with_geometry) < 2:
+            return [], None
+        arrays = self._geo_arrays
+
+        if arrays is not None and len(widgets_with_geometry) <= _NP_PAIRWISE_MAX:
+            return self._overlapping_pairs_np(), None
+        if arrays is not None and _overlap_pairs_jit is not None and arrays.dtype.kind in 'iuf':
+            # Too many widgets for the mask: compiled scan holds only the hits
+            return _overlap_pairs_jit(*arrays)
+        if self.grid_cell_size or len(widgets_with_geometry) >= _GRID_MIN_WIDGETS:
+            return self._grid_pairs(self._geo_bounds), None
+        return self._overlapping_pairs(self._geo_bounds), None
+
+    @property
+    def _overlap_pairs(self) -> List[Tuple[int, int]]:
+        """Sorted (i, j) index pairs of overlapping _geo_widgets."""
+        return self._overlaps[0]
+
+    def _overlap_areas(self) -> Tuple[List[int], List[int]]:
+        """Intersection areas for _overlap_pairs, plus every widget's own area.
+
+        Returns:
+            (pair areas aligned with _overlap_pairs, widget areas aligned
+            with _geo_widgets)
+        """
+        arrays = self._geo_arrays
+        pairs, areas = self._overlaps
+        if areas is not None:
+            # The compiled scan measured the areas while finding the pairs
+            return list(areas), (arrays[2] * arrays[3]).tolist()
+        if arrays is None or not pairs:
+            bounds = self._geo_bounds
+            widget_areas = [(x1 - x0) * (y1 - y0) for x0, y0, x1, y1 in bounds]
+            if any(x1 < x0 or y1 < y0 for x0, y0, x1, y1 in bounds):
+                # Negative sizes can pass the overlap test with empty extents
+                return ([self._calculate_overlap_area(bounds[i], bounds[j]) for i, j in pairs],
+                        widget_areas)
+            return [self._overlap_area_known(bounds[i], bounds[j]) for i, j in pairs], widget_areas
+
+        # One broadcast over all pairs; clamping at 0 matches the scalar version
+        x, y, w, h = arrays
+        rows, cols = np.array(pairs).T
+        right, bottom = x + w, y + h
+        overlap_w = np.minimum(right[rows], right[cols]) - np.maximum(x[rows], x[cols])
+        overlap_h = np.minimum(bottom[rows], bottom[cols]) - np.maximum(y[rows], y[cols])
+        areas = np.maximum(overlap_w, 0) * np.maximum(overlap_h, 0)
+        return areas.tolist(), (w * h).tolist()
+
     def _check_overlapping_widgets(self):
         """Check for overlapping widgets."""
-        widgets_with_geometry = [
-            (name, w) for name, w in self.widgets.items()
-            if w.geometry is not None
-        ]
-
-        for i, (name1, w1) in enumerate(widgets_with_geometry):
-            x1, y1, width1, height1 = w1.geometry
-
-            for name2, w2 in widgets_with_geometry[i+1:]:
-                x2, y2, width2, height2 = w2.geometry
-
-                # Check if rectangles overlap
-                if self._rectangles_overlap(
-                    (x1, y1, width1, height1),
-                    (x2, y2, width2, height2)
-                ):
-                    self.issues.append({
-                        'severity': 'warning',
-                        'category': 'overlap',
-                        'widget': f"{name1} & {name2}",
-                        'message': f"Widgets may overlap: {name1} and {name2}",
-                        'line': w1.line_number
-                    })
-                    w1.issues.append(f"May overlap with {name2}")
-                    w2.issues.append(f"May overlap with {name1}")
+        widgets_with_geometry = self._geo_widgets
 
-    def _rectangles_overlap(self, rect1, rect2) -> bool:
-        """Check if two rectangles overlap."""
-        x1, y1, w1, h1 = rect1
-        x2, y2, w2, h2 = rect2
-
-        return not (x1 + w1 < x2 or x2 + w2 < x1 or
-                   y1 + h1 < y2 or y2 + h2 < y1)
+        for i, j in self._overlap_pairs:
+            w1, w2 = widgets_with_geometry[i], widgets_with_geometry[j]
+            name1, name2 = w1.name, w2.name
+            self.issues.append({
+                'severity': 'warning',
+                'category': 'overlap',
+                'widget': f"{name1} & {name2}",
+                'message': f"Widgets may overlap: {name1} and {name2}",
+                'line': w1.line_number
+            })
+            w1.issues.append(f"May overlap with {name2}")
+            w2.issues.append(f"May overlap with {name1}")
+
+    def _overlapping_pairs(self, bounds: List[Tuple[int, int, int, int]]) -> List[Tuple[int, int]]:
+        """Find overlapping rectangle pairs with a sweep line over x.
+
+        Only rectangles whose x-ranges are open at the same time are
+        compared, instead of every pair.
+
+        Args:
+            bounds: (left, top, right, bottom) per rectangle
+
+        Returns:
+            (i, j) index pairs with i < j, in the same order as a pairwise scan
+        """
+        if any(x1 < x0 or y1 < y0 for x0, y0, x1, y1 in bounds):
+            # Negative sizes don't form intervals; compare every pair
+            return [
+                (i, j) for i, j in combinations(range(len(bounds)), 2)
+                if self._rectangles_overlap(bounds[i], bounds[j])
+            ]
+
+        # Starts sort before ends at the same x, since touching edges overlap
+        events = []
+        for index, (x0, _, x1, _) in enumerate(bounds):
+            events.append((x0, 0, index))
+            events.append((x1, 1, index))
+        events.sort()
+
+        pairs = []
+        active = set()
+        for _, is_end, index in events:
+            if is_end:
+                active.discard(index)
+                continue
+            # Every active rectangle already overlaps this one along x
+            _, top, _, bottom = bounds[index]
+            for other in active:
+                if bounds[other][1] <= bottom and top <= bounds[other][3]:
+                    pairs.append((other, index) if other < index else (index, other))
+            active.add(index)
+
+        pairs.sort()
+        return pairs
+
+    def _grid_pairs(self, bounds: List[Tuple[int, int, int, int]]) -> List[Tuple[int, int]]:
+        """Find overlapping rectangle pairs through a uniform grid.
+
+        Each rectangle is bucketed into every cell it touches and only
+        rectangles sharing a cell are compared, so mostly disjoint layouts
+        cost close to linear time even when many widgets share an x range.
+
+        Args:
+            bounds: (left, top, right, bottom) per rectangle
+
+        Returns:
+            (i, j) index pairs with i < j, in the same order as a pairwise scan
+        """
+        if any(x1 < x0 or y1 < y0 for x0, y0, x1, y1 in bounds):
+            # Negative sizes don't map onto cells; the sweep compares every pair
+            return self._overlapping_pairs(bounds)
+
+        cell = self.grid_cell_size
+        if not cell:
+            # Median widget extent: most widgets touch only a few cells
+            extents = sorted(max(x1 - x0, y1 - y0) for x0, y0, x1, y1 in bounds)
+            cell = max(extents[len(extents) // 2], 1)
+
+        grid = {}
+        for index, (x0, y0, x1, y1) in enumerate(bounds):
+            # Inclusive end cells, since touching edges overlap
+            for cx in range(int(x0 // cell), int(x1 // cell) + 1):
+                for cy in range(int(y0 // cell), int(y1 // cell) + 1):
+                    grid.setdefault((cx, cy), []).append(index)
+
+        pairs = set()
+        for members in grid.values():
+            for a, i in enumerate(members):
+                bounds_i = bounds[i]
+                for j in members[a + 1:]:
+                    if (i, j) not in pairs and self._rectangles_overlap(bounds_i, bounds[j]):
+                        pairs.add((i, j))
+
+        return sorted(pairs)
+
+    def _overlapping_pairs_np(self) -> List[Tuple[int, int]]:
+        """NumPy version of _overlapping_pairs over _geo_arrays, testing all
+        pairs at once with a broadcast predicate."""
+        x, y, w, h = self._geo_arrays
+        right, bottom = x + w, y + h
+        mask = ~((right[:, None] < x[None, :]) | (right[None, :] < x[:, None]) |
+                 (bottom[:, None] < y[None, :]) | (bottom[None, :] < y[:, None]))
+        # Upper triangle in row-major order gives sorted i < j pairs
+        rows, cols = np.nonzero(np.triu(mask, k=1))
+        return list(zip(rows.tolist(), cols.tolist()))
 
     def _check_layout_issues(self):
         """Check for layout-related issues."""
@@ -453,137 +875,127 @@ class GUICodeAnalyzer:
         """Validate skill.md best practices."""
         checks = {}
 
+        # Every token is looked up once; the checks below only test the set
+        present = self._scan_tokens()
+
         # Check for theme manager usage
-        checks['uses_theme_manager'] = 'get_theme()' in self.content
+        checks['uses_theme_manager'] = 'get_theme()' in present
 
         # Check for themed components
         themed_components = ['ThemedCard', 'ThemedLabel', 'ThemedButton']
-        checks['uses_themed_components'] = any(comp in self.content for comp in themed_components)
+        checks['uses_themed_components'] = any(comp in present for comp in themed_components)
 
         # Check for hardcoded colors
-        color_pattern = r'#[0-9A-Fa-f]{6}'
-        hardcoded_colors = re.findall(color_pattern, self.content)
+        color_matches = list(self._COLOR_RE.finditer(self._bytes))
+        # Each distinct color once, in order of first appearance
+        hardcoded_colors = list(dict.fromkeys(m.group().decode('ascii') for m in color_matches))
         checks['no_hardcoded_colors'] = len(hardcoded_colors) == 0
-        checks['hardcoded_colors_found'] = hardcoded_colors if hardcoded_colors else []
+        checks['hardcoded_colors_found'] = hardcoded_colors
+        checks['hardcoded_color_lines'] = sorted({
+            self._offset_to_line_col(m.start())[0] for m in color_matches
+        })
 
         # Check for object names
-        checks['uses_object_names'] = 'setObjectName' in self.content
+        checks['uses_object_names'] = 'setObjectName' in present
 
         # Check for docstrings
-        checks['has_docstrings'] = '"""' in self.content or "'''" in self.content
+        checks['has_docstrings'] = '"""' in present or "'''" in present
 
         # ===== Architecture Patterns =====
         # Check for proper signal/slot usage
-        checks['uses_signals'] = 'Signal(' in self.content or '@Slot' in self.content or '.connect(' in self.content
+        checks['uses_signals'] = 'Signal(' in present or '@Slot' in present or '.connect(' in present
 
         # Check for threading (responsive UI)
-        checks['uses_threading'] = 'QThread' in self.content or 'Worker(' in self.content
+        checks['uses_threading'] = 'QThread' in present or 'Worker(' in present
 
         # Check for MVVM/MVC pattern
-        checks['uses_mvvm_mvc'] = 'ViewModel' in self.content or 'viewmodel' in self.content.lower() or 'controller' in self.content.lower()
+        checks['uses_mvvm_mvc'] = 'ViewModel' in present or 'viewmodel' in present or 'controller' in present
 
         # ===== Layout Management =====
         # Check for proper layout usage
         layout_classes = ['QVBoxLayout', 'QHBoxLayout', 'QGridLayout', 'QFormLayout', 'QStackedLayout']
-        checks['uses_layouts'] = any(layout in self.content for layout in layout_classes)
+        checks['uses_layouts'] = any(layout in present for layout in layout_classes)
 
         # Check for manual positioning (bad practice)
-        checks['avoids_manual_positioning'] = 'setGeometry' not in self.content
+        checks['avoids_manual_positioning'] = not self._has_geometry
 
         # Check for spacers/stretches
-        checks['uses_spacers'] = 'addStretch' in self.content or 'QSpacerItem' in self.content
+        checks['uses_spacers'] = 'addStretch' in present or 'QSpacerItem' in present
 
         # ===== Resource Management =====
         # Check for cleanup pattern
-        checks['has_cleanup'] = 'closeEvent' in self.content
+        checks['has_cleanup'] = 'closeEvent' in present
 
         # Check for proper parent-child relationships
-        checks['sets_parent'] = 'parent=' in self.content or ', self)' in self.content
+        checks['sets_parent'] = 'parent=' in present or ', self)' in present
 
         # ===== PySide6 vs PyQt6 =====
         # Check framework choice (PySide6 preferred)
-        has_pyside = 'from PySide6' in self.content or 'import PySide6' in self.content
-        has_pyqt = 'from PyQt6' in self.content or 'import PyQt6' in self.content
+        has_pyside = 'from PySide6' in present or 'import PySide6' in present
+        has_pyqt = 'from PyQt6' in present or 'import PyQt6' in present
         checks['uses_pyside6'] = has_pyside and not has_pyqt
 
         # ===== Signal/Slot Best Practices =====
         # Check for lambda usage
-        checks['uses_lambda_slots'] = 'lambda:' in self.content or 'lambda ' in self.content
+        checks['uses_lambda_slots'] = 'lambda:' in present or 'lambda ' in present
 
         # Check for functools.partial
-        checks['uses_partial'] = 'from functools import partial' in self.content or 'partial(' in self.content
+        checks['uses_partial'] = 'from functools import partial' in present or 'partial(' in present
 
         # ===== Common Pitfalls =====
         # Check for blocking operations (bad)
         blocking_patterns = ['time.sleep', 'requests.get', 'urllib.request']
-        checks['avoids_blocking_ui'] = not any(pattern in self.content for pattern in blocking_patterns)
+        checks['avoids_blocking_ui'] = not any(pattern in present for pattern in blocking_patterns)
 
         # Check for Qt Resource System usage
-        checks['uses_qt_resources'] = ':/' in self.content and 'QIcon' in self.content
+        checks['uses_qt_resources'] = ':/' in present and 'QIcon' in present
 
         return checks
 
+    def _scan_tokens(self) -> set:
+        """Return the best-practice tokens that occur in the file."""
+        lower = self.content.lower()
+        if self._BP_AUTOMATON is not None:
+            # One linear pass per text, however many tokens there are
+            present = {tok for _, tok in self._BP_AUTOMATON.iter(self.content)}
+            present.update(tok for _, tok in self._BP_LOWER_AUTOMATON.iter(lower))
+            return present
+
+        present = {tok for tok in self._BP_TOKENS if tok in self.content}
+        present.update(tok for tok in self._BP_LOWER_TOKENS if tok in lower)
+        return present
+
     def _generate_statistics(self) -> Dict[str, any]:
         """Generate statistics."""
-        widget_types = {}
-        for widget in self.widgets.values():
-            widget_types[widget.widget_type] = widget_types.get(widget.widget_type, 0) + 1
+        widget_types = Counter(w.widget_type for w in self.widgets.values())
+        severities = Counter(i['severity'] for i in self.issues)
 
         return {
             'total_widgets': len(self.widgets),
-            'widget_types': widget_types,
+            'widget_types': dict(widget_types),
             'total_issues': len(self.issues),
             'issues_by_severity': {
-                'error': len([i for i in self.issues if i['severity'] == 'error']),
-                'warning': len([i for i in self.issues if i['severity'] == 'warning']),
-                'info': len([i for i in self.issues if i['severity'] == 'info'])
+                'error': severities['error'],
+                'warning': severities['warning'],
+                'info': severities['info']
             },
-            'lines_of_code': len(self.content.split('\n'))
+            'lines_of_code': self._bytes.count(b'\n') + 1
         }
 
     def _analyze_alignment(self) -> Dict[str, any]:
         """Analyze X/Y axis alignment and consistent spacing."""
-        widgets_with_geometry = [
-            w for w in self.widgets.values() if w.geometry
-        ]
+        widgets_with_geometry = self._geo_widgets
 
         if not widgets_with_geometry:
             return {'x_groups': {}, 'y_groups': {}, 'spacing_analysis': {}, 'suggestions': []}
 
-        # Group widgets by X coordinate
-        x_groups = defaultdict(list)
-        for widget in widgets_with_geometry:
-            x = widget.geometry[0]
-            x_groups[x].append(widget.name)
-
-        # Group widgets by Y coordinate
-        y_groups = defaultdict(list)
-        for widget in widgets_with_geometry:
-            y = widget.geometry[1]
-            y_groups[y].append(widget.name)
-
-        # Analyze horizontal spacing between widgets
-        horizontal_spacings = []
-        sorted_widgets = sorted(widgets_with_geometry, key=lambda w: (w.geometry[1], w.geometry[0]))
-
-        for i in range(len(sorted_widgets) - 1):
-            w1, w2 = sorted_widgets[i], sorted_widgets[i+1]
-            if w1.geometry and w2.geometry:
-                # Same row (similar Y coordinate)
-                if abs(w1.geometry[1] - w2.geometry[1]) < 10:
-                    spacing = w2.geometry[0] - (w1.geometry[0] + w1.geometry[2])
-                    if spacing > 0:
-                        horizontal_spacings.append(spacing)
+        # Group widgets sharing an X / Y coordinate
+        geoms = [(w.geometry[0], w.geometry[1], w.name) for w in widgets_with_geometry]
+        x_groups = self._group_names(geoms, 0)
+        y_groups = self._group_names(geoms, 1)
 
-        # Analyze vertical spacing
-        vertical_spacings = []
-        sorted_by_y = sorted(widgets_with_geometry, key=lambda w: w.geometry[1])
-
-        for i in range(len(sorted_by_y) - 1):
-            w1, w2 = sorted_by_y[i], sorted_by_y[i+1]
-            spacing = w2.geometry[1] - (w1.geometry[1] + w1.geometry[3])
-            if spacing > 0:
-                vertical_spacings.append(spacing)
+        # Positive gaps between neighbouring widgets
+        horizontal_spacings, vertical_spacings = self._measure_spacings()
 
         # Check for consistent spacing
         spacing_analysis = {}
@@ -596,7 +1008,7 @@ class GUICodeAnalyzer:
                 'consistent': len(unique_spacings) == 1
             }
             if len(unique_spacings) > 1:
-                most_common = max(set(horizontal_spacings), key=horizontal_spacings.count)
+                most_common = Counter(horizontal_spacings).most_common(1)[0][0]
                 suggestions.append({
                     'type': 'spacing',
                     'message': f'Inconsistent horizontal spacing detected: {unique_spacings}',
@@ -610,7 +1022,7 @@ class GUICodeAnalyzer:
                 'consistent': len(unique_spacings) == 1
             }
             if len(unique_spacings) > 1:
-                most_common = max(set(vertical_spacings), key=vertical_spacings.count)
+                most_common = Counter(vertical_spacings).most_common(1)[0][0]
                 suggestions.append({
                     'type': 'spacing',
                     'message': f'Inconsistent vertical spacing detected: {unique_spacings}',
@@ -640,18 +1052,85 @@ class GUICodeAnalyzer:
                 })
 
         return {
-            'x_groups': {k: v for k, v in x_groups.items() if len(v) > 1},
-            'y_groups': {k: v for k, v in y_groups.items() if len(v) > 1},
+            'x_groups': x_groups,
+            'y_groups': y_groups,
             'spacing_analysis': spacing_analysis,
             'suggestions': suggestions
         }
 
+    def _group_names(self, geoms: List[Tuple[int, int, str]], axis: int) -> Dict[int, List[str]]:
+        """Group widget names by one coordinate of (x, y, name) tuples.
+
+        Returns:
+            Coordinate -> names, in ascending coordinate order, for
+            coordinates shared by more than one widget
+        """
+        key = itemgetter(axis)
+        groups = {}
+        for coord, members in groupby(sorted(geoms, key=key), key=key):
+            names = [name for _, _, name in members]
+            if len(names) > 1:
+                groups[coord] = names
+        return groups
+
+    def _measure_spacings(self) -> Tuple[List[int], List[int]]:
+        """Measure positive gaps between neighbouring widgets.
+
+        Returns:
+            Horizontal gaps between same-row neighbours in (y, x) order, and
+            vertical gaps between neighbours in y order
+        """
+        if self._geo_arrays is not None:
+            return self._measure_spacings_np()
+
+        widgets = self._geo_widgets
+
+        # Analyze horizontal spacing between widgets
+        horizontal_spacings = []
+        sorted_widgets = sorted(widgets, key=lambda w: (w.geometry[1], w.geometry[0]))
+
+        for i in range(len(sorted_widgets) - 1):
+            w1, w2 = sorted_widgets[i], sorted_widgets[i+1]
+            # Same row (similar Y coordinate)
+            if abs(w1.geometry[1] - w2.geometry[1]) < 10:
+                spacing = w2.geometry[0] - (w1.geometry[0] + w1.geometry[2])
+                if spacing > 0:
+                    horizontal_spacings.append(spacing)
+
+        # Analyze vertical spacing
+        vertical_spacings = []
+        sorted_by_y = sorted(widgets, key=lambda w: w.geometry[1])
+
+        for i in range(len(sorted_by_y) - 1):
+            w1, w2 = sorted_by_y[i], sorted_by_y[i+1]
+            spacing = w2.geometry[1] - (w1.geometry[1] + w1.geometry[3])
+            if spacing > 0:
+                vertical_spacings.append(spacing)
+
+        return horizontal_spacings, vertical_spacings
+
+    def _measure_spacings_np(self) -> Tuple[List[int], List[int]]:
+        """NumPy version of _measure_spacings over _geo_arrays."""
+        x, y, w, h = self._geo_arrays
+
+        # Same-row neighbours; lexsort is stable like sorted() on (y, x)
+        order = np.lexsort((x, y))
+        xs, ys, ws = x[order], y[order], w[order]
+        gaps = xs[1:] - (xs[:-1] + ws[:-1])
+        same_row = np.abs(ys[1:] - ys[:-1]) < 10
+        horizontal_spacings = gaps[same_row & (gaps > 0)].tolist()
+
+        order = np.argsort(y, kind='stable')
+        ys, hs = y[order], h[order]
+        gaps = ys[1:] - (ys[:-1] + hs[:-1])
+        vertical_spacings = gaps[gaps > 0].tolist()
+
+        return horizontal_spacings, vertical_spacings
+
     def _generate_layout_suggestions(self) -> List[Dict[str, any]]:
         """Generate layout optimization suggestions."""
         suggestions = []
-        widgets_with_geometry = [
-            w for w in self.widgets.values() if w.geometry
-        ]
+        widgets_with_geometry = self._geo_widgets
 
         if not widgets_with_geometry:
             return suggestions
@@ -716,18 +1195,15 @@ class GUICodeAnalyzer:
         if len(widgets) < 4:
             return None
 
-        # Get unique X and Y coordinates
-        x_coords = sorted(set(w.geometry[0] for w in widgets))
-        y_coords = sorted(set(w.geometry[1] for w in widgets))
+        # Occupied grid positions and the unique X and Y coordinates
+        occupied = {(w.geometry[0], w.geometry[1]) for w in widgets}
+        x_coords = {x for x, _ in occupied}
+        y_coords = {y for _, y in occupied}
 
         # Check if we have at least 2x2 grid
         if len(x_coords) >= 2 and len(y_coords) >= 2:
-            # Count widgets at each grid position
-            grid_count = 0
-            for x in x_coords:
-                for y in y_coords:
-                    if any(w.geometry[0] == x and w.geometry[1] == y for w in widgets):
-                        grid_count += 1
+            # Every occupied position lies on the grid, so it is the filled count
+            grid_count = len(occupied)
 
             # If more than 70% of grid positions are filled, it's a grid
             total_positions = len(x_coords) * len(y_coords)
@@ -761,58 +1237,70 @@ class GUICodeAnalyzer:
     def _analyze_z_order(self) -> List[Dict[str, any]]:
         """Analyze Z-order and widget occlusion."""
         z_order_issues = []
-        widgets_with_geometry = [
-            w for w in self.widgets.values() if w.geometry
-        ]
+        widgets_with_geometry = self._geo_widgets
 
-        if not widgets_with_geometry:
+        # A single widget cannot occlude anything, and without any overlap
+        # there are no areas worth measuring
+        if len(widgets_with_geometry) < 2 or not self._overlap_pairs:
             return z_order_issues
 
-        # Check all pairs for overlapping
-        for w1, w2 in combinations(widgets_with_geometry, 2):
-            if self._rectangles_overlap(w1.geometry, w2.geometry):
-                # Determine which widget is on top (later in code = on top)
-                top_widget = w2 if w2.line_number > w1.line_number else w1
-                bottom_widget = w1 if w2.line_number > w1.line_number else w2
-
-                # Calculate overlap area
-                overlap_area = self._calculate_overlap_area(w1.geometry, w2.geometry)
-                w1_area = w1.geometry[2] * w1.geometry[3]
-                w2_area = w2.geometry[2] * w2.geometry[3]
-
-                w1_covered_pct = (overlap_area / w1_area * 100) if w1_area > 0 else 0
-                w2_covered_pct = (overlap_area / w2_area * 100) if w2_area > 0 else 0
-
-                z_order_issues.append({
-                    'top_widget': top_widget.name,
-                    'bottom_widget': bottom_widget.name,
-                    'overlap_area': overlap_area,
-                    'bottom_covered_percent': w1_covered_pct if bottom_widget == w1 else w2_covered_pct,
-                    'message': f'{top_widget.name} (line {top_widget.line_number}) will cover {bottom_widget.name} (line {bottom_widget.line_number})',
-                    'severity': 'warning' if max(w1_covered_pct, w2_covered_pct) > 50 else 'info',
-                    'recommendation': 'Review z-order or adjust positions to avoid occlusion' if max(w1_covered_pct, w2_covered_pct) > 50 else 'Minor overlap detected'
-                })
+        # Only the candidate pairs from the sweep (or mask) overlap at all;
+        # their areas are computed for all pairs at once
+        overlap_areas, widget_areas = self._overlap_areas()
+        lines = self._geo_lines
+        for (i, j), overlap_area in zip(self._overlap_pairs, overlap_areas):
+            # Determine which widget is on top (later in code = on top);
+            # the records are only needed for the message
+            top, bottom = (j, i) if lines[j] > lines[i] else (i, j)
+            top_widget = widgets_with_geometry[top]
+            bottom_widget = widgets_with_geometry[bottom]
+
+            w1_area = widget_areas[i]
+            w2_area = widget_areas[j]
+
+            w1_covered_pct = (overlap_area / w1_area * 100) if w1_area > 0 else 0
+            w2_covered_pct = (overlap_area / w2_area * 100) if w2_area > 0 else 0
+
+            z_order_issues.append({
+                'top_widget': top_widget.name,
+                'bottom_widget': bottom_widget.name,
+                'overlap_area': overlap_area,
+                'bottom_covered_percent': w1_covered_pct if bottom == i else w2_covered_pct,
+                'message': f'{top_widget.name} (line {top_widget.line_number}) will cover {bottom_widget.name} (line {bottom_widget.line_number})',
+                'severity': 'warning' if max(w1_covered_pct, w2_covered_pct) > 50 else 'info',
+                'recommendation': 'Review z-order or adjust positions to avoid occlusion' if max(w1_covered_pct, w2_covered_pct) > 50 else 'Minor overlap detected'
+            })
 
         return z_order_issues
 
-    def _rectangles_overlap(self, rect1: Tuple[int, int, int, int], rect2: Tuple[int, int, int, int]) -> bool:
-        """Check if two rectangles overlap."""
-        x1, y1, w1, h1 = rect1
-        x2, y2, w2, h2 = rect2
+    def _rectangles_overlap(self, bounds1: Tuple[int, int, int, int], bounds2: Tuple[int, int, int, int]) -> bool:
+        """Check if two (left, top, right, bottom) rectangles overlap (touching edges count)."""
+        left1, top1, right1, bottom1 = bounds1
+        left2, top2, right2, bottom2 = bounds2
+
+        # One chained test that stops at the first separating axis
+        return left2 <= right1 and left1 <= right2 and top2 <= bottom1 and top1 <= bottom2
+
+    def _overlap_area_known(self, bounds1: Tuple[int, int, int, int], bounds2: Tuple[int, int, int, int]) -> int:
+        """Intersection area of two rectangles already known to overlap.
 
-        return not (x1 + w1 < x2 or x2 + w2 < x1 or
-                   y1 + h1 < y2 or y2 + h2 < y1)
+        Both extents are non-negative for such pairs (given non-negative
+        sizes), so the empty-intersection guard is skipped.
+        """
+        left1, top1, right1, bottom1 = bounds1
+        left2, top2, right2, bottom2 = bounds2
+        return (min(right1, right2) - max(left1, left2)) * (min(bottom1, bottom2) - max(top1, top2))
 
-    def _calculate_overlap_area(self, rect1: Tuple[int, int, int, int], rect2: Tuple[int, int, int, int]) -> int:
-        """Calculate the overlapping area between two rectangles."""
-        x1, y1, w1, h1 = rect1
-        x2, y2, w2, h2 = rect2
+    def _calculate_overlap_area(self, bounds1: Tuple[int, int, int, int], bounds2: Tuple[int, int, int, int]) -> int:
+        """Calculate the overlapping area between two (left, top, right, bottom) rectangles."""
+        left1, top1, right1, bottom1 = bounds1
+        left2, top2, right2, bottom2 = bounds2
 
         # Calculate intersection
-        x_left = max(x1, x2)
-        y_top = max(y1, y2)
-        x_right = min(x1 + w1, x2 + w2)
-        y_bottom = min(y1 + h1, y2 + h2)
+        x_left = max(left1, left2)
+        y_top = max(top1, top2)
+        x_right = min(right1, right2)
+        y_bottom = min(bottom1, bottom2)
 
         if x_right < x_left or y_bottom < y_top:
             return 0
@@ -820,220 +1308,409 @@ class GUICodeAnalyzer:
         return (x_right - x_left) * (y_bottom - y_top)
 
 
+class _WidgetVisitor(ast.NodeVisitor):
+    """Single-pass AST walk feeding widget assignments and calls to the analyzer.
+
+    Only method bodies of Qt widget classes are analyzed, including
+    everything nested inside them; other code is walked just to find
+    Qt classes.
+    """
+
+    # Nodes that can never contain an assignment or a call; these are a
+    # large share of any tree, so they are not even dispatched
+    _LEAF_TYPES = (
+        ast.Name, ast.Constant, ast.expr_context, ast.operator, ast.unaryop,
+        ast.cmpop, ast.boolop, ast.alias,
+    )
+
+    def __init__(self, analyzer: "GUICodeAnalyzer"):
+        self.analyzer = analyzer
+        self.in_method = False
+
+    def generic_visit(self, node: ast.AST):
+        leaf_types = self._LEAF_TYPES
+        for child in ast.iter_child_nodes(node):
+            if not isinstance(child, leaf_types):
+                self.visit(child)
+
+    def visit_ClassDef(self, node: ast.ClassDef):
+        if self.in_method:
+            self.generic_visit(node)
+            return
+
+        analyzer = self.analyzer
+        analyzer.current_class = node.name
+
+        # Check if it's a Qt widget class
+        is_qt_class = any(
+            isinstance(base, ast.Name) and base.id in analyzer.QT_WIDGETS
+            for base in node.bases
+        )
+
+        for child in node.body:
+            if is_qt_class and isinstance(child, ast.FunctionDef):
+                self.in_method = True
+                self.visit(child)
+                self.in_method = False
+            else:
+                self.visit(child)
+
+    def visit_Assign(self, node: ast.Assign):
+        # Detect widget assignment: self.widget = QWidget()
+        if self.in_method:
+            self.analyzer._analyze_assignment(node)
+        self.generic_visit(node)
+
+    def visit_Call(self, node: ast.Call):
+        # Detect method calls: widget.setGeometry(...)
+        if self.in_method:
+            self.analyzer._analyze_method_call(node)
+        self.generic_visit(node)
+
+
+def analyze_many(paths: List[Path]) -> List[AnalysisResult]:
+    """Analyze several files, skipping those unchanged since the last run.
+
+    ~/.cache/gui_analyzer/index.json maps each path to the mtime, size and
+    content key it had when last analyzed. A file whose stat still matches
+    is answered from the result cache without being read; the other files
+    are analyzed in worker processes by analyze(), which still reuses the
+    result when only the mtime changed.
+
+    Returns:
+        One analysis result per path, in the given order (a path given
+        twice gets two entries)
+    """
+    if os.environ.get('GUI_ANALYZER_NOCACHE'):
+        analyzed = _analyze_paths([str(path) for path in paths])
+        return [result for result, _ in analyzed]
+
+    try:
+        index = json.loads(_INDEX_FILE.read_text(encoding='utf-8'))
+    except (OSError, ValueError):
+        index = {}
+
+    results = [None] * len(paths)
+    misses = []
+    for position, path in enumerate(paths):
+        path = Path(path)
+        str_path = str(path.resolve())
+        try:
+            st = path.stat()
+        except OSError:
+            raise FileNotFoundError(f"File not found: {path}")
+
+        entry = index.get(str_path)
+        if entry and entry['mtime_ns'] == st.st_mtime_ns and entry['size'] == st.st_size:
+            result = GUICodeAnalyzer(path)._load_cached_result(_CACHE_DIR / f"{entry['key']}.pkl")
+            if result is not None:
+                print(f"✅ {path}: {len(result.widgets)} widgets, {len(result.issues)} issues (unchanged)",
+                      file=sys.stderr)
+                results[position] = result
+                continue
+
+        misses.append((position, str(path), str_path, st))
+
+    analyzed = _analyze_paths([path for _, path, _, _ in misses])
+    for (position, path, str_path, st), (result, cache_key) in zip(misses, analyzed):
+        results[position] = result
+        index[str_path] = {'mtime_ns': st.st_mtime_ns, 'size': st.st_size, 'key': cache_key}
+
+    try:
+        _CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        tmp_file = _INDEX_FILE.with_suffix(f'.{os.getpid()}.tmp')
+        tmp_file.write_text(json.dumps(index), encoding='utf-8')
+        os.replace(tmp_file, _INDEX_FILE)
+    except OSError:
+        pass
+
+    return results
+
+
+def _analyze_path(path: str) -> Tuple[AnalysisResult, Optional[str]]:
+    """Analyze one file; returns the resolved result and its cache key."""
+    analyzer = GUICodeAnalyzer(path)
+    return analyzer.analyze().resolve(), analyzer.cache_key
+
+
+def _analyze_paths(paths: List[str]) -> List[Tuple[AnalysisResult, Optional[str]]]:
+    """Run _analyze_path over files, across worker processes for several files.
+
+    Parsing and walking the AST is CPU-bound and holds the GIL, so files
+    are spread over processes rather than threads.
+    """
+    if len(paths) < 2:
+        return [_analyze_path(path) for path in paths]
+
+    workers = min(len(paths), os.cpu_count() or 1)
+    # Batch small files per task so IPC doesn't dominate
+    chunksize = max(1, len(paths) // (workers * 4))
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        return list(executor.map(_analyze_path, paths, chunksize=chunksize))
+
+
+def _result_to_json(result: AnalysisResult) -> Dict[str, any]:
+    """Convert a result to the --json output structure."""
+    return {
+        'file_path': result.file_path,
+        'timestamp': result.timestamp,
+        'statistics': result.statistics,
+        'widgets': {name: {
+            'type': w.widget_type,
+            'line': w.line_number,
+            'parent': w.parent,
+            'children': w.children,
+            'issues': w.issues
+        } for name, w in result.widgets.items()},
+        'issues': result.issues,
+        'best_practices': result.best_practices
+    }
+
+
+# Report separators, tree indents and best-practice check labels
+_RULE = '=' * 80
+_THIN_RULE = '─' * 80
+_INDENTS = ["  " * level for level in range(64)]
+
+# Longest widget-type distribution bar; longer ones are cut with '…'
+_BAR_MAX = 60
+
+# Icons for suggestion and z-order severities
+_SEVERITY_ICONS = {'warning': '⚠️', 'info': 'ℹ️', 'error': '❌'}
+
+# Issue sections of the report, in print order
+_SEVERITY_HEADINGS = (
+    ('error', '❌ ERRORS'),
+    ('warning', '⚠️  WARNINGS'),
+    ('info', 'ℹ️  INFO'),
+)
+
+_THEME_CHECKS = {
+    'uses_theme_manager': 'Uses Theme Manager (get_theme())',
+    'uses_themed_components': 'Uses Themed Components',
+    'no_hardcoded_colors': 'No Hardcoded Colors'
+}
+
+_QUALITY_CHECKS = {
+    'uses_object_names': 'Uses Object Names (setObjectName)',
+    'has_docstrings': 'Has Docstrings'
+}
+
+_ARCH_CHECKS = {
+    'uses_signals': 'Uses Signal/Slot Pattern',
+    'uses_mvvm_mvc': 'Uses MVVM/MVC Pattern',
+    'uses_threading': 'Uses Threading (Responsive UI)'
+}
+
+_LAYOUT_CHECKS = {
+    'uses_layouts': 'Uses Layout Managers',
+    'avoids_manual_positioning': 'Avoids Manual Positioning (setGeometry)',
+    'uses_spacers': 'Uses Spacers/Stretches'
+}
+
+_RESOURCE_CHECKS = {
+    'has_cleanup': 'Has Cleanup (closeEvent)',
+    'sets_parent': 'Sets Widget Parents'
+}
+
+_FRAMEWORK_CHECKS = {
+    'uses_pyside6': 'Uses PySide6 (Preferred)',
+    'uses_lambda_slots': 'Uses Lambda for Slots',
+    'uses_partial': 'Uses functools.partial',
+    'avoids_blocking_ui': 'Avoids Blocking UI Thread'
+}
+
+
 def print_detailed_report(result: AnalysisResult):
     """Print detailed analysis report to console for AI consumption."""
-    print(f"\n{'='*80}")
-    print(f"📊 GUI CODE ANALYSIS REPORT")
-    print(f"{'='*80}")
-    print(f"File: {result.file_path}")
-    print(f"Timestamp: {result.timestamp}")
-    print(f"{'='*80}\n")
+    # One write for the whole report instead of a locked write per line
+    sys.stdout.write(format_detailed_report(result))
+
+
+def format_detailed_report(result: AnalysisResult) -> str:
+    """Build the detailed analysis report as one string."""
+    out = []
+    emit = out.append
+
+    emit(f"\n{_RULE}")
+    emit(f"📊 GUI CODE ANALYSIS REPORT")
+    emit(_RULE)
+    emit(f"File: {result.file_path}")
+    emit(f"Timestamp: {result.timestamp}")
+    emit(f"{_RULE}\n")
 
     # Statistics
-    print("📈 STATISTICS")
-    print(f"{'─'*80}")
-    print(f"Total Widgets: {result.statistics['total_widgets']}")
-    print(f"Total Issues: {result.statistics['total_issues']}")
-    print(f"  • Errors: {result.statistics['issues_by_severity']['error']}")
-    print(f"  • Warnings: {result.statistics['issues_by_severity']['warning']}")
-    print(f"  • Info: {result.statistics['issues_by_severity']['info']}")
-    print(f"Lines of Code: {result.statistics['lines_of_code']}\n")
+    emit("📈 STATISTICS")
+    emit(_THIN_RULE)
+    emit(f"Total Widgets: {result.statistics['total_widgets']}")
+    emit(f"Total Issues: {result.statistics['total_issues']}")
+    emit(f"  • Errors: {result.statistics['issues_by_severity']['error']}")
+    emit(f"  • Warnings: {result.statistics['issues_by_severity']['warning']}")
+    emit(f"  • Info: {result.statistics['issues_by_severity']['info']}")
+    emit(f"Lines of Code: {result.statistics['lines_of_code']}\n")
 
     # Widget Tree
-    print("🌳 WIDGET TREE")
-    print(f"{'─'*80}")
-    _print_tree(result.widget_tree, result.widgets, "ROOT", 0)
-    print()
+    emit("🌳 WIDGET TREE")
+    emit(_THIN_RULE)
+    _print_tree(result.widget_tree, result.widgets, "ROOT", 0, emit)
+    emit("")
 
     # Widget Details
-    print("📋 WIDGET DETAILS")
-    print(f"{'─'*80}")
+    emit("📋 WIDGET DETAILS")
+    emit(_THIN_RULE)
     for name, widget in result.widgets.items():
-        print(f"\n[{widget.widget_type}] {name}")
-        print(f"  Line: {widget.line_number}")
+        emit(f"\n[{widget.widget_type}] {name}")
+        emit(f"  Line: {widget.line_number}")
         if widget.parent:
-            print(f"  Parent: {widget.parent}")
+            emit(f"  Parent: {widget.parent}")
         if widget.children:
-            print(f"  Children: {', '.join(widget.children)}")
+            emit(f"  Children: {', '.join(widget.children)}")
         if widget.geometry:
             x, y, w, h = widget.geometry
-            print(f"  Geometry: x={x}, y={y}, width={w}, height={h}")
+            emit(f"  Geometry: x={x}, y={y}, width={w}, height={h}")
         if 'min_size' in widget.properties:
-            print(f"  Min Size: {widget.properties['min_size']}")
+            emit(f"  Min Size: {widget.properties['min_size']}")
         if 'max_size' in widget.properties:
-            print(f"  Max Size: {widget.properties['max_size']}")
-        print(f"  Visible: {widget.visible}")
-        print(f"  Enabled: {widget.enabled}")
+            emit(f"  Max Size: {widget.properties['max_size']}")
+        emit(f"  Visible: {widget.visible}")
+        emit(f"  Enabled: {widget.enabled}")
         if widget.stylesheet:
-            print(f"  Stylesheet: {widget.stylesheet[:100]}...")
+            emit(f"  Stylesheet: {widget.stylesheet[:100]}...")
         if widget.issues:
-            print(f"  ⚠️  Issues: {', '.join(widget.issues)}")
+            emit(f"  ⚠️  Issues: {', '.join(widget.issues)}")
 
     # Issues
     if result.issues:
-        print(f"\n⚠️  DETECTED ISSUES ({len(result.issues)})")
-        print(f"{'─'*80}")
-
-        errors = [i for i in result.issues if i['severity'] == 'error']
-        warnings = [i for i in result.issues if i['severity'] == 'warning']
-        infos = [i for i in result.issues if i['severity'] == 'info']
-
-        if errors:
-            print(f"\n❌ ERRORS ({len(errors)}):")
-            for issue in errors:
-                print(f"\n  • [{issue['category'].upper()}] {issue['widget']}")
-                print(f"    {issue['message']}")
-                print(f"    Line {issue['line']}")
-
-        if warnings:
-            print(f"\n⚠️  WARNINGS ({len(warnings)}):")
-            for issue in warnings:
-                print(f"\n  • [{issue['category'].upper()}] {issue['widget']}")
-                print(f"    {issue['message']}")
-                print(f"    Line {issue['line']}")
-
-        if infos:
-            print(f"\nℹ️  INFO ({len(infos)}):")
-            for issue in infos:
-                print(f"\n  • [{issue['category'].upper()}] {issue['widget']}")
-                print(f"    {issue['message']}")
-                print(f"    Line {issue['line']}")
+        emit(f"\n⚠️  DETECTED ISSUES ({len(result.issues)})")
+        emit(_THIN_RULE)
+
+        # Group by severity in one pass over the issues
+        by_severity = {severity: [] for severity, _ in _SEVERITY_HEADINGS}
+        for issue in result.issues:
+            group = by_severity.get(issue['severity'])
+            if group is not None:
+                group.append(issue)
+
+        for severity, heading in _SEVERITY_HEADINGS:
+            group = by_severity[severity]
+            if group:
+                emit(f"\n{heading} ({len(group)}):")
+                for issue in group:
+                    emit(f"\n  • [{issue['category'].upper()}] {issue['widget']}")
+                    emit(f"    {issue['message']}")
+                    emit(f"    Line {issue['line']}")
     else:
-        print(f"\n✅ NO ISSUES DETECTED")
+        emit(f"\n✅ NO ISSUES DETECTED")
 
     # Best Practices & Design Principles
-    print(f"\n✅ BEST PRACTICES & DESIGN PRINCIPLES (skill.md)")
-    print(f"{'─'*80}")
-
-    print("\n📋 Theme System:")
-    theme_checks = {
-        'uses_theme_manager': 'Uses Theme Manager (get_theme())',
-        'uses_themed_components': 'Uses Themed Components',
-        'no_hardcoded_colors': 'No Hardcoded Colors'
-    }
-    for key, label in theme_checks.items():
+    emit(f"\n✅ BEST PRACTICES & DESIGN PRINCIPLES (skill.md)")
+    emit(_THIN_RULE)
+
+    emit("\n📋 Theme System:")
+    for key, label in _THEME_CHECKS.items():
         status = '✅' if result.best_practices.get(key, False) else '❌'
-        print(f"  {status} {label}")
+        emit(f"  {status} {label}")
         if key == 'no_hardcoded_colors' and not result.best_practices.get(key, False):
             colors = result.best_practices.get('hardcoded_colors_found', [])
             if colors:
-                print(f"      Found: {', '.join(colors[:5])}")
+                emit(f"      Found: {', '.join(islice(colors, 5))}")
+                lines = result.best_practices.get('hardcoded_color_lines', [])
+                if lines:
+                    emit(f"      Lines: {', '.join(map(str, lines[:10]))}")
 
-    print("\n📋 Code Quality:")
-    quality_checks = {
-        'uses_object_names': 'Uses Object Names (setObjectName)',
-        'has_docstrings': 'Has Docstrings'
-    }
-    for key, label in quality_checks.items():
+    emit("\n📋 Code Quality:")
+    for key, label in _QUALITY_CHECKS.items():
         status = '✅' if result.best_practices.get(key, False) else '❌'
-        print(f"  {status} {label}")
+        emit(f"  {status} {label}")
 
-    print("\n📋 Architecture Patterns:")
-    arch_checks = {
-        'uses_signals': 'Uses Signal/Slot Pattern',
-        'uses_mvvm_mvc': 'Uses MVVM/MVC Pattern',
-        'uses_threading': 'Uses Threading (Responsive UI)'
-    }
-    for key, label in arch_checks.items():
+    emit("\n📋 Architecture Patterns:")
+    for key, label in _ARCH_CHECKS.items():
         status = '✅' if result.best_practices.get(key, False) else '❌'
-        print(f"  {status} {label}")
+        emit(f"  {status} {label}")
 
-    print("\n📋 Layout Management:")
-    layout_checks = {
-        'uses_layouts': 'Uses Layout Managers',
-        'avoids_manual_positioning': 'Avoids Manual Positioning (setGeometry)',
-        'uses_spacers': 'Uses Spacers/Stretches'
-    }
-    for key, label in layout_checks.items():
+    emit("\n📋 Layout Management:")
+    for key, label in _LAYOUT_CHECKS.items():
         status = '✅' if result.best_practices.get(key, False) else '❌'
-        print(f"  {status} {label}")
+        emit(f"  {status} {label}")
 
-    print("\n📋 Resource Management:")
-    resource_checks = {
-        'has_cleanup': 'Has Cleanup (closeEvent)',
-        'sets_parent': 'Sets Widget Parents'
-    }
-    for key, label in resource_checks.items():
+    emit("\n📋 Resource Management:")
+    for key, label in _RESOURCE_CHECKS.items():
         status = '✅' if result.best_practices.get(key, False) else '❌'
-        print(f"  {status} {label}")
-
-    print("\n📋 Framework & Best Practices:")
-    framework_checks = {
-        'uses_pyside6': 'Uses PySide6 (Preferred)',
-        'uses_lambda_slots': 'Uses Lambda for Slots',
-        'uses_partial': 'Uses functools.partial',
-        'avoids_blocking_ui': 'Avoids Blocking UI Thread'
-    }
-    for key, label in framework_checks.items():
+        emit(f"  {status} {label}")
+
+    emit("\n📋 Framework & Best Practices:")
+    for key, label in _FRAMEWORK_CHECKS.items():
         status = '✅' if result.best_practices.get(key, False) else '❌'
-        print(f"  {status} {label}")
+        emit(f"  {status} {label}")
 
     # Widget Type Distribution
-    print(f"\n📊 WIDGET TYPE DISTRIBUTION")
-    print(f"{'─'*80}")
+    emit(f"\n📊 WIDGET TYPE DISTRIBUTION")
+    emit(_THIN_RULE)
     for widget_type, count in sorted(result.statistics['widget_types'].items(),
-                                     key=lambda x: x[1], reverse=True):
-        bar = '█' * count
-        print(f"{widget_type:30} {count:3} {bar}")
+                                     key=itemgetter(1), reverse=True):
+        bar = '█' * count if count <= _BAR_MAX else '█' * _BAR_MAX + '…'
+        emit(f"{widget_type:30} {count:3} {bar}")
 
     # NEW: Alignment Analysis
     if result.alignment_analysis.get('suggestions'):
-        print(f"\n📐 ALIGNMENT & SPACING ANALYSIS")
-        print(f"{'─'*80}")
+        emit(f"\n📐 ALIGNMENT & SPACING ANALYSIS")
+        emit(_THIN_RULE)
 
         spacing = result.alignment_analysis.get('spacing_analysis', {})
         if spacing:
             if 'horizontal' in spacing:
                 h = spacing['horizontal']
                 status = '✅' if h['consistent'] else '⚠️'
-                print(f"\nHorizontal Spacing: {status}")
+                emit(f"\nHorizontal Spacing: {status}")
                 if h['consistent']:
-                    print(f"  Consistent spacing of {list(h['spacings'])[0]}px")
+                    emit(f"  Consistent spacing of {list(h['spacings'])[0]}px")
                 else:
-                    print(f"  Inconsistent: {h['spacings']}")
+                    emit(f"  Inconsistent: {h['spacings']}")
 
             if 'vertical' in spacing:
                 v = spacing['vertical']
                 status = '✅' if v['consistent'] else '⚠️'
-                print(f"\nVertical Spacing: {status}")
+                emit(f"\nVertical Spacing: {status}")
                 if v['consistent']:
-                    print(f"  Consistent spacing of {list(v['spacings'])[0]}px")
+                    emit(f"  Consistent spacing of {list(v['spacings'])[0]}px")
                 else:
-                    print(f"  Inconsistent: {v['spacings']}")
+                    emit(f"  Inconsistent: {v['spacings']}")
 
-        print(f"\nSuggestions:")
+        emit(f"\nSuggestions:")
         for suggestion in result.alignment_analysis['suggestions']:
-            print(f"  • {suggestion['message']}")
-            print(f"    → {suggestion['recommendation']}")
+            emit(f"  • {suggestion['message']}")
+            emit(f"    → {suggestion['recommendation']}")
 
     # NEW: Layout Optimization Suggestions
     if result.layout_suggestions:
-        print(f"\n🏗️  LAYOUT OPTIMIZATION SUGGESTIONS")
-        print(f"{'─'*80}")
+        emit(f"\n🏗️  LAYOUT OPTIMIZATION SUGGESTIONS")
+        emit(_THIN_RULE)
         for suggestion in result.layout_suggestions:
-            severity_icon = {'warning': '⚠️', 'info': 'ℹ️', 'error': '❌'}.get(suggestion['severity'], 'ℹ️')
-            print(f"\n{severity_icon}  {suggestion['message']}")
-            print(f"  Widgets: {', '.join(suggestion['widgets'][:5])}")
-            if len(suggestion['widgets']) > 5:
-                print(f"           ... and {len(suggestion['widgets']) - 5} more")
-            print(f"  → {suggestion['recommendation']}")
+            severity_icon = _SEVERITY_ICONS.get(suggestion['severity'], 'ℹ️')
+            emit(f"\n{severity_icon}  {suggestion['message']}")
+            suggestion_widgets = suggestion.get('widgets', [])
+            if suggestion_widgets:
+                emit(f"  Widgets: {', '.join(suggestion_widgets[:5])}")
+            if len(suggestion_widgets) > 5:
+                emit(f"           ... and {len(suggestion_widgets) - 5} more")
+            emit(f"  → {suggestion['recommendation']}")
             if 'benefit' in suggestion:
-                print(f"  ✨ Benefit: {suggestion['benefit']}")
+                emit(f"  ✨ Benefit: {suggestion['benefit']}")
 
     # NEW: Z-Order Analysis
     if result.z_order_analysis:
-        print(f"\n🔺 Z-ORDER & OCCLUSION ANALYSIS")
-        print(f"{'─'*80}")
-        print(f"Found {len(result.z_order_analysis)} overlapping widget pairs:\n")
+        emit(f"\n🔺 Z-ORDER & OCCLUSION ANALYSIS")
+        emit(_THIN_RULE)
+        emit(f"Found {len(result.z_order_analysis)} overlapping widget pairs:\n")
 
         for z_issue in result.z_order_analysis[:5]:  # Show first 5
-            severity_icon = '⚠️' if z_issue['severity'] == 'warning' else 'ℹ️'
-            print(f"{severity_icon}  {z_issue['message']}")
-            print(f"  Overlap area: {z_issue['overlap_area']}px² ({z_issue['bottom_covered_percent']:.1f}% of bottom widget)")
-            print(f"  → {z_issue['recommendation']}\n")
+            severity_icon = _SEVERITY_ICONS.get(z_issue['severity'], 'ℹ️')
+            emit(f"{severity_icon}  {z_issue['message']}")
+            emit(f"  Overlap area: {z_issue['overlap_area']}px² ({z_issue['bottom_covered_percent']:.1f}% of bottom widget)")
+            emit(f"  → {z_issue['recommendation']}\n")
 
         if len(result.z_order_analysis) > 5:
-            print(f"... and {len(result.z_order_analysis) - 5} more overlapping pairs")
+            emit(f"... and {len(result.z_order_analysis) - 5} more overlapping pairs")
 
     # Comprehensive Improvement Summary
     total_suggestions = (
@@ -1043,32 +1720,37 @@ def print_detailed_report(result: AnalysisResult):
     )
 
     if total_suggestions > 0:
-        print(f"\n💡 COMPREHENSIVE IMPROVEMENT SUMMARY")
-        print(f"{'─'*80}")
-        print(f"Total Improvement Opportunities: {total_suggestions}")
-        print(f"  • Alignment & Spacing: {len(result.alignment_analysis.get('suggestions', []))}")
-        print(f"  • Layout Optimization: {len(result.layout_suggestions)}")
-        print(f"  • Z-Order Issues: {len(result.z_order_analysis)}")
-
-    print(f"\n{'='*80}")
-    print("✅ ANALYSIS COMPLETE")
-    print(f"{'='*80}\n")
-
-
-def _print_tree(tree: Dict, widgets: Dict, node: str, level: int):
-    """Print widget tree recursively."""
-    indent = "  " * level
-    widget = widgets.get(node)
-
-    if widget:
-        issues_marker = f" ⚠️ ({len(widget.issues)})" if widget.issues else ""
-        print(f"{indent}├─ [{widget.widget_type}] {node}{issues_marker}")
-    else:
-        print(f"{indent}├─ {node}")
+        emit(f"\n💡 COMPREHENSIVE IMPROVEMENT SUMMARY")
+        emit(_THIN_RULE)
+        emit(f"Total Improvement Opportunities: {total_suggestions}")
+        emit(f"  • Alignment & Spacing: {len(result.alignment_analysis.get('suggestions', []))}")
+        emit(f"  • Layout Optimization: {len(result.layout_suggestions)}")
+        emit(f"  • Z-Order Issues: {len(result.z_order_analysis)}")
+
+    emit(f"\n{_RULE}")
+    emit("✅ ANALYSIS COMPLETE")
+    emit(f"{_RULE}\n")
+    return '\n'.join(out) + '\n'
+
+
+def _print_tree(tree: Dict, widgets: Dict, node: str, level: int, emit):
+    """Emit widget tree lines depth-first, with an explicit stack."""
+    stack = [(node, level)]
+    while stack:
+        node, level = stack.pop()
+        indent = _INDENTS[level] if level < len(_INDENTS) else "  " * level
+        widget = widgets.get(node)
+
+        if widget:
+            issues_marker = f" ⚠️ ({len(widget.issues)})" if widget.issues else ""
+            emit(f"{indent}├─ [{widget.widget_type}] {node}{issues_marker}")
+        else:
+            emit(f"{indent}├─ {node}")
 
-    if node in tree:
-        for child in tree[node]:
-            _print_tree(tree, widgets, child, level + 1)
+        # Reversed, so children pop in their original order
+        children = tree.get(node)
+        if children:
+            stack.extend((child, level + 1) for child in reversed(children))
 
 
 def main():
@@ -1076,38 +1758,27 @@ def main():
     import argparse
 
     parser = argparse.ArgumentParser(description='GUI Code Analyzer - Static Analysis for PySide6/PyQt6')
-    parser.add_argument('file', help='Path to Python UI file to analyze')
+    parser.add_argument('files', nargs='+', metavar='file', help='Path(s) to Python UI files to analyze')
     parser.add_argument('--json', action='store_true', help='Output as JSON')
 
     args = parser.parse_args()
 
     try:
         # Analyze
-        analyzer = GUICodeAnalyzer(args.file)
-        result = analyzer.analyze()
+        if len(args.files) == 1:
+            results = [GUICodeAnalyzer(args.files[0]).analyze()]
+        else:
+            results = analyze_many(args.files)
 
         # Output format
         if args.json:
-            # JSON output for programmatic use
-            import json
-            output = {
-                'file_path': result.file_path,
-                'timestamp': result.timestamp,
-                'statistics': result.statistics,
-                'widgets': {name: {
-                    'type': w.widget_type,
-                    'line': w.line_number,
-                    'parent': w.parent,
-                    'children': w.children,
-                    'issues': w.issues
-                } for name, w in result.widgets.items()},
-                'issues': result.issues,
-                'best_practices': result.best_practices
-            }
-            print(json.dumps(output, indent=2, ensure_ascii=False))
+            # JSON output for programmatic use (a list for several files)
+            output = [_result_to_json(result) for result in results]
+            print(_json_dumps(output[0] if len(output) == 1 else output))
         else:
             # Default: Detailed console output
-            print_detailed_report(result)
+            for result in results:
+                print_detailed_report(result)
 
     except Exception as e:
         print(f"❌ Error: {e}")
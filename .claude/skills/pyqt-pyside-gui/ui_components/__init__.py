@@ -27,8 +27,10 @@ from .components import (
     FormField,
     Card,
     ButtonGroup,
+    extend_form_layout,
     create_form_layout,
-    create_horizontal_group
+    create_horizontal_group,
+    use_gpu_viewport
 )
 from .constants import (
     ColorPalette,
@@ -69,8 +71,10 @@ __all__ = [
     'FormField',
     'Card',
     'ButtonGroup',
+    'extend_form_layout',
     'create_form_layout',
     'create_horizontal_group',
+    'use_gpu_viewport',
 
     # Constants
     'ColorPalette',
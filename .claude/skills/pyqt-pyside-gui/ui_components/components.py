@@ -14,17 +14,20 @@ Usage:
     # Create themed components
     btn = Button("Click Me", variant="primary")
     layout.addWidget(btn.widget)
+
+When composing nested forms, prefer extend_form_layout() on the layout
+you already have over wrapping each group in create_form_layout(), which
+adds a container widget per call.
 """
 
 from typing import Optional, Callable, List, Dict, Any, Tuple
 
 from PySide6.QtWidgets import (
-    QWidget, QVBoxLayout, QHBoxLayout, QLabel, QLineEdit, QTextEdit,
-    QPushButton, QFrame, QGroupBox, QCheckBox, QRadioButton, QComboBox,
-    QSpinBox, QDoubleSpinBox
+    QApplication, QWidget, QVBoxLayout, QHBoxLayout, QLabel, QLineEdit, QTextEdit,
+    QPushButton, QFrame, QComboBox, QSpinBox, QDoubleSpinBox
 )
-from PySide6.QtCore import Qt, Signal, QObject
-from PySide6.QtGui import QFont, QIcon
+from PySide6.QtCore import Qt, Signal, QObject, QSignalBlocker, QTimer
+from PySide6.QtGui import QIcon
 
 from .theme_loader import ThemeLoader
 from .constants import (
@@ -32,18 +35,82 @@ from .constants import (
     ButtonVariant, InputVariant, LabelVariant
 )
 
+# Milliseconds a form field waits after the last edit before validating
+VALIDATE_DELAY_MS = 150
+
+# Card title separator style, formatted once for every card
+_SEPARATOR_QSS = f"""
+    QFrame {{
+        background-color: {ColorPalette.BORDER};
+        max-height: 1px;
+    }}
+"""
+
+# Form field help and error label styles, formatted once for every field
+_HELP_LABEL_QSS = f"""
+    QLabel {{
+        color: {ColorPalette.TEXT_SECONDARY};
+        font-size: {Typography.FONT_SIZE_SMALL}px;
+    }}
+"""
+_ERROR_LABEL_QSS = f"""
+    QLabel {{
+        color: {ColorPalette.DANGER};
+        font-size: {Typography.FONT_SIZE_SMALL}px;
+    }}
+"""
+
 
 def get_current_theme():
     """Get currently loaded theme"""
     theme = ThemeLoader.get_current_theme()
     if theme is None:
-        # Load default theme if none loaded
+        # Load and apply default theme if none loaded
         theme = ThemeLoader.load_theme("default")
+        app = QApplication.instance()
+        if app is not None:
+            ThemeLoader.apply_theme_to_app(app, theme)
     return theme
 
 
-class BaseComponent(QObject):
-    """Base class for all components"""
+def _slug(text):
+    """Lower-case, underscored form of text for object names"""
+    return text.lower().replace(' ', '_')
+
+
+def set_theme_properties(widget, component, variant="default", **extra):
+    """Tag a widget so the app-wide theme stylesheet matches it"""
+    widget.setProperty("component", component)
+    widget.setProperty("variant", variant)
+    for name, value in extra.items():
+        widget.setProperty(name, value)
+
+
+def repolish(widget):
+    """Re-evaluate stylesheet rules after a dynamic property change"""
+    style = widget.style()
+    style.unpolish(widget)
+    style.polish(widget)
+
+
+def use_gpu_viewport(text_edit):
+    """Render a scroll area (e.g. a QTextEdit) through a QOpenGLWidget viewport
+    
+    Returns:
+        True if the GL viewport was installed, False if no GL context could
+        be created and the raster viewport was kept
+    """
+    from PySide6.QtGui import QOpenGLContext
+    from PySide6.QtOpenGLWidgets import QOpenGLWidget
+    
+    if not QOpenGLContext().create():
+        return False
+    text_edit.setViewport(QOpenGLWidget())
+    return True
+
+
+class BaseComponent:
+    """Base class for all components (plain Python, see SignalComponent)"""
     
     def __init__(self):
         super().__init__()
@@ -57,10 +124,26 @@ class BaseComponent(QObject):
     def get_widget(self):
         """Get the widget instance (lazy creation)"""
         if not self._created:
+            # Components only need some theme stylesheet applied; load the
+            # default just once, for the first widget ever created
+            if ThemeLoader.get_current_theme() is None:
+                get_current_theme()
             self.widget = self.create()
             self._created = True
+            self._bind_widget_methods()
         return self.widget
     
+    def _bind_widget_methods(self):
+        """Point the forwarding methods straight at the created widget,
+        so later calls skip the lazy-creation check"""
+        widget = self.widget
+        self.show = widget.show
+        self.hide = widget.hide
+        self.set_enabled = widget.setEnabled
+    
+    # No Python-side state is kept for show/hide/set_enabled: Qt already
+    # returns early when the visibility or enabled flag is unchanged, and a
+    # copy would go stale whenever the widget is changed directly
     def show(self):
         """Show the widget"""
         self.get_widget().show()
@@ -74,10 +157,22 @@ class BaseComponent(QObject):
         self.get_widget().setEnabled(enabled)
 
 
-class Button(BaseComponent):
-    """Themed button component"""
+class SignalComponent(BaseComponent, QObject):
+    """Base class for components that declare Qt signals
+    
+    Only these pay for a QObject; the rest stay plain Python objects.
+    """
+
+
+class Button(SignalComponent):
+    """Themed button component
+    
+    icon may be a QIcon or an image path; icons given by path are loaded
+    once and shared by every button using the same path.
+    """
     
     clicked = Signal()
+    _icon_cache: Dict[str, QIcon] = {}
     
     def __init__(self, text, variant="primary", size="normal", 
                  icon=None, min_width=None):
@@ -87,52 +182,52 @@ class Button(BaseComponent):
         self.size = size
         self.icon = icon
         self.min_width = min_width
+        self._slug = _slug(text)
     
     def create(self):
         """Create button widget"""
         button = QPushButton(self.text)
-        button.setObjectName(f"btn_{self.text.lower().replace(' ', '_')}")
-        
-        # Get theme and generate QSS
-        theme = get_current_theme()
-        qss = ThemeLoader.generate_qss("button", self.variant, theme)
-        
-        # Apply size modifications if not normal
-        if self.size != "normal":
-            size_style = theme.get_component_style("button", f"sizes.{self.size}")
-            if size_style:
-                # Add size-specific styles
-                size_qss_parts = []
-                for key, value in size_style.items():
-                    if not isinstance(value, dict):
-                        css_key = ThemeLoader._camel_to_kebab(key)
-                        size_qss_parts.append(f"{css_key}: {value}")
-                
-                if size_qss_parts:
-                    size_qss = "QPushButton { " + "; ".join(size_qss_parts) + "; }"
-                    qss = qss + "\n" + size_qss
-        
-        button.setStyleSheet(qss)
+        button.setObjectName(f"btn_{self._slug}")
+        set_theme_properties(button, "button", self.variant, size=self.size)
         
         # Set icon if provided
         if self.icon:
-            button.setIcon(self.icon)
+            icon = self.icon
+            if isinstance(icon, str):
+                cached = Button._icon_cache.get(icon)
+                if cached is None:
+                    cached = Button._icon_cache[icon] = QIcon(icon)
+                icon = cached
+            button.setIcon(icon)
         
         # Set minimum width
         if self.min_width:
             button.setMinimumWidth(self.min_width)
         
-        # Connect signal
-        button.clicked.connect(self.clicked.emit)
+        # Forward signal (signal-to-signal, no Python trampoline)
+        button.clicked.connect(self.clicked)
         
         return button
     
+    def _bind_widget_methods(self):
+        super()._bind_widget_methods()
+        self.set_text = self.widget.setText
+    
     def set_text(self, text):
         """Change button text"""
         self.get_widget().setText(text)
+    
+    def set_variant(self, variant):
+        """Switch to another theme variant, restyled by the app stylesheet"""
+        if variant == self.variant:
+            return
+        self.variant = variant
+        if self._created:
+            self.widget.setProperty("variant", variant)
+            repolish(self.widget)
 
 
-class Input(BaseComponent):
+class Input(SignalComponent):
     """Themed input field component"""
     
     textChanged = Signal(str)
@@ -146,6 +241,7 @@ class Input(BaseComponent):
         self.multiline = multiline
         self.max_length = max_length
         self.read_only = read_only
+        self._slug = _slug(placeholder)
     
     def create(self):
         """Create input widget"""
@@ -154,7 +250,7 @@ class Input(BaseComponent):
             widget.setPlaceholderText(self.placeholder)
             if self.read_only:
                 widget.setReadOnly(True)
-            widget.textChanged.connect(lambda: self.textChanged.emit(widget.toPlainText()))
+            widget.textChanged.connect(self._emit_plain_text)
         else:
             widget = QLineEdit()
             widget.setPlaceholderText(self.placeholder)
@@ -168,18 +264,18 @@ class Input(BaseComponent):
             if self.read_only:
                 widget.setReadOnly(True)
             
-            widget.textChanged.connect(self.textChanged.emit)
-            widget.returnPressed.connect(self.returnPressed.emit)
+            widget.textChanged.connect(self.textChanged)
+            widget.returnPressed.connect(self.returnPressed)
         
-        widget.setObjectName(f"input_{self.placeholder.lower().replace(' ', '_')}")
-        
-        # Apply theme
-        theme = get_current_theme()
-        qss = ThemeLoader.generate_qss("input", "default", theme)
-        widget.setStyleSheet(qss)
+        widget.setObjectName(f"input_{self._slug}")
+        set_theme_properties(widget, "input")
         
         return widget
     
+    def _emit_plain_text(self):
+        """Forward a multiline edit as textChanged(str)"""
+        self.textChanged.emit(self.widget.toPlainText())
+    
     def get_value(self):
         """Get current value"""
         if isinstance(self.widget, QTextEdit):
@@ -209,33 +305,49 @@ class Label(BaseComponent):
         self.text = text
         self.variant = variant
         self.alignment = alignment
+        self._slug = _slug(text)[:20]
     
     def create(self):
         """Create label widget"""
         label = QLabel(self.text)
-        label.setObjectName(f"label_{self.text.lower().replace(' ', '_')[:20]}")
-
-        # Apply theme
-        theme = get_current_theme()
-        qss = ThemeLoader.generate_qss("label", self.variant, theme)
-        label.setStyleSheet(qss)
+        label.setObjectName(f"label_{self._slug}")
+        set_theme_properties(label, "label", self.variant)
         label.setAlignment(self.alignment)
         label.setWordWrap(True)
 
         return label
     
+    def _bind_widget_methods(self):
+        super()._bind_widget_methods()
+        self.set_text = self.widget.setText
+    
     def set_text(self, text):
         """Change label text"""
         self.get_widget().setText(text)
 
 
-class FormField(BaseComponent):
+class FormField(SignalComponent):
     """Complete form field with label and input"""
     
     valueChanged = Signal(str)
     
+    # Text input types are Input components built with these options
+    _TEXT_INPUTS = {
+        "text": {},
+        "password": {"password": True},
+        "multiline": {"multiline": True},
+    }
+    
+    # Other input types are plain Qt widgets tagged with a theme component
+    _WIDGET_INPUTS = {
+        "number": (QSpinBox, "input"),
+        "decimal": (QDoubleSpinBox, "input"),
+        "combo": (QComboBox, "comboBox"),
+    }
+    
     def __init__(self, label, input_type="text", placeholder="",
-                 required=False, validator=None, help_text=""):
+                 required=False, validator=None, help_text="",
+                 input_validator=None, input_error="Invalid value"):
         super().__init__()
         self.label_text = label
         self.input_type = input_type
@@ -243,16 +355,23 @@ class FormField(BaseComponent):
         self.required = required
         self.validator = validator
         self.help_text = help_text
-
-        # Keep reference to Input component to prevent garbage collection
+        # Optional QValidator enforced by Qt on QLineEdit inputs
+        self.input_validator = input_validator
+        self.input_error = input_error
+        # Shared by the container and input object names
+        self._field_slug = _slug(label)
+
+        # Keep references to child components to prevent garbage collection
+        self.label_component = None
         self.input_component = None
         self.input_widget = None
         self.error_label = None
+        self._validate_timer = None
     
     def create(self):
         """Create form field widget"""
         container = QWidget()
-        container.setObjectName(f"form_field_{self.label_text.lower().replace(' ', '_')}")
+        container.setObjectName(f"form_field_{self._field_slug}")
         layout = QVBoxLayout(container)
         layout.setContentsMargins(0, 0, 0, Spacing.NORMAL)
         layout.setSpacing(Spacing.XSMALL)
@@ -262,99 +381,118 @@ class FormField(BaseComponent):
         if self.required:
             label_text += " *"
         
-        label = Label(label_text, variant="normal").get_widget()
-        layout.addWidget(label)
+        self.label_component = Label(label_text, variant="normal")
+        layout.addWidget(self.label_component.get_widget())
         
         # Input based on type
         # IMPORTANT: Keep reference to Input component to prevent garbage collection
-        if self.input_type == "text":
-            self.input_component = Input(self.placeholder)
-            self.input_widget = self.input_component.get_widget()
-        elif self.input_type == "password":
-            self.input_component = Input(self.placeholder, password=True)
-            self.input_widget = self.input_component.get_widget()
-        elif self.input_type == "multiline":
-            self.input_component = Input(self.placeholder, multiline=True)
+        options = self._TEXT_INPUTS.get(self.input_type)
+        if options is not None:
+            self.input_component = Input(self.placeholder, **options)
             self.input_widget = self.input_component.get_widget()
-        elif self.input_type == "number":
-            self.input_widget = QSpinBox()
-            theme = get_current_theme()
-            qss = ThemeLoader.generate_qss("input", "default", theme)
-            self.input_widget.setStyleSheet(qss)
-        elif self.input_type == "decimal":
-            self.input_widget = QDoubleSpinBox()
-            theme = get_current_theme()
-            qss = ThemeLoader.generate_qss("input", "default", theme)
-            self.input_widget.setStyleSheet(qss)
-        elif self.input_type == "combo":
-            self.input_widget = QComboBox()
-            theme = get_current_theme()
-            qss = ThemeLoader.generate_qss("comboBox", "default", theme)
-            self.input_widget.setStyleSheet(qss)
+        else:
+            try:
+                widget_class, component = self._WIDGET_INPUTS[self.input_type]
+            except KeyError:
+                raise ValueError(f"Unknown input_type: {self.input_type!r}") from None
+            self.input_widget = widget_class()
+            set_theme_properties(self.input_widget, component)
         
-        self.input_widget.setObjectName(f"input_{self.label_text.lower().replace(' ', '_')}")
+        self.input_widget.setObjectName(f"input_{self._field_slug}")
+        self._bind_accessors(self.input_widget)
+        if self.input_validator and isinstance(self.input_widget, QLineEdit):
+            self.input_widget.setValidator(self.input_validator)
         layout.addWidget(self.input_widget)
         
         # Help text
         if self.help_text:
             help_label = QLabel(self.help_text)
-            help_label.setStyleSheet(f"""
-                QLabel {{
-                    color: {ColorPalette.TEXT_SECONDARY};
-                    font-size: {Typography.FONT_SIZE_SMALL}px;
-                }}
-            """)
+            help_label.setStyleSheet(_HELP_LABEL_QSS)
             layout.addWidget(help_label)
         
         # Error label (hidden by default)
         self.error_label = QLabel()
-        self.error_label.setStyleSheet(f"""
-            QLabel {{
-                color: {ColorPalette.DANGER};
-                font-size: {Typography.FONT_SIZE_SMALL}px;
-            }}
-        """)
+        self.error_label.setStyleSheet(_ERROR_LABEL_QSS)
         self.error_label.hide()
         layout.addWidget(self.error_label)
         
+        # Validate once typing pauses instead of on every keystroke
+        self._validate_timer = QTimer(container)
+        self._validate_timer.setSingleShot(True)
+        self._validate_timer.setInterval(VALIDATE_DELAY_MS)
+        self._validate_timer.timeout.connect(self.validate)
+        
         # Connect value changed
         if hasattr(self.input_widget, 'textChanged'):
-            self.input_widget.textChanged.connect(lambda: self._on_value_changed())
+            self.input_widget.textChanged.connect(self._on_value_changed)
         
         return container
     
     def _on_value_changed(self):
-        """Handle value change"""
-        self.validate()
+        """Handle value change (validation is deferred, see VALIDATE_DELAY_MS)"""
+        self._validate_timer.start()
         self.valueChanged.emit(self.get_value())
     
+    # Until create() binds the input's own accessors there is no value
+    @staticmethod
+    def _getter():
+        return None
+    
+    @staticmethod
+    def _setter(value):
+        pass
+    
+    def _bind_accessors(self, widget):
+        """Resolve the input's getter and setter once, by widget type"""
+        if isinstance(widget, QLineEdit):
+            setter = widget.setText
+            self._getter = widget.text
+            self._setter = lambda value: setter(str(value))
+        elif isinstance(widget, QTextEdit):
+            setter = widget.setPlainText
+            self._getter = widget.toPlainText
+            self._setter = lambda value: setter(str(value))
+        elif isinstance(widget, (QSpinBox, QDoubleSpinBox)):
+            self._getter = widget.value
+            self._setter = widget.setValue
+        elif isinstance(widget, QComboBox):
+            self._getter = widget.currentText
+            self._setter = self._set_combo_text
+    
+    def _set_combo_text(self, value):
+        """Select the combo item with the given text, if present"""
+        index = self.input_widget.findText(str(value))
+        if index >= 0:
+            self.input_widget.setCurrentIndex(index)
+    
     def get_value(self):
         """Get field value"""
-        if isinstance(self.input_widget, (QLineEdit, QTextEdit)):
-            if isinstance(self.input_widget, QTextEdit):
-                return self.input_widget.toPlainText()
-            return self.input_widget.text()
-        elif isinstance(self.input_widget, (QSpinBox, QDoubleSpinBox)):
-            return self.input_widget.value()
-        elif isinstance(self.input_widget, QComboBox):
-            return self.input_widget.currentText()
-        return None
+        return self._getter()
     
-    def set_value(self, value):
-        """Set field value"""
-        if isinstance(self.input_widget, QLineEdit):
-            self.input_widget.setText(str(value))
-        elif isinstance(self.input_widget, QTextEdit):
-            self.input_widget.setPlainText(str(value))
-        elif isinstance(self.input_widget, (QSpinBox, QDoubleSpinBox)):
-            self.input_widget.setValue(value)
-        elif isinstance(self.input_widget, QComboBox):
-            index = self.input_widget.findText(str(value))
-            if index >= 0:
-                self.input_widget.setCurrentIndex(index)
+    def set_value(self, value, validate=True):
+        """Set field value
+
+        With validate=False the input's change signals are blocked, so no
+        validator or valueChanged runs, and any shown error is cleared.
+        Before create() there is no input, and this does nothing.
+        """
+        if self.input_widget is None:
+            return
+
+        if not validate:
+            with QSignalBlocker(self.input_widget):
+                self.set_value(value)
+            self._validate_timer.stop()  # Drop a validation still pending from edits
+            self.clear_error()
+            return
+
+        self._setter(value)
     
     def validate(self):
         """Validate field value"""
+        if self.input_widget is None:
+            raise RuntimeError("FormField.validate(): call create() first")
+
         value = self.get_value()
         
         # Required validation
@@ -362,6 +500,13 @@ class FormField(BaseComponent):
             self.show_error("This field is required")
             return False
         
+        # Qt-side validator (checked in C++, no Python round-trip)
+        if (self.input_validator and value
+                and isinstance(self.input_widget, QLineEdit)
+                and not self.input_widget.hasAcceptableInput()):
+            self.show_error(self.input_error)
+            return False
+        
         # Custom validator
         if self.validator and value:
             is_valid, error_msg = self.validator(value)
@@ -377,27 +522,19 @@ class FormField(BaseComponent):
         self.error_label.setText(message)
         self.error_label.show()
 
-        # Highlight input
-        if isinstance(self.input_widget, (QLineEdit, QTextEdit)):
-            theme = get_current_theme()
-            base_qss = ThemeLoader.generate_qss("input", "default", theme)
-            error_qss = f"""
-                {base_qss}
-                QLineEdit, QTextEdit {{
-                    border-color: {ColorPalette.DANGER};
-                }}
-            """
-            self.input_widget.setStyleSheet(error_qss)
+        # Highlight input (matched by the theme's error rule)
+        if not self.input_widget.property("error"):
+            self.input_widget.setProperty("error", True)
+            repolish(self.input_widget)
     
     def clear_error(self) -> None:
         """Clear validation error"""
         self.error_label.hide()
 
         # Reset input style
-        if isinstance(self.input_widget, (QLineEdit, QTextEdit)):
-            theme = get_current_theme()
-            qss = ThemeLoader.generate_qss("input", "default", theme)
-            self.input_widget.setStyleSheet(qss)
+        if self.input_widget.property("error"):
+            self.input_widget.setProperty("error", False)
+            repolish(self.input_widget)
 
 
 class Card(BaseComponent):
@@ -408,16 +545,13 @@ class Card(BaseComponent):
         self.title = title
         self.padding = padding
         self.content_layout = None
+        self.title_component = None
     
     def create(self):
         """Create card widget"""
         container = QFrame()
         container.setObjectName("card")
-
-        # Apply theme
-        theme = get_current_theme()
-        qss = ThemeLoader.generate_qss("card", "default", theme)
-        container.setStyleSheet(qss)
+        set_theme_properties(container, "card")
 
         layout = QVBoxLayout(container)
         padding = self.padding
@@ -426,18 +560,13 @@ class Card(BaseComponent):
         
         # Title if provided
         if self.title:
-            title_label = Label(self.title, variant="heading").get_widget()
-            layout.addWidget(title_label)
+            self.title_component = Label(self.title, variant="heading")
+            layout.addWidget(self.title_component.get_widget())
             
             # Separator
             separator = QFrame()
             separator.setFrameShape(QFrame.HLine)
-            separator.setStyleSheet(f"""
-                QFrame {{
-                    background-color: {ColorPalette.BORDER};
-                    max-height: 1px;
-                }}
-            """)
+            separator.setStyleSheet(_SEPARATOR_QSS)
             layout.addWidget(separator)
         
         # Content layout
@@ -455,6 +584,16 @@ class Card(BaseComponent):
     def add_component(self, component):
         """Add component to card content"""
         self.add_widget(component.get_widget())
+    
+    def add_row(self, widgets, stretch=False):
+        """Add widgets side by side as one row of card content"""
+        self.get_widget()  # Ensure created
+        row = QHBoxLayout()
+        for widget in widgets:
+            row.addWidget(widget)
+        if stretch:
+            row.addStretch()
+        self.content_layout.addLayout(row)
 
 
 class ButtonGroup(BaseComponent):
@@ -465,7 +604,9 @@ class ButtonGroup(BaseComponent):
         self.buttons = buttons  # List of (text, variant, callback)
         self.alignment = alignment
         self.spacing = spacing
-        self.button_widgets = {}
+        # Buttons in group order, plus the index of each text's button
+        self.button_widgets = []
+        self._by_text = {}
     
     def create(self):
         """Create button group"""
@@ -476,8 +617,9 @@ class ButtonGroup(BaseComponent):
         layout.setContentsMargins(0, 0, 0, 0)
         layout.setSpacing(self.spacing)
         
-        # Add stretch based on alignment
-        if self.alignment == "right":
+        # Leading stretch pushes the buttons right (or, paired with the
+        # trailing one, centers them), so nothing is inserted in front later
+        if self.alignment in ("right", "center"):
             layout.addStretch()
         
         # Create buttons
@@ -493,35 +635,39 @@ class ButtonGroup(BaseComponent):
                 button.clicked.connect(callback)
             
             layout.addWidget(button.get_widget())
-            self.button_widgets[text] = button
+            self._by_text[text] = len(self.button_widgets)
+            self.button_widgets.append(button)
         
-        # Add stretch for other alignments
-        if self.alignment == "left":
-            layout.addStretch()
-        elif self.alignment == "center":
-            layout.insertStretch(0)
+        # Trailing stretch for left and center alignment
+        if self.alignment in ("left", "center"):
             layout.addStretch()
         
         return container
     
     def get_button(self, text):
-        """Get button by text"""
-        return self.button_widgets.get(text)
+        """Get button by text (the last one, if several share it)"""
+        index = self._by_text.get(text)
+        return None if index is None else self.button_widgets[index]
 
 
 # Convenience functions
+def extend_form_layout(layout, *fields):
+    """Append form fields (components or widgets) to an existing layout"""
+    for field in fields:
+        if isinstance(field, BaseComponent):
+            layout.addWidget(field.get_widget())
+        else:
+            layout.addWidget(field)
+    return layout
+
+
 def create_form_layout(*fields):
     """Create vertical layout with form fields"""
     container = QWidget()
     layout = QVBoxLayout(container)
     layout.setSpacing(Spacing.MEDIUM)
     layout.setContentsMargins(0, 0, 0, 0)
-    
-    for field in fields:
-        if isinstance(field, BaseComponent):
-            layout.addWidget(field.get_widget())
-        else:
-            layout.addWidget(field)
+    extend_form_layout(layout, *fields)
     
     return container
 
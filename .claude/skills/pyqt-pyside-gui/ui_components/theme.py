@@ -6,6 +6,7 @@ All colors, fonts, spacing, and styling rules in one place.
 """
 
 from enum import Enum
+from functools import lru_cache
 
 
 class ColorPalette:
@@ -140,135 +141,255 @@ class ButtonVariant(Enum):
     TEXT = "text"
 
 
-class Theme:
-    """Main theme class with pre-built stylesheets"""
-    
-    @staticmethod
-    def button(variant=ButtonVariant.PRIMARY, size="normal"):
-        """Get button stylesheet"""
-        
-        # Color mapping
-        color_map = {
-            ButtonVariant.PRIMARY: (ColorPalette.PRIMARY, ColorPalette.PRIMARY_DARK),
-            ButtonVariant.SECONDARY: (ColorPalette.SECONDARY, ColorPalette.SECONDARY_DARK),
-            ButtonVariant.SUCCESS: (ColorPalette.SUCCESS, ColorPalette.SUCCESS_DARK),
-            ButtonVariant.DANGER: (ColorPalette.DANGER, ColorPalette.DANGER_DARK),
-            ButtonVariant.WARNING: (ColorPalette.WARNING, ColorPalette.WARNING_DARK),
-            ButtonVariant.INFO: (ColorPalette.INFO, ColorPalette.INFO_DARK),
-        }
-        
-        # Size mapping
-        size_map = {
-            "small": (Spacing.XSMALL, Spacing.NORMAL, Typography.FONT_SIZE_SMALL),
-            "normal": (Spacing.SMALL, Spacing.MEDIUM, Typography.FONT_SIZE_NORMAL),
-            "large": (Spacing.MEDIUM, Spacing.LARGE, Typography.FONT_SIZE_LARGE),
-        }
-        
-        padding_v, padding_h, font_size = size_map.get(size, size_map["normal"])
-        
-        if variant == ButtonVariant.OUTLINE:
-            return f"""
-                QPushButton {{
+def _button_maps():
+    """(background, hover) colors by variant and (vertical padding,
+    horizontal padding, font size) by size, read from the palette classes"""
+    color_map = {
+        ButtonVariant.PRIMARY: (ColorPalette.PRIMARY, ColorPalette.PRIMARY_DARK),
+        ButtonVariant.SECONDARY: (ColorPalette.SECONDARY, ColorPalette.SECONDARY_DARK),
+        ButtonVariant.SUCCESS: (ColorPalette.SUCCESS, ColorPalette.SUCCESS_DARK),
+        ButtonVariant.DANGER: (ColorPalette.DANGER, ColorPalette.DANGER_DARK),
+        ButtonVariant.WARNING: (ColorPalette.WARNING, ColorPalette.WARNING_DARK),
+        ButtonVariant.INFO: (ColorPalette.INFO, ColorPalette.INFO_DARK),
+    }
+    size_map = {
+        "small": (Spacing.XSMALL, Spacing.NORMAL, Typography.FONT_SIZE_SMALL),
+        "normal": (Spacing.SMALL, Spacing.MEDIUM, Typography.FONT_SIZE_NORMAL),
+        "large": (Spacing.MEDIUM, Spacing.LARGE, Typography.FONT_SIZE_LARGE),
+    }
+    return color_map, size_map
+
+
+# Built once at import; Theme.clear_cache() rebuilds them from the palette
+_BUTTON_COLOR_MAP, _BUTTON_SIZE_MAP = _button_maps()
+
+
+# Button stylesheet templates, filled in by Theme.button with format_map;
+# {selector} is QPushButton, or a property selector in compose_full_sheet
+_BUTTON_OUTLINE_QSS = """
+                {selector} {{
                     background-color: transparent;
-                    color: {ColorPalette.PRIMARY};
-                    border: 2px solid {ColorPalette.PRIMARY};
-                    border-radius: {BorderRadius.NORMAL}px;
+                    color: {primary};
+                    border: 2px solid {primary};
+                    border-radius: {radius}px;
                     padding: {padding_v}px {padding_h}px;
                     font-size: {font_size}px;
-                    font-weight: {Typography.FONT_WEIGHT_MEDIUM};
-                    font-family: {Typography.FONT_FAMILY};
+                    font-weight: {font_weight};
+                    font-family: {font_family};
                 }}
-                QPushButton:hover {{
-                    background-color: {ColorPalette.PRIMARY_LIGHT};
+                {selector}:hover {{
+                    background-color: {primary_light};
                     color: white;
-                    border-color: {ColorPalette.PRIMARY_LIGHT};
+                    border-color: {primary_light};
                 }}
-                QPushButton:pressed {{
-                    background-color: {ColorPalette.PRIMARY_DARK};
-                    border-color: {ColorPalette.PRIMARY_DARK};
+                {selector}:pressed {{
+                    background-color: {primary_dark};
+                    border-color: {primary_dark};
                 }}
-                QPushButton:disabled {{
+                {selector}:disabled {{
                     background-color: transparent;
-                    color: {ColorPalette.TEXT_DISABLED};
-                    border-color: {ColorPalette.BORDER};
+                    color: {text_disabled};
+                    border-color: {border};
                 }}
             """
-        
-        elif variant == ButtonVariant.TEXT:
-            return f"""
-                QPushButton {{
+
+_BUTTON_TEXT_QSS = """
+                {selector} {{
                     background-color: transparent;
-                    color: {ColorPalette.PRIMARY};
+                    color: {primary};
                     border: none;
                     padding: {padding_v}px {padding_h}px;
                     font-size: {font_size}px;
-                    font-weight: {Typography.FONT_WEIGHT_MEDIUM};
-                    font-family: {Typography.FONT_FAMILY};
+                    font-weight: {font_weight};
+                    font-family: {font_family};
                 }}
-                QPushButton:hover {{
-                    background-color: {ColorPalette.SURFACE_HOVER};
+                {selector}:hover {{
+                    background-color: {surface_hover};
                 }}
-                QPushButton:pressed {{
-                    background-color: {ColorPalette.BORDER};
+                {selector}:pressed {{
+                    background-color: {border};
                 }}
-                QPushButton:disabled {{
-                    color: {ColorPalette.TEXT_DISABLED};
+                {selector}:disabled {{
+                    color: {text_disabled};
                 }}
             """
-        
-        else:
-            bg_color, bg_hover = color_map.get(variant, color_map[ButtonVariant.PRIMARY])
-            
-            return f"""
-                QPushButton {{
+
+_BUTTON_FILLED_QSS = """
+                {selector} {{
                     background-color: {bg_color};
-                    color: {ColorPalette.TEXT_ON_PRIMARY};
+                    color: {text_on_primary};
                     border: none;
-                    border-radius: {BorderRadius.NORMAL}px;
+                    border-radius: {radius}px;
                     padding: {padding_v}px {padding_h}px;
                     font-size: {font_size}px;
-                    font-weight: {Typography.FONT_WEIGHT_MEDIUM};
-                    font-family: {Typography.FONT_FAMILY};
+                    font-weight: {font_weight};
+                    font-family: {font_family};
                 }}
-                QPushButton:hover {{
+                {selector}:hover {{
                     background-color: {bg_hover};
                 }}
-                QPushButton:pressed {{
+                {selector}:pressed {{
                     background-color: {bg_hover};
                 }}
-                QPushButton:disabled {{
-                    background-color: {ColorPalette.BORDER};
-                    color: {ColorPalette.TEXT_DISABLED};
+                {selector}:disabled {{
+                    background-color: {border};
+                    color: {text_disabled};
                 }}
             """
-    
-    @staticmethod
-    def input():
-        """Get input field stylesheet"""
-        return f"""
+
+
+# Input, table and combo box stylesheet templates, filled in the same way
+_INPUT_QSS = """
             QLineEdit, QTextEdit, QPlainTextEdit {{
-                background-color: {ColorPalette.SURFACE};
-                color: {ColorPalette.TEXT_PRIMARY};
-                border: 2px solid {ColorPalette.BORDER};
-                border-radius: {BorderRadius.NORMAL}px;
-                padding: {Spacing.SMALL}px;
-                font-size: {Typography.FONT_SIZE_NORMAL}px;
-                font-family: {Typography.FONT_FAMILY};
-                selection-background-color: {ColorPalette.PRIMARY};
-                selection-color: {ColorPalette.TEXT_ON_PRIMARY};
+                background-color: {surface};
+                color: {text_primary};
+                border: 2px solid {border};
+                border-radius: {radius_normal}px;
+                padding: {spacing_small}px;
+                font-size: {font_size_normal}px;
+                font-family: {font_family};
+                selection-background-color: {primary};
+                selection-color: {text_on_primary};
             }}
             QLineEdit:focus, QTextEdit:focus, QPlainTextEdit:focus {{
-                border-color: {ColorPalette.BORDER_FOCUS};
+                border-color: {border_focus};
             }}
             QLineEdit:disabled, QTextEdit:disabled, QPlainTextEdit:disabled {{
-                background-color: {ColorPalette.BACKGROUND};
-                color: {ColorPalette.TEXT_DISABLED};
-                border-color: {ColorPalette.BORDER};
+                background-color: {background};
+                color: {text_disabled};
+                border-color: {border};
             }}
         """
+
+_TABLE_QSS = """
+            QTableWidget, QTableView {{
+                background-color: {surface};
+                alternate-background-color: {background};
+                gridline-color: {border};
+                border: 1px solid {border};
+                border-radius: {radius_normal}px;
+                selection-background-color: {primary_light};
+                selection-color: {text_primary};
+            }}
+            QTableWidget::item, QTableView::item {{
+                padding: {spacing_small}px;
+            }}
+            QTableWidget::item:hover, QTableView::item:hover {{
+                background-color: {surface_hover};
+            }}
+            QHeaderView::section {{
+                background-color: {background};
+                color: {text_primary};
+                padding: {spacing_small}px;
+                border: none;
+                border-bottom: 2px solid {border_dark};
+                font-weight: {font_weight_medium};
+            }}
+        """
+
+_COMBO_BOX_QSS = """
+            QComboBox {{
+                background-color: {surface};
+                color: {text_primary};
+                border: 2px solid {border};
+                border-radius: {radius_normal}px;
+                padding: {spacing_small}px;
+                font-size: {font_size_normal}px;
+                font-family: {font_family};
+            }}
+            QComboBox:hover {{
+                border-color: {primary};
+            }}
+            QComboBox:focus {{
+                border-color: {border_focus};
+            }}
+            QComboBox::drop-down {{
+                border: none;
+                width: 20px;
+            }}
+            QComboBox::down-arrow {{
+                width: 12px;
+                height: 12px;
+            }}
+            QComboBox QAbstractItemView {{
+                background-color: {surface};
+                border: 1px solid {border};
+                selection-background-color: {primary};
+                selection-color: {text_on_primary};
+            }}
+        """
+
+
+class Theme:
+    """Main theme class with pre-built stylesheets
+    
+    Each stylesheet is built once per argument combination and the same
+    string is returned afterwards; call clear_cache() after changing the
+    palette classes at runtime.
+    
+    compose_full_sheet() combines the builders into one application
+    stylesheet whose button, label and card rules are scoped by dynamic
+    properties, so widgets are styled with set_style_properties() instead
+    of a stylesheet each.
+    """
     
     @staticmethod
-    def label(variant="normal"):
+    @lru_cache(maxsize=None)
+    def button(variant=ButtonVariant.PRIMARY, size="normal", selector="QPushButton"):
+        """Get button stylesheet"""
+        padding_v, padding_h, font_size = _BUTTON_SIZE_MAP.get(size, _BUTTON_SIZE_MAP["normal"])
+        bg_color, bg_hover = _BUTTON_COLOR_MAP.get(variant, _BUTTON_COLOR_MAP[ButtonVariant.PRIMARY])
+        
+        values = {
+            "primary": ColorPalette.PRIMARY,
+            "primary_light": ColorPalette.PRIMARY_LIGHT,
+            "primary_dark": ColorPalette.PRIMARY_DARK,
+            "text_on_primary": ColorPalette.TEXT_ON_PRIMARY,
+            "text_disabled": ColorPalette.TEXT_DISABLED,
+            "border": ColorPalette.BORDER,
+            "surface_hover": ColorPalette.SURFACE_HOVER,
+            "bg_color": bg_color,
+            "bg_hover": bg_hover,
+            "radius": BorderRadius.NORMAL,
+            "padding_v": padding_v,
+            "padding_h": padding_h,
+            "font_size": font_size,
+            "font_weight": Typography.FONT_WEIGHT_MEDIUM,
+            "font_family": Typography.FONT_FAMILY,
+            "selector": selector,
+        }
+        
+        if variant == ButtonVariant.OUTLINE:
+            return _BUTTON_OUTLINE_QSS.format_map(values)
+        
+        elif variant == ButtonVariant.TEXT:
+            return _BUTTON_TEXT_QSS.format_map(values)
+        
+        else:
+            return _BUTTON_FILLED_QSS.format_map(values)
+    
+    @staticmethod
+    @lru_cache(maxsize=None)
+    def input():
+        """Get input field stylesheet"""
+        return _INPUT_QSS.format_map({
+            "surface": ColorPalette.SURFACE,
+            "text_primary": ColorPalette.TEXT_PRIMARY,
+            "border": ColorPalette.BORDER,
+            "radius_normal": BorderRadius.NORMAL,
+            "spacing_small": Spacing.SMALL,
+            "font_size_normal": Typography.FONT_SIZE_NORMAL,
+            "font_family": Typography.FONT_FAMILY,
+            "primary": ColorPalette.PRIMARY,
+            "text_on_primary": ColorPalette.TEXT_ON_PRIMARY,
+            "border_focus": ColorPalette.BORDER_FOCUS,
+            "background": ColorPalette.BACKGROUND,
+            "text_disabled": ColorPalette.TEXT_DISABLED,
+        })
+    
+    @staticmethod
+    @lru_cache(maxsize=None)
+    def label(variant="normal", selector="QLabel"):
         """Get label stylesheet"""
         variants = {
             "title": (Typography.FONT_SIZE_XLARGE, Typography.FONT_WEIGHT_BOLD),
@@ -281,7 +402,7 @@ class Theme:
         font_size, font_weight = variants.get(variant, variants["normal"])
         
         return f"""
-            QLabel {{
+            {selector} {{
                 color: {ColorPalette.TEXT_PRIMARY};
                 font-size: {font_size}px;
                 font-weight: {font_weight};
@@ -290,10 +411,11 @@ class Theme:
         """
     
     @staticmethod
-    def card():
+    @lru_cache(maxsize=None)
+    def card(selector="QWidget"):
         """Get card/panel stylesheet"""
         return f"""
-            QWidget {{
+            {selector} {{
                 background-color: {ColorPalette.SURFACE};
                 border: 1px solid {ColorPalette.BORDER};
                 border-radius: {BorderRadius.MEDIUM}px;
@@ -301,74 +423,77 @@ class Theme:
         """
     
     @staticmethod
+    @lru_cache(maxsize=None)
     def table():
         """Get table stylesheet"""
-        return f"""
-            QTableWidget, QTableView {{
-                background-color: {ColorPalette.SURFACE};
-                alternate-background-color: {ColorPalette.BACKGROUND};
-                gridline-color: {ColorPalette.BORDER};
-                border: 1px solid {ColorPalette.BORDER};
-                border-radius: {BorderRadius.NORMAL}px;
-                selection-background-color: {ColorPalette.PRIMARY_LIGHT};
-                selection-color: {ColorPalette.TEXT_PRIMARY};
-            }}
-            QTableWidget::item, QTableView::item {{
-                padding: {Spacing.SMALL}px;
-            }}
-            QTableWidget::item:hover, QTableView::item:hover {{
-                background-color: {ColorPalette.SURFACE_HOVER};
-            }}
-            QHeaderView::section {{
-                background-color: {ColorPalette.BACKGROUND};
-                color: {ColorPalette.TEXT_PRIMARY};
-                padding: {Spacing.SMALL}px;
-                border: none;
-                border-bottom: 2px solid {ColorPalette.BORDER_DARK};
-                font-weight: {Typography.FONT_WEIGHT_MEDIUM};
-            }}
-        """
+        return _TABLE_QSS.format_map({
+            "surface": ColorPalette.SURFACE,
+            "background": ColorPalette.BACKGROUND,
+            "border": ColorPalette.BORDER,
+            "radius_normal": BorderRadius.NORMAL,
+            "primary_light": ColorPalette.PRIMARY_LIGHT,
+            "text_primary": ColorPalette.TEXT_PRIMARY,
+            "spacing_small": Spacing.SMALL,
+            "surface_hover": ColorPalette.SURFACE_HOVER,
+            "border_dark": ColorPalette.BORDER_DARK,
+            "font_weight_medium": Typography.FONT_WEIGHT_MEDIUM,
+        })
     
     @staticmethod
+    @lru_cache(maxsize=None)
     def combo_box():
         """Get combo box stylesheet"""
-        return f"""
-            QComboBox {{
-                background-color: {ColorPalette.SURFACE};
-                color: {ColorPalette.TEXT_PRIMARY};
-                border: 2px solid {ColorPalette.BORDER};
-                border-radius: {BorderRadius.NORMAL}px;
-                padding: {Spacing.SMALL}px;
-                font-size: {Typography.FONT_SIZE_NORMAL}px;
-                font-family: {Typography.FONT_FAMILY};
-            }}
-            QComboBox:hover {{
-                border-color: {ColorPalette.PRIMARY};
-            }}
-            QComboBox:focus {{
-                border-color: {ColorPalette.BORDER_FOCUS};
-            }}
-            QComboBox::drop-down {{
-                border: none;
-                width: 20px;
-            }}
-            QComboBox::down-arrow {{
-                width: 12px;
-                height: 12px;
-            }}
-            QComboBox QAbstractItemView {{
-                background-color: {ColorPalette.SURFACE};
-                border: 1px solid {ColorPalette.BORDER};
-                selection-background-color: {ColorPalette.PRIMARY};
-                selection-color: {ColorPalette.TEXT_ON_PRIMARY};
-            }}
+        return _COMBO_BOX_QSS.format_map({
+            "surface": ColorPalette.SURFACE,
+            "text_primary": ColorPalette.TEXT_PRIMARY,
+            "border": ColorPalette.BORDER,
+            "radius_normal": BorderRadius.NORMAL,
+            "spacing_small": Spacing.SMALL,
+            "font_size_normal": Typography.FONT_SIZE_NORMAL,
+            "font_family": Typography.FONT_FAMILY,
+            "primary": ColorPalette.PRIMARY,
+            "border_focus": ColorPalette.BORDER_FOCUS,
+            "text_on_primary": ColorPalette.TEXT_ON_PRIMARY,
+        })
+    
+    @staticmethod
+    @lru_cache(maxsize=None)
+    def compose_full_sheet():
+        """Get the whole application stylesheet in one string
+        
+        Buttons match on their "variant" and "buttonSize" properties (QWidget
+        already has a "size" property), labels on "variant" and cards on
+        component="card"; widgets without those properties only get the
+        global, input, table and combo box rules.
         """
+        parts = [_global_qss(), Theme.input(), Theme.table(), Theme.combo_box()]
+        for variant in ButtonVariant:
+            for size in _BUTTON_SIZES:
+                selector = f'QPushButton[variant="{variant.value}"][buttonSize="{size}"]'
+                parts.append(Theme.button(variant, size, selector))
+        for variant in _LABEL_VARIANTS:
+            parts.append(Theme.label(variant, f'QLabel[variant="{variant}"]'))
+        parts.append(Theme.card('QWidget[component="card"]'))
+        return "\n".join(parts)
+    
+    @staticmethod
+    def clear_cache():
+        """Drop the built stylesheets so the next calls rebuild them"""
+        global _BUTTON_COLOR_MAP, _BUTTON_SIZE_MAP
+        _BUTTON_COLOR_MAP, _BUTTON_SIZE_MAP = _button_maps()
+        for builder in (Theme.button, Theme.input, Theme.label, Theme.card,
+                        Theme.table, Theme.combo_box, Theme.compose_full_sheet):
+            builder.cache_clear()
 
 
-# Convenience function
-def apply_theme_to_app(app):
-    """Apply global theme to QApplication"""
-    global_style = f"""
+# Property values covered by Theme.compose_full_sheet
+_BUTTON_SIZES = ("small", "normal", "large")
+_LABEL_VARIANTS = ("title", "heading", "normal", "small", "caption")
+
+
+def _global_qss():
+    """Application-wide base rules"""
+    return f"""
         * {{
             font-family: {Typography.FONT_FAMILY};
         }}
@@ -390,5 +515,23 @@ def apply_theme_to_app(app):
             border-radius: {BorderRadius.SMALL}px;
         }}
     """
+
+
+def set_style_properties(widget, **properties):
+    """Set the dynamic properties compose_full_sheet() matches on
     
-    app.setStyleSheet(global_style)
+    Example:
+        set_style_properties(button, variant=ButtonVariant.DANGER.value, buttonSize="large")
+    """
+    for name, value in properties.items():
+        widget.setProperty(name, value)
+    # Re-evaluate the stylesheet rules for the new property values
+    style = widget.style()
+    style.unpolish(widget)
+    style.polish(widget)
+
+
+# Convenience function
+def apply_theme_to_app(app):
+    """Apply the full theme stylesheet to QApplication (set once)"""
+    app.setStyleSheet(Theme.compose_full_sheet())
@@ -20,10 +20,41 @@ Usage:
     button_style = theme.get_component_style("button", "primary")
 """
 
+import hashlib
 import json
+import marshal
+import os
 import re
+from functools import lru_cache
 from pathlib import Path
-from typing import Dict, Any, Optional
+from typing import Dict, Any, Optional, List, Tuple
+
+# Use orjson for theme parsing when available
+try:
+    import orjson
+    _json_loads = orjson.loads
+except ImportError:
+    _json_loads = json.loads
+
+# Capitals that start a new word in camelCase theme keys
+_CAMEL_RE = re.compile('([A-Z])')
+
+# Parsed-theme sidecars live per user, not next to the (possibly packaged
+# or read-only) theme files
+_SIDECAR_DIR = Path.home() / ".cache" / "ui_components"
+
+# Stored in every sidecar: the stylesheet generator and the sidecar layout
+# are both defined in this module, so editing it invalidates sidecars
+# written for an unchanged theme file
+_SIDECAR_KEY = hashlib.blake2b(Path(__file__).read_bytes(), digest_size=8).hexdigest()
+
+
+@lru_cache(maxsize=128)
+def _camel_to_kebab(name: str) -> str:
+    """Convert camelCase to kebab-case (theme keys are few, so memoized)"""
+    # Handle backgroundColor -> background-color
+    result = _CAMEL_RE.sub(r'-\1', name).lower()
+    return result.lstrip('-')
 
 
 class Theme:
@@ -32,42 +63,65 @@ class Theme:
     def __init__(self, data: Dict[str, Any]):
         self._data = data
         self._resolved_cache = {}
+        self._dict_cache = {}
+        # Every section and leaf value by dotted path, with string leaves
+        # resolved once; sections map to their (unresolved) dicts
+        self._flat = {}
+        self._flatten(data, "")
+        for path, value in self._flat.items():
+            if isinstance(value, str):
+                self._flat[path] = self._resolve_variables(value)
+        # Compiled stylesheets, filled by ThemeLoader
+        self._qss_cache = {}
+        self._app_qss = None
+        # (sidecar path, file stamp) of the theme file, to persist _app_qss
+        self._sidecar = None
+    
+    def _flatten(self, data: Dict[str, Any], prefix: str):
+        """Record the sections and leaves under data in _flat by their dotted paths"""
+        for key, value in data.items():
+            path = prefix + key
+            self._flat[path] = value
+            if isinstance(value, dict):
+                self._flatten(value, path + ".")
     
     def get(self, path: str, default=None):
         """Get value by dot notation path (e.g., 'colors.primary.main')"""
-        keys = path.split('.')
-        value = self._data
-        
-        for key in keys:
-            if isinstance(value, dict) and key in value:
-                value = value[key]
-            else:
-                return default
-        
-        # Resolve variables if it's a string
-        if isinstance(value, str):
-            return self._resolve_variables(value)
-        
-        return value
+        return self._flat.get(path, default)
     
     def _resolve_variables(self, value: str) -> str:
         """Resolve {variable} references in string"""
+        if '{' not in value:
+            return value  # Plain values (most colors and sizes) need no work
+        
         if value in self._resolved_cache:
             return self._resolved_cache[value]
         
-        # Find all {variable} patterns
-        pattern = r'\{([^}]+)\}'
-        matches = re.findall(pattern, value)
-        
-        result = value
-        for match in matches:
-            var_value = self.get(match)
-            if var_value is not None:
-                result = result.replace(f'{{{match}}}', str(var_value))
+        # Substitute every {dotted.path} in one scan
+        parts = []
+        start = 0
+        while True:
+            open_at = value.find('{', start)
+            close_at = value.find('}', open_at + 1) if open_at >= 0 else -1
+            if close_at < 0:
+                parts.append(value[start:])
+                break
+            parts.append(value[start:open_at])
+            parts.append(self._substitute_variable(value, open_at, close_at))
+            start = close_at + 1
+        result = "".join(parts)
         
         self._resolved_cache[value] = result
         return result
     
+    def _substitute_variable(self, value: str, open_at: int, close_at: int) -> str:
+        """Value for the {reference} between two indices; unknown ones stay as written"""
+        var_value = self.get(value[open_at + 1:close_at])
+        if isinstance(var_value, str):
+            # The referenced leaf may not have been resolved yet during load
+            var_value = self._resolve_variables(var_value)
+        return value[open_at:close_at + 1] if var_value is None else str(var_value)
+    
     def get_component_style(self, component: str, variant: str = "default") -> Dict[str, Any]:
         """Get resolved component style"""
         path = f"components.{component}.{variant}"
@@ -80,7 +134,15 @@ class Theme:
         return self._resolve_dict(style_data)
     
     def _resolve_dict(self, data: Dict[str, Any]) -> Dict[str, Any]:
-        """Recursively resolve all variables in dictionary"""
+        """Recursively resolve all variables in dictionary
+        
+        Theme data does not change after loading, so each section is
+        resolved once and the same (read-only) result is returned after.
+        """
+        cached = self._dict_cache.get(id(data))
+        if cached is not None:
+            return cached[1]
+        
         result = {}
         for key, value in data.items():
             if isinstance(value, str):
@@ -89,6 +151,9 @@ class Theme:
                 result[key] = self._resolve_dict(value)
             else:
                 result[key] = value
+        
+        # The source dict is kept alongside, so its id cannot be reused
+        self._dict_cache[id(data)] = (data, result)
         return result
     
     @property
@@ -121,33 +186,96 @@ class ThemeLoader:
     """Theme loader and manager"""
     
     _themes_dir = Path(__file__).parent / "themes"
+    
+    # Nested style keys rendered as extra rules on the same selector
+    _state_suffixes = {
+        'hover': ':hover',
+        'pressed': ':pressed',
+        'disabled': ':disabled',
+        'focus': ':focus',
+        'error': '[error="true"]',
+    }
+    
+    # Theme keys with no QSS property (Qt warns about unknown properties)
+    _non_qss_keys = frozenset({'shadow', 'itemPadding'})
     _current_theme: Optional[Theme] = None
+    _file_cache: Dict[Tuple[str, int], Theme] = {}
     
     @classmethod
-    def load_theme(cls, theme_name: str) -> Theme:
-        """Load theme by name from themes directory"""
+    def load_theme(cls, theme_name: str, reload: bool = False) -> Theme:
+        """Load theme by name from themes directory
+        
+        Switching back to a theme whose file is unchanged reuses the parsed
+        Theme (see load_theme_from_file). Pass reload=True to re-read the file.
+        """
         theme_file = cls._themes_dir / f"{theme_name}.json"
         
         if not theme_file.exists():
             raise FileNotFoundError(f"Theme '{theme_name}' not found at {theme_file}")
         
-        return cls.load_theme_from_file(theme_file)
+        return cls.load_theme_from_file(theme_file, reload=reload)
     
     @classmethod
-    def load_theme_from_file(cls, filepath: str) -> Theme:
-        """Load theme from JSON file"""
+    def load_theme_from_file(cls, filepath: str, reload: bool = False) -> Theme:
+        """Load theme from JSON file
+        
+        A file already loaded and unchanged since (same mtime) returns the
+        same Theme, with its compiled stylesheets. Pass reload=True to
+        build a fresh one.
+        """
         filepath = Path(filepath)
         
         if not filepath.exists():
             raise FileNotFoundError(f"Theme file not found: {filepath}")
         
-        with open(filepath, 'r', encoding='utf-8') as f:
-            data = json.load(f)
+        key = (str(filepath.resolve()), filepath.stat().st_mtime_ns)
+        theme = None if reload else cls._file_cache.get(key)
+        if theme is None:
+            data, app_qss, sidecar = cls._read_theme_data(filepath)
+            theme = Theme(data)
+            theme._app_qss = app_qss
+            theme._sidecar = sidecar
+            cls._file_cache[key] = theme
         
-        theme = Theme(data)
         cls._current_theme = theme
         return theme
     
+    @classmethod
+    def _read_theme_data(cls, filepath: Path) -> Tuple[Dict[str, Any], Optional[str], tuple]:
+        """Parse a theme file, reusing its marshal sidecar while unchanged
+        
+        Returns:
+            (theme data, app stylesheet compiled by an earlier run or None,
+            (sidecar path, file stamp) for _write_sidecar)
+        """
+        stat = filepath.stat()
+        stamp = (stat.st_mtime_ns, stat.st_size)
+        digest = hashlib.blake2b(str(filepath.resolve()).encode("utf-8"), digest_size=16).hexdigest()
+        sidecar = (_SIDECAR_DIR / f"{digest}.mcache", stamp)
+        
+        try:
+            key, cached_stamp, data, app_qss = marshal.loads(sidecar[0].read_bytes())
+            if key == _SIDECAR_KEY and cached_stamp == stamp:
+                return data, app_qss, sidecar
+        except (OSError, EOFError, ValueError, TypeError):
+            pass  # Missing or stale sidecar, parse the JSON instead
+        
+        data = _json_loads(filepath.read_bytes())
+        cls._write_sidecar(sidecar, data, None)
+        return data, None, sidecar
+    
+    @staticmethod
+    def _write_sidecar(sidecar: tuple, data: Dict[str, Any], app_qss: Optional[str]):
+        """Store parsed data (and the app stylesheet, once built) in the theme's sidecar"""
+        cache_path, stamp = sidecar
+        try:
+            _SIDECAR_DIR.mkdir(parents=True, exist_ok=True)
+            tmp_path = cache_path.with_name(f"{cache_path.name}.{os.getpid()}.tmp")
+            tmp_path.write_bytes(marshal.dumps((_SIDECAR_KEY, stamp, data, app_qss)))
+            os.replace(tmp_path, cache_path)
+        except (OSError, ValueError):
+            pass  # Read-only home, just skip the sidecar
+    
     @classmethod
     def get_current_theme(cls) -> Optional[Theme]:
         """Get currently loaded theme"""
@@ -165,9 +293,44 @@ class ThemeLoader:
         
         return sorted(themes)
     
+    @classmethod
+    def list_theme_metadata(cls) -> List[Tuple[str, str]]:
+        """List (name, description) pairs without parsing whole theme files"""
+        if not cls._themes_dir.exists():
+            return []
+        
+        decoder = json.JSONDecoder()
+        metadata = []
+        for file in sorted(cls._themes_dir.glob("*.json")):
+            # The "theme" header block sits at the top of every theme file
+            with open(file, 'r', encoding='utf-8') as f:
+                head = f.read(1024)
+            try:
+                start = head.index('{', head.index('"theme"'))
+                header, _ = decoder.raw_decode(head, start)
+            except ValueError:
+                header = {}
+            metadata.append((file.stem, header.get("description", "")))
+        
+        return metadata
+    
     @classmethod
     def apply_theme_to_app(cls, app, theme: Theme):
         """Apply theme to QApplication"""
+        if theme._app_qss is None:
+            theme._app_qss = cls._build_app_qss(theme)
+            if theme._sidecar is not None:
+                # Later runs start from the compiled stylesheet
+                cls._write_sidecar(theme._sidecar, theme._data, theme._app_qss)
+        
+        # Setting the same stylesheet again would still repolish every widget
+        if app.styleSheet() != theme._app_qss:
+            app.setStyleSheet(theme._app_qss)
+        cls._current_theme = theme
+    
+    @classmethod
+    def _build_app_qss(cls, theme: Theme) -> str:
+        """Build the application-wide stylesheet for a theme"""
         colors = theme.colors
         typography = theme.typography
         
@@ -204,8 +367,30 @@ class ThemeLoader:
             }}
         """
         
-        app.setStyleSheet(global_style)
-        cls._current_theme = theme
+        # Component rules follow, so they win over the generic ones above
+        return "\n".join((global_style, cls._build_components_qss(theme)))
+    
+    @classmethod
+    def _build_components_qss(cls, theme: Theme) -> str:
+        """Build rules for every component variant and size in a theme"""
+        rules = []
+        for component, variants in theme.get("components", {}).items():
+            for variant in variants:
+                if variant != "sizes":
+                    rules.append(cls.generate_qss(component, variant, theme))
+            
+            # Sizes are matched by their own property so they combine with any variant
+            for size in variants.get("sizes", {}):
+                size_style = theme.get_component_style(component, f"sizes.{size}")
+                selector = f'*[component="{component}"][size="{size}"]'
+                rules.append(cls._dict_to_qss(size_style, selector))
+        
+        return "\n\n".join(rule for rule in rules if rule)
+    
+    @staticmethod
+    def selector(component: str, variant: str = "default") -> str:
+        """QSS selector for widgets tagged with component/variant properties"""
+        return f'*[component="{component}"][variant="{variant}"]'
     
     @classmethod
     def generate_qss(cls, component: str, variant: str, theme: Optional[Theme] = None) -> str:
@@ -216,53 +401,52 @@ class ThemeLoader:
         if theme is None:
             raise ValueError("No theme loaded. Call load_theme() first.")
         
-        style_data = theme.get_component_style(component, variant)
-        
-        if not style_data:
-            return ""
+        # Each theme compiles a given component/variant only once
+        key = (component, variant)
+        qss = theme._qss_cache.get(key)
+        if qss is None:
+            style_data = theme.get_component_style(component, variant)
+            
+            # Convert style data to QSS
+            selector = cls.selector(component, variant)
+            qss = cls._dict_to_qss(style_data, selector) if style_data else ""
+            theme._qss_cache[key] = qss
         
-        # Convert style data to QSS
-        return cls._dict_to_qss(style_data, component)
+        return qss
     
     @classmethod
     def _dict_to_qss(cls, style_dict: Dict[str, Any], widget_class: str = "QPushButton") -> str:
         """Convert style dictionary to QSS string"""
         qss_parts = []
         
-        # Main styles
-        main_styles = []
+        # Each rule is collected as lines (selector, declarations, brace)
+        # and joined once
+        # One pass splits the declarations from the nested state dicts
+        main_styles = [f"{widget_class} {{"]
+        states = {}
         for key, value in style_dict.items():
             if isinstance(value, dict):
-                continue  # Skip nested dicts for now
-            
-            css_key = cls._camel_to_kebab(key)
-            main_styles.append(f"    {css_key}: {value};")
-        
-        if main_styles:
-            qss_parts.append(f"{widget_class} {{\n" + "\n".join(main_styles) + "\n}}")
-        
-        # Pseudo-states (hover, pressed, disabled, focus)
-        pseudo_states = ['hover', 'pressed', 'disabled', 'focus']
-        for state in pseudo_states:
-            if state in style_dict and isinstance(style_dict[state], dict):
-                state_styles = []
-                for key, value in style_dict[state].items():
-                    css_key = cls._camel_to_kebab(key)
-                    state_styles.append(f"    {css_key}: {value};")
-                
-                if state_styles:
-                    qss_parts.append(
-                        f"{widget_class}:{state} {{\n" + "\n".join(state_styles) + "\n}}"
-                    )
+                states[key] = value  # Rendered as state rules below
+            elif key not in cls._non_qss_keys:
+                main_styles.append(f"    {cls._camel_to_kebab(key)}: {value};")
+        
+        if len(main_styles) > 1:
+            main_styles.append("}")
+            qss_parts.append("\n".join(main_styles))
+        
+        # States (hover, pressed, disabled, focus, error)
+        for state, suffix in cls._state_suffixes.items():
+            state_style = states.get(state)
+            if state_style:
+                state_styles = [f"{widget_class}{suffix} {{"]
+                for key, value in state_style.items():
+                    state_styles.append(f"    {cls._camel_to_kebab(key)}: {value};")
+                state_styles.append("}")
+                qss_parts.append("\n".join(state_styles))
         
         return "\n\n".join(qss_parts)
     
-    @staticmethod
-    def _camel_to_kebab(name: str) -> str:
-        """Convert camelCase to kebab-case"""
-        # Handle backgroundColor -> background-color
-        result = re.sub('([A-Z])', r'-\1', name).lower()
-        return result.lstrip('-')
+    _camel_to_kebab = staticmethod(_camel_to_kebab)
 
 
 # Convenience function
@@ -1,17 +1,94 @@
 import requests
 import sys
 import json
+import hashlib
+import os
+import time
+from pathlib import Path
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+# Use orjson for parsing the response and printing the result when available
+try:
+    import orjson
+    _json_loads = orjson.loads
+    
+    def _json_dump_bytes(obj):
+        return orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS | orjson.OPT_INDENT_2)
+except ImportError:
+    _json_loads = json.loads
+    
+    def _json_dump_bytes(obj):
+        return json.dumps(obj, ensure_ascii=False, indent=2).encode("utf-8")
+
+# One pooled session per process, so repeated fetches reuse the TLS connection
+_SESSION = requests.Session()
+_SESSION.headers["Accept-Encoding"] = "gzip"
+_SESSION.mount("https://", HTTPAdapter(
+    pool_connections=8,
+    pool_maxsize=8,
+    max_retries=Retry(total=3, backoff_factor=0.3, status_forcelist=[429, 500, 502, 503, 504]),
+))
+
+# (connect, read) timeouts in seconds
+_TIMEOUT = (3, 30)
+
+# Responses are read in chunks and rejected past this size
+_CHUNK_SIZE = 64 * 1024
+_MAX_RESPONSE_BYTES = 64 * 1024 * 1024
+
+# Fetched docs are cached per skill for FETCH_DOC_CACHE_TTL seconds (0 disables)
+_CACHE_DIR = Path.home() / ".cache" / Path(__file__).resolve().parents[1].name
+_CACHE_TTL = int(os.environ.get("FETCH_DOC_CACHE_TTL", "3600"))
+
+def _cache_path(doc_url):
+    digest = hashlib.blake2b(doc_url.encode("utf-8"), digest_size=16).hexdigest()
+    return _CACHE_DIR / f"{digest}.json"
+
+def _read_cache(doc_url):
+    """Return the cached content for doc_url, or None if missing or expired"""
+    if _CACHE_TTL <= 0:
+        return None
+    path = _cache_path(doc_url)
+    try:
+        if time.time() - path.stat().st_mtime < _CACHE_TTL:
+            return _json_loads(path.read_bytes())
+    except (OSError, ValueError):
+        pass  # Missing or corrupt entry, fetch it again
+    return None
+
+def _write_cache(doc_url, content):
+    if _CACHE_TTL <= 0:
+        return
+    path = _cache_path(doc_url)
+    tmp_path = path.with_suffix(f".{os.getpid()}.tmp")
+    try:
+        _CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        tmp_path.write_bytes(_json_dump_bytes(content))
+        os.replace(tmp_path, path)
+    except (OSError, TypeError):
+        pass  # Caching is best effort
 
 def get_doc_content(doc_url):
+    cached = _read_cache(doc_url)
+    if cached is not None:
+        return cached
+    
     api_url = "https://test-standardization-backend.byted.org/common/doc/markdown"
     params = {"doc": doc_url}
     try:
-        response = requests.get(api_url, params=params)
-        response.raise_for_status()
-        data = response.json()
+        with _SESSION.get(api_url, params=params, timeout=_TIMEOUT, stream=True) as response:
+            response.raise_for_status()
+            body = bytearray()
+            for chunk in response.iter_content(_CHUNK_SIZE):
+                body += chunk
+                if len(body) > _MAX_RESPONSE_BYTES:
+                    raise ValueError(f"response larger than {_MAX_RESPONSE_BYTES} bytes")
+        data = _json_loads(body)
         if data.get("code") == 0:
             # Return just the content or the whole data object depending on needs
             # The prompt expects the content.
+            _write_cache(doc_url, data["data"])
             return data["data"] 
         else:
             print(f"Error: {data.get('message')}", file=sys.stderr)
@@ -32,6 +109,6 @@ if __name__ == "__main__":
         # The tool output will be read by the agent. 
         # Let's output the content field primarily, or the JSON.
         # The API returns {"title":..., "content":...} in 'data'.
-        print(json.dumps(result, ensure_ascii=False, indent=2))
+        sys.stdout.buffer.write(_json_dump_bytes(result) + b"\n")
     else:
         sys.exit(1)
\ No newline at end of file